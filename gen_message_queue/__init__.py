@@ -21,13 +21,12 @@ Info
 '''
 
 import sys
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Tuple, Optional, Sequence
 from os.path import exists, dirname, realpath
-from os import getcwd
+from os import getcwd, environ
 from argparse import Namespace
 
 try:
-    from ats_utilities.splash import Splash
     from ats_utilities.logging import ATSLogger
     from ats_utilities.cli import ATSCli
     from ats_utilities.console_io.error import error_message
@@ -36,6 +35,8 @@ try:
     from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.exceptions.ats_value_error import ATSValueError
     from gen_message_queue.pro import MessageQueue
+    from gen_message_queue.cli_options import CLI_OPTIONS, QUIET_ENV
+    from gen_message_queue.cli_targets import CliTargets
 except ImportError as ats_error_message:  # pragma: no cover
     # Force exit python #######################################################
     sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
@@ -50,7 +51,7 @@ __email__: str = 'elektron.ronca@gmail.com'
 __status__: str = 'Updated'
 
 
-class GenMessageQueue(ATSCli):
+class GenMessageQueue(ATSCli, CliTargets):
     '''
         Defines class GenMessageQueue with attribute(s) and method(s).
         Loads a base info, creates a CLI interface and runs operations.
@@ -62,10 +63,13 @@ class GenMessageQueue(ATSCli):
                 | _CONFIG - Tool info file path.
                 | _LOG - Tool log file path.
                 | _LOGO - Logo for splash screen.
+                | _QUIET - Environment variable for fast-start (quiet) mode.
                 | _OPS - List of tool options.
-                | _logger - Logger object API.
+                | _quiet - Fast-start mode (no splash, no progress output).
+                | _logger - Logger object API (created on first use).
             :methods:
                 | __init__ - Initials GenMessageQueue constructor.
+                | is_quiet - Checks is fast-start (quiet) mode requested.
                 | process - Processes and runs operations.
     '''
 
@@ -73,47 +77,58 @@ class GenMessageQueue(ATSCli):
     _CONFIG: str = '/conf/gen_message_queue.cfg'
     _LOG: str = '/log/gen_message_queue.log'
     _LOGO: str = '/conf/gen_message_queue.logo'
-    _OPS: List[str] = ['-n', '--name', '-t', '--type', '-v', '--verbose']
+    _QUIET: str = QUIET_ENV
+    _OPS: List[Tuple[List[str], Dict[str, Any]]] = CLI_OPTIONS
 
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(self, verbose: bool = False, quiet: bool = False) -> None:
         '''
             Initials GenMessageQueue constructor.
 
             :param verbose: Enable/Disable verbose option
             :type verbose: <bool>
+            :param quiet: Enable/Disable fast-start (also -q | env variable)
+            :type quiet: <bool>
             :exceptions: None
         '''
         current_dir: str = dirname(realpath(__file__))
-        gen_autoconf_property: Dict[str, str | bool] = {
-            'ats_organization': 'vroncevic',
-            'ats_repository': f'{self._GEN_VERBOSE.lower()}',
-            'ats_name': f'{self._GEN_VERBOSE.lower()}',
-            'ats_logo_path': f'{current_dir}{self._LOGO}',
-            'ats_use_github_infrastructure': True
-        }
-        Splash(gen_autoconf_property, verbose)
+        self._quiet: bool = quiet or self.is_quiet(sys.argv)
+        if not self._quiet:
+            # Splash (and its terminal support) is loaded only when shown
+            from ats_utilities.splash import Splash
+            Splash({
+                'ats_organization': 'vroncevic',
+                'ats_repository': f'{self._GEN_VERBOSE.lower()}',
+                'ats_name': f'{self._GEN_VERBOSE.lower()}',
+                'ats_logo_path': f'{current_dir}{self._LOGO}',
+                'ats_use_github_infrastructure': True
+            }, verbose)
         base_info: str = f'{current_dir}{self._CONFIG}'
         super().__init__(base_info, verbose)
         verbose_message(
             verbose, [f'{self._GEN_VERBOSE.lower()} init tool info']
         )
-        self._logger: ATSLogger = ATSLogger(
-            self._GEN_VERBOSE.lower(), True, None, True, verbose
-        )
+        self._logger: Optional[ATSLogger] = None
         if self.is_operational():
-            self.add_new_option(
-                self._OPS[0], self._OPS[1], dest='name',
-                help='generate MSG QUEUE (provide project name)'
-            )
-            self.add_new_option(
-                self._OPS[2], self._OPS[3], dest='type',
-                help='type (posix | sysv)'
-            )
-            self.add_new_option(
-                self._OPS[4], self._OPS[5],
-                action='store_true', default=False,
-                help='activate verbose mode for generation'
-            )
+            for flags, kwargs in self._OPS:
+                self.add_new_option(*flags, **kwargs)
+
+    @classmethod
+    def is_quiet(cls, argv: Sequence[str]) -> bool:
+        '''
+            Checks is fast-start (quiet) mode requested.
+
+            :param argv: Command line arguments
+            :type argv: <Sequence[str]>
+            :return: True (quiet, archive, monitor, environment) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if environ.get(cls._QUIET, '0') not in ('', '0'):
+            return True
+        # Archive and monitor write to stdout, nothing else may be printed
+        return any(arg in (
+            '-q', '--quiet', '-a', '--archive', '-m', '--monitor'
+        ) for arg in argv)
 
     def process(self, verbose: bool = False) -> bool:
         '''
@@ -129,6 +144,12 @@ class GenMessageQueue(ATSCli):
         if self.is_operational():
             try:
                 args: Optional[Namespace] = self.parse_args(sys.argv)
+                verbose = getattr(args, 'verbose') or verbose
+                self._quiet = self._quiet or getattr(args, 'quiet')
+                if bool(getattr(args, 'batch')):
+                    return self.process_batch(args, verbose)
+                if bool(getattr(args, 'monitor')):
+                    return self.process_monitor(args)
                 if not bool(getattr(args, 'name')):
                     error_message(
                         [f'{self._GEN_VERBOSE.lower()} missing name argument']
@@ -139,41 +160,49 @@ class GenMessageQueue(ATSCli):
                         [f'{self._GEN_VERBOSE.lower()} missing type argument']
                     )
                     return status
-                if exists(f'{getcwd()}/{str(getattr(args, "name"))}'):
+                if bool(getattr(args, 'archive')):
+                    return self.process_archive(args, verbose)
+                if exists(f'{getcwd()}/{getattr(args, "name")}') and not (
+                    getattr(args, 'incremental')
+                ):
                     error_message([
                         f'{self._GEN_VERBOSE.lower()}',
                         f'project with name [{getattr(args, "name")}] exists'
                     ])
                     return status
-                gen: MessageQueue = MessageQueue(
-                    getattr(args, 'verbose') or verbose
-                )
+                gen: MessageQueue = MessageQueue(verbose)
                 try:
-                    print(
-                        " ".join([
+                    if not self._quiet:
+                        print(" ".join([
                             f'[{self._GEN_VERBOSE.lower()}]',
                             'generate MSG QUEUE skeleton',
                             str(getattr(args, 'name'))
-                        ])
-                    )
+                        ]))
                     status = gen.gen_setup(
                         f'{getattr(args, "name")}',
-                        f'{getattr(args, "type")}',
-                        getattr(args, 'verbose') or verbose
+                        self.pro_type(args),
+                        verbose, workers=getattr(args, 'workers'),
+                        incremental=getattr(args, 'incremental'),
+                        params=self.gen_params(args),
+                        schema=self.gen_schema(args, verbose)
                     )
-                except (ATSTypeError, ATSValueError) as e:
+                except (ATSTypeError, ATSValueError, OSError) as e:
                     error_message([f'{self._GEN_VERBOSE.lower()} {str(e)}'])
-                    self._logger.write_log(f'{str(e)}', self._logger.ATS_ERROR)
+                    self.logger.write_log(f'{str(e)}', self.logger.ATS_ERROR)
+                self.emit_timing(gen, args)
                 if status:
-                    success_message([f'{self._GEN_VERBOSE.lower()} done\n'])
-                    self._logger.write_log(
+                    if not self._quiet:
+                        success_message(
+                            [f'{self._GEN_VERBOSE.lower()} done\n']
+                        )
+                    self.logger.write_log(
                         f'generation {getattr(args, "name")} done',
-                        self._logger.ATS_INFO
+                        self.logger.ATS_INFO
                     )
                 else:
                     error_message([f'{self._GEN_VERBOSE.lower()} failed'])
-                    self._logger.write_log(
-                        'generation failed', self._logger.ATS_ERROR
+                    self.logger.write_log(
+                        'generation failed', self.logger.ATS_ERROR
                     )
             except SystemExit:
                 error_message(
@@ -187,7 +216,7 @@ class GenMessageQueue(ATSCli):
             error_message(
                 [f'{self._GEN_VERBOSE.lower()} tool is not operational']
             )
-            self._logger.write_log(
-                'tool is not operational', self._logger.ATS_ERROR
+            self.logger.write_log(
+                'tool is not operational', self.logger.ATS_ERROR
             )
         return status
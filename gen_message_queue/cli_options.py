@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    cli_options.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines options of gen_message_queue command line interface.
+'''
+
+from typing import Any, List, Dict, Tuple
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+QUIET_ENV: str = 'GEN_MESSAGE_QUEUE_QUIET'
+CLI_OPTIONS: List[Tuple[List[str], Dict[str, Any]]] = [
+    (['-n', '--name'], {
+        'dest': 'name', 'help': 'generate MSG QUEUE (provide project name)'
+    }),
+    (['-t', '--type'], {'dest': 'type', 'help': 'type (posix | sysv | shm)'}),
+    (['-o', '--options'], {
+        'dest': 'options',
+        'help': 'optional components, comma separated '
+                '(benchmark | event_loop | metrics | python | queue_group | '
+                'registry | sizing | worker_pool)'
+    }),
+    (['-p', '--param'], {
+        'dest': 'params', 'action': 'append', 'metavar': 'KEY=VALUE',
+        'help': 'generation parameter, repeatable '
+                '(METRICS_QUEUES=64 | POSIX_MAX_MESSAGES=10 | '
+                'POSIX_MESSAGE_SIZE=8192 | POSIX_REGISTRY_HANDLES=64 | '
+                'QUEUE_GROUP_SHARDS=4 | SYSV_MESSAGE_SIZE=8192 | '
+                'SYSV_QUEUE_BYTES=16384)'
+    }),
+    (['-s', '--schema'], {
+        'dest': 'schema',
+        'help': 'generate typed message codecs (provide message schema)'
+    }),
+    (['--host-limits'], {
+        'dest': 'host_limits', 'action': 'store_true', 'default': False,
+        'help': 'size queues from limits of this host (/proc), '
+                'parameters override'
+    }),
+    (['-v', '--verbose'], {
+        'action': 'store_true', 'default': False,
+        'help': 'activate verbose mode for generation'
+    }),
+    (['-b', '--batch'], {
+        'dest': 'batch',
+        'help': 'generate MSG QUEUE projects (provide manifest file)'
+    }),
+    (['-w', '--workers'], {
+        'dest': 'workers', 'type': int, 'default': 1,
+        'help': 'number of threads writing modules (default 1)'
+    }),
+    (['-i', '--incremental'], {
+        'action': 'store_true', 'default': False,
+        'help': 'rewrite only changed modules of existing project'
+    }),
+    (['-a', '--archive'], {
+        'dest': 'archive', 'choices': ['tar', 'tgz', 'zip'],
+        'help': 'write project archive to stdout (tar | tgz | zip)'
+    }),
+    (['--timing'], {
+        'dest': 'timing',
+        'help': 'write phase and module timing as JSON (provide file or -, '
+                'stderr with archive)'
+    }),
+    (['-m', '--monitor'], {
+        'dest': 'monitor', 'choices': ['table', 'json'],
+        'help': 'sample live queues of this host (table | json)'
+    }),
+    (['--interval'], {
+        'dest': 'interval', 'type': float, 'default': 1.0,
+        'help': 'seconds between monitor samples (default 1.0)'
+    }),
+    (['--samples'], {
+        'dest': 'samples', 'type': int, 'default': 0,
+        'help': 'number of monitor samples (default 0, until interrupted)'
+    }),
+    (['--metrics'], {
+        'dest': 'metrics',
+        'help': 'metrics segment for monitor send and receive rates '
+                '(/name.metrics)'
+    }),
+    (['-q', '--quiet'], {
+        'action': 'store_true', 'default': False,
+        'help': f'fast-start without splash and progress (or {QUIET_ENV}=1)'
+    })
+]
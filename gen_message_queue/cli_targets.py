@@ -0,0 +1,298 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    cli_targets.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class CliTargets with attribute(s) and method(s).
+    Runs generation targets other than single project on disk.
+'''
+
+import sys
+from typing import TYPE_CHECKING, Any, List, Dict, TextIO, Optional
+from argparse import Namespace
+
+try:
+    from ats_utilities.logging import ATSLogger
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro import MessageQueue
+    from gen_message_queue.pro.pro_structure import ProStructure
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+if TYPE_CHECKING:
+    from gen_message_queue.pro.message_schema import MessageSchema
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class CliTargets:
+    '''
+        Defines class CliTargets with attribute(s) and method(s).
+        Runs generation targets other than single project on disk.
+        Mixed into GenMessageQueue (provides verbose and quiet state).
+
+        It defines:
+
+            :attributes:
+                | _GEN_VERBOSE - Console text indicator for process-phase.
+                | _verbose - Enable/Disable verbose option.
+                | _quiet - Fast-start mode (no splash, no progress output).
+                | _logger - Logger object API (created on first use).
+            :methods:
+                | logger - Property method for getting logger.
+                | pro_type - Gets project type with selected options.
+                | gen_params - Gets generation parameters (host limits).
+                | gen_schema - Gets message schema (typed codecs).
+                | emit_timing - Writes timing report (if requested).
+                | process_batch - Processes batch generation from manifest.
+                | process_archive - Processes generation to archive (stdout).
+                | process_monitor - Processes monitor of live queues (stdout).
+    '''
+
+    _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE'
+    _verbose: bool
+    _quiet: bool
+    _logger: Optional[ATSLogger]
+
+    @property
+    def logger(self) -> ATSLogger:
+        '''
+            Property method for getting logger (created on first use),
+            quiet mode disables logging (no INFO lines on console).
+
+            :return: Logger object API
+            :rtype: <ATSLogger>
+            :exceptions: None
+        '''
+        if self._logger is None:
+            self._logger = ATSLogger(
+                self._GEN_VERBOSE.lower(), True, None, not self._quiet,
+                self._verbose
+            )
+        return self._logger
+
+    @staticmethod
+    def pro_type(args: Optional[Namespace]) -> str:
+        '''
+            Gets project type with selected options (posix+event_loop).
+
+            :param args: Parsed options (type, options)
+            :type args: <Optional[Namespace]>
+            :return: Project type with options
+            :rtype: <str>
+            :exceptions: None
+        '''
+        options: List[str] = [
+            option.strip() for option in
+            str(getattr(args, 'options', None) or '').split(',')
+            if option.strip()
+        ]
+        return ProStructure.OPTION.join(
+            [str(getattr(args, 'type'))] + options
+        )
+
+    @staticmethod
+    def gen_params(args: Optional[Namespace]) -> Dict[str, str]:
+        '''
+            Gets generation parameters, host limits (if selected) are
+            overridden by explicit parameters.
+
+            :param args: Parsed options (params, host_limits)
+            :type args: <Optional[Namespace]>
+            :return: Checked parameters
+            :rtype: <Dict[str, str]>
+            :exceptions: ATSValueError
+        '''
+        from gen_message_queue.pro.gen_params import GenParams
+        params: Dict[str, str] = GenParams.parse(
+            getattr(args, 'params', None)
+        )
+        if bool(getattr(args, 'host_limits', False)):
+            from gen_message_queue.pro.host_limits import HostLimits
+            params = HostLimits.merge(params)
+        return params
+
+    @staticmethod
+    def gen_schema(
+        args: Optional[Namespace], verbose: bool = False
+    ) -> Optional['MessageSchema']:
+        '''
+            Gets message schema (typed codecs) if schema file is given.
+
+            :param args: Parsed options (schema)
+            :type args: <Optional[Namespace]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: Loaded message schema | None
+            :rtype: <Optional[MessageSchema]>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        if not bool(getattr(args, 'schema', None)):
+            return None
+        from gen_message_queue.pro.message_schema import MessageSchema
+        return MessageSchema(verbose).load(
+            str(getattr(args, 'schema')), verbose
+        )
+
+    def emit_timing(
+        self,
+        gen: MessageQueue,
+        args: Optional[Namespace],
+        stream: Optional[TextIO] = None
+    ) -> bool:
+        '''
+            Writes timing report if requested, write error is reported
+            (generation status is not changed by it).
+
+            :param gen: Generator with timing records
+            :type gen: <MessageQueue>
+            :param args: Parsed options (timing)
+            :type args: <Optional[Namespace]>
+            :param stream: Output for - and errors | None (stdout)
+            :type stream: <Optional[TextIO]>
+            :return: True (written or not requested) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if not bool(getattr(args, 'timing', None)):
+            return True
+        try:
+            gen.get_timing().emit(str(getattr(args, 'timing')), stream)
+        except OSError as e:
+            if stream is None:
+                error_message([f'{self._GEN_VERBOSE.lower()} {str(e)}'])
+            else:
+                print(f'[{self._GEN_VERBOSE.lower()}] {str(e)}', file=stream)
+            self.logger.write_log(f'{str(e)}', self.logger.ATS_ERROR)
+            return False
+        return True
+
+    def process_batch(
+        self, args: Optional[Namespace], verbose: bool = False
+    ) -> bool:
+        '''
+            Processes batch generation from manifest.
+
+            :param args: Parsed options (batch, workers, params, schema)
+            :type args: <Optional[Namespace]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: True (all projects generated) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        # Manifest support is loaded only for batch generation
+        from gen_message_queue.pro.batch_manifest import BatchManifest
+        batch: BatchManifest = BatchManifest(verbose)
+        try:
+            entries: List[Dict[str, str]] = batch.load(
+                str(getattr(args, 'batch')), verbose
+            )
+            params: Dict[str, str] = self.gen_params(args)
+            schema: Optional['MessageSchema'] = self.gen_schema(
+                args, verbose
+            )
+        except (ATSTypeError, ATSValueError) as e:
+            error_message([f'{self._GEN_VERBOSE.lower()} {str(e)}'])
+            self.logger.write_log(f'{str(e)}', self.logger.ATS_ERROR)
+            return False
+        gen: MessageQueue = MessageQueue(verbose)
+        report: Dict[str, Any] = gen.gen_batch(
+            entries, verbose, getattr(args, 'workers'),
+            getattr(args, 'incremental'), params, schema
+        )
+        batch.show(report, self._quiet)
+        self.emit_timing(gen, args)
+        self.logger.write_log(
+            f'batch {getattr(args, "batch")} status {report["status"]}',
+            self.logger.ATS_INFO if report['status']
+            else self.logger.ATS_ERROR
+        )
+        return bool(report['status'])
+
+    def process_archive(
+        self, args: Optional[Namespace], verbose: bool = False
+    ) -> bool:
+        '''
+            Processes generation to archive written to stdout.
+
+            :param args: Parsed options (name, type, archive, schema)
+            :type args: <Optional[Namespace]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: True (archive written) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        gen: MessageQueue = MessageQueue(verbose)
+        try:
+            gen.gen_archive(
+                str(getattr(args, 'name')), self.pro_type(args),
+                sys.stdout.buffer, str(getattr(args, 'archive')), verbose,
+                self.gen_params(args), self.gen_schema(args, verbose)
+            )
+            sys.stdout.buffer.flush()
+        except (ATSTypeError, ATSValueError, OSError) as e:
+            # Stdout carries archive, report goes to stderr
+            print(f'[{self._GEN_VERBOSE.lower()}] {str(e)}', file=sys.stderr)
+            self.logger.write_log(f'{str(e)}', self.logger.ATS_ERROR)
+            return False
+        # Stdout carries archive, timing report (-) goes to stderr
+        self.emit_timing(gen, args, sys.stderr)
+        self.logger.write_log(
+            f'archive {getattr(args, "name")} done', self.logger.ATS_INFO
+        )
+        return True
+
+    def process_monitor(self, args: Optional[Namespace]) -> bool:
+        '''
+            Processes monitor of live queues written to stdout.
+
+            :param args: Parsed options (monitor, interval, samples, metrics)
+            :type args: <Optional[Namespace]>
+            :return: True (monitor stopped) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        # Monitor is loaded only when requested (ctypes, libc lookup)
+        from gen_message_queue.queue_monitor import QueueMonitor
+        interval: float = float(getattr(args, 'interval'))
+        if interval <= 0:
+            error_message([
+                f'{self._GEN_VERBOSE.lower()} expected positive interval'
+            ])
+            return False
+        monitor: QueueMonitor = QueueMonitor(
+            metrics=getattr(args, 'metrics', None)
+        )
+        try:
+            monitor.run(
+                interval, int(getattr(args, 'samples')),
+                str(getattr(args, 'monitor'))
+            )
+        except KeyboardInterrupt:
+            pass
+        return True
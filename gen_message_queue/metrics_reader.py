@@ -0,0 +1,166 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    metrics_reader.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MetricsReader with attribute(s) and method(s).
+    Reads queue counters from metrics segment of generated library.
+'''
+
+import sys
+from typing import Any, List, Dict, Optional, Tuple
+from os.path import basename, join
+from struct import Struct
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MetricsReader:
+    '''
+        Defines class MetricsReader with attribute(s) and method(s).
+        Reads queue counters from metrics segment of generated library.
+
+        Segment (-o metrics, mq_posix_metrics.h | mq_sysv_metrics.h) is
+        read as file of shared memory file system, process which writes
+        counters is not attached or stopped. Counters are updated with
+        relaxed atomics, every value is consistent, values of one queue
+        may be from slightly different moments.
+
+        It defines:
+
+            :attributes:
+                | SHM_DIR - Mount point of shared memory file system.
+                | MAGIC - Segment magic (segment is ready).
+                | VERSION - Supported segment layout version.
+                | HEADER - Segment header layout.
+                | SLOT - Queue slot layout (name and counters).
+                | COUNTERS - Counter names in slot order.
+                | path - Path of segment file.
+            :methods:
+                | __init__ - Initials MetricsReader constructor.
+                | read - Reads backend and counters by queue name.
+                | rates - Gets counter rates per second between samples.
+    '''
+
+    SHM_DIR: str = '/dev/shm'
+    MAGIC: int = 0x6d715f6d65747269
+    VERSION: int = 1
+    HEADER: Struct = Struct('<QIIII8s32x')
+    SLOT: Struct = Struct('<64s8Q')
+    COUNTERS: Tuple[str, ...] = (
+        'send_messages', 'send_bytes', 'receive_messages', 'receive_bytes',
+        'eagain', 'eintr', 'errors', 'wait_ns'
+    )
+
+    def __init__(self, segment: str, shm_dir: Optional[str] = None) -> None:
+        '''
+            Initials MetricsReader constructor.
+
+            :param segment: Segment name (/pro.metrics) or path
+            :type segment: <str>
+            :param shm_dir: Shared memory mount point | None (/dev/shm)
+            :type shm_dir: <Optional[str]>
+            :exceptions: None
+        '''
+        self.path: str = segment if '/' in segment.lstrip('/') else join(
+            shm_dir or self.SHM_DIR, basename(segment)
+        )
+
+    def read(self) -> Dict[str, Any]:
+        '''
+            Reads backend and counters by queue name (slots registered
+            with same name by several processes are summed).
+
+            :return: Backend and counters by queue name
+            :rtype: <Dict[str, Any]>
+            :exceptions: ATSValueError | OSError
+        '''
+        with open(self.path, 'rb') as segment:
+            data: bytes = segment.read()
+        if len(data) < self.HEADER.size:
+            raise ATSValueError(f'metrics segment too short {self.path}')
+        magic, version, capacity, slot_size, used, backend = (
+            self.HEADER.unpack_from(data)
+        )
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ATSValueError(f'not metrics segment {self.path}')
+        if slot_size < self.SLOT.size or len(data) < (
+            self.HEADER.size + capacity * slot_size
+        ):
+            raise ATSValueError(f'metrics segment layout {self.path}')
+        queues: Dict[str, Dict[str, int]] = {}
+        for index in range(min(used, capacity)):
+            name, *counters = self.SLOT.unpack_from(
+                data, self.HEADER.size + index * slot_size
+            )
+            queue: str = name.split(b'\0', 1)[0].decode(errors='replace')
+            if not queue:
+                continue
+            totals: Dict[str, int] = queues.setdefault(
+                queue, dict.fromkeys(self.COUNTERS, 0)
+            )
+            for counter, value in zip(self.COUNTERS, counters):
+                totals[counter] += value
+        return {
+            'backend': backend.split(b'\0', 1)[0].decode(errors='replace'),
+            'queues': queues
+        }
+
+    @classmethod
+    def rates(
+        cls,
+        previous: Dict[str, Any],
+        current: Dict[str, Any],
+        seconds: float
+    ) -> Dict[str, Dict[str, float]]:
+        '''
+            Gets counter rates per second between samples (wait_ns rate
+            is fraction of time spent in send and receive calls).
+
+            :param previous: Earlier sample (read)
+            :type previous: <Dict[str, Any]>
+            :param current: Later sample (read)
+            :type current: <Dict[str, Any]>
+            :param seconds: Time between samples
+            :type seconds: <float>
+            :return: Rates by queue name and counter
+            :rtype: <Dict[str, Dict[str, float]]>
+            :exceptions: ATSValueError
+        '''
+        if seconds <= 0:
+            raise ATSValueError('expected positive time between samples')
+        rates: Dict[str, Dict[str, float]] = {}
+        for queue, counters in current['queues'].items():
+            before: Dict[str, int] = previous['queues'].get(queue, {})
+            rates[queue] = {
+                counter: (value - before.get(counter, 0)) / seconds
+                for counter, value in counters.items()
+            }
+            rates[queue]['wait_ns'] /= 1e9
+        return rates
@@ -21,7 +21,10 @@ Info
 '''
 
 import sys
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Any, List, Dict, Tuple, Iterator
+from typing import BinaryIO, Optional
+from itertools import chain
+from string import Template
 from os.path import dirname, realpath
 
 try:
@@ -29,15 +32,19 @@ try:
     from ats_utilities.pro_config.pro_name import ProName
     from ats_utilities.config_io.file_check import FileCheck
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
     from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.exceptions.ats_value_error import ATSValueError
     from gen_message_queue.pro.read_template import ReadTemplate
     from gen_message_queue.pro.write_template import WriteTemplate
+    from gen_message_queue.pro.pro_structure import ProStructure
 except ImportError as ats_error_message:  # pragma: no cover
     # Force exit python #######################################################
     sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
 
+if TYPE_CHECKING:
+    from gen_message_queue.pro.gen_timing import GenTiming
+    from gen_message_queue.pro.message_schema import MessageSchema
+
 __author__: str = 'Vladimir Roncevic'
 __copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
 __credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
@@ -60,11 +67,15 @@ class MessageQueue(FileCheck, ProConfig, ProName):
                 | _PRO_STRUCTURE - Project setup (templates, modules).
                 | _reader - Reader API.
                 | _writer - Writer API.
+                | _timing - Per-phase and per-module durations and bytes.
             :methods:
                 | __init__ - Initials MessageQueue constructor.
                 | get_reader - Gets template reader.
                 | get_writer - Gets template writer.
-                | gen_module - Generates MSG QUEUE.
+                | get_timing - Gets timing records.
+                | gen_setup - Generates MSG QUEUE.
+                | gen_batch - Generates MSG QUEUE for list of projects.
+                | gen_archive - Generates MSG QUEUE in memory.
     '''
 
     _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE::PRO::MESSAGE_QUEUE'
@@ -78,6 +89,7 @@ class MessageQueue(FileCheck, ProConfig, ProName):
             :type verbose: <bool>
             :exceptions: None
         '''
+        from gen_message_queue.pro.gen_timing import GenTiming
         FileCheck.__init__(self, verbose)
         ProConfig.__init__(self, verbose)
         ProName.__init__(self, verbose)
@@ -86,14 +98,17 @@ class MessageQueue(FileCheck, ProConfig, ProName):
         )
         self._reader: Optional[ReadTemplate] = ReadTemplate(verbose)
         self._writer: Optional[WriteTemplate] = WriteTemplate(verbose)
+        self._timing: 'GenTiming' = GenTiming()
         current_dir: str = dirname(realpath(__file__))
         pro_structure: str = f'{current_dir}{self._PRO_STRUCTURE}'
         self.check_path(pro_structure, verbose)
         self.check_mode('r', verbose)
         self.check_format(pro_structure, 'yaml', verbose)
         if self.is_file_ok():
-            yml2obj: Optional[Yaml2Object] = Yaml2Object(pro_structure)
-            self.config = yml2obj.read_configuration()
+            with self._timing.phase('config'):
+                self.config = ProStructure(verbose).load(
+                    pro_structure, verbose
+                )
 
     def get_reader(self) -> Optional[ReadTemplate]:
         '''
@@ -115,11 +130,26 @@ class MessageQueue(FileCheck, ProConfig, ProName):
         '''
         return self._writer
 
+    def get_timing(self) -> 'GenTiming':
+        '''
+            Gets timing records (accumulated over generations).
+
+            :return: Timing records object
+            :rtype: <GenTiming>
+            :exceptions: None
+        '''
+        return self._timing
+
     def gen_setup(
         self,
         pro_name: Optional[str],
         pro_type: Optional[str],
-        verbose: bool = False
+        verbose: bool = False,
+        output_dir: Optional[str] = None,
+        workers: int = 1,
+        incremental: bool = False,
+        params: Optional[Dict[str, str]] = None,
+        schema: Optional['MessageSchema'] = None
     ) -> bool:
         '''
             Generates MSG QUEUE.
@@ -130,6 +160,16 @@ class MessageQueue(FileCheck, ProConfig, ProName):
             :type pro_type: <Optional[str]>
             :param verbose: Enable/Disable verbose option
             :type verbose: <bool>
+            :param output_dir: Parent directory for project | None (cwd)
+            :type output_dir: <Optional[str]>
+            :param workers: Number of writer threads
+            :type workers: <int>
+            :param incremental: Rewrite only changed modules of project
+            :type incremental: <bool>
+            :param params: Generation parameters | None (defaults)
+            :type params: <Optional[Dict[str, str]]>
+            :param schema: Message schema (typed codecs) | None
+            :type schema: <Optional[MessageSchema]>
             :return: True (success operation) | False
             :rtype: <bool>
             :exceptions: ATSTypeError | ATSValueError
@@ -152,12 +192,109 @@ class MessageQueue(FileCheck, ProConfig, ProName):
                 'generate', pro_type, 'form', pro_name
             ]
         )
-        if bool(self._reader) and bool(self.config):
-            template_content: Dict[str, str] = self._reader.read(
-                self.config, pro_name, pro_type, verbose
+        pro_index: Dict[Any, Any] = self.config or {}
+        if bool(self._reader) and (
+            ProStructure.base_type(str(pro_type)) in pro_index
+        ):
+            # Modules are read, substituted and written one by one
+            modules: Iterator[Tuple[str, Template]] = self._reader.iter_read(
+                pro_index, pro_name, pro_type, verbose, self._timing
             )
-            if bool(template_content) and bool(self._writer):
-                status = self._writer.write(
-                    template_content, pro_name, verbose
+            if schema is not None:
+                modules = chain(modules, schema.modules(pro_type))
+            if incremental:
+                from gen_message_queue.pro.incremental_write import (
+                    IncrementalWrite
+                )
+                status = IncrementalWrite(verbose).write(
+                    modules, pro_name, verbose, output_dir, self._timing,
+                    params
+                )
+            elif bool(self._writer):
+                status = self._writer.write_stream(
+                    modules, pro_name, verbose, output_dir, workers,
+                    timing=self._timing, params=params
                 )
         return status
+
+    def gen_batch(
+        self,
+        entries: List[Dict[str, str]],
+        verbose: bool = False,
+        workers: int = 1,
+        incremental: bool = False,
+        params: Optional[Dict[str, str]] = None,
+        schema: Optional['MessageSchema'] = None
+    ) -> Dict[str, Any]:
+        '''
+            Generates MSG QUEUE for list of projects (GenBatch).
+
+            :param entries: Projects with keys name, type and output
+            :type entries: <List[Dict[str, str]]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param workers: Number of writer threads
+            :type workers: <int>
+            :param incremental: Rewrite only changed modules of projects
+            :type incremental: <bool>
+            :param params: Generation parameters for all projects | None
+            :type params: <Optional[Dict[str, str]]>
+            :param schema: Message schema for all projects | None
+            :type schema: <Optional[MessageSchema]>
+            :return: Report with per project status and total wall time
+            :rtype: <Dict[str, Any]>
+            :exceptions: ATSTypeError
+        '''
+        from gen_message_queue.pro.gen_batch import GenBatch
+        return GenBatch(self.gen_setup).gen_batch(
+            entries, verbose, workers, incremental, params, schema
+        )
+
+    def gen_archive(
+        self,
+        pro_name: Optional[str],
+        pro_type: Optional[str],
+        stream: Optional[BinaryIO] = None,
+        archive_format: str = 'tar',
+        verbose: bool = False,
+        params: Optional[Dict[str, str]] = None,
+        schema: Optional['MessageSchema'] = None
+    ) -> Dict[str, bytes]:
+        '''
+            Generates MSG QUEUE in memory (no file is written).
+
+            :param pro_name: Project name | None
+            :type pro_name: <Optional[str]>
+            :param pro_type: Project type | None
+            :type pro_type: <Optional[str]>
+            :param stream: Output for archive | None (rendered modules)
+            :type stream: <Optional[BinaryIO]>
+            :param archive_format: Archive format (tar | tgz | zip)
+            :type archive_format: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param params: Generation parameters | None (defaults)
+            :type params: <Optional[Dict[str, str]]>
+            :param schema: Message schema (typed codecs) | None
+            :type schema: <Optional[MessageSchema]>
+            :return: Rendered modules by path | empty (archive to stream)
+            :rtype: <Dict[str, bytes]>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        pro_index: Dict[Any, Any] = self.config or {}
+        reader: ReadTemplate = self._reader or ReadTemplate(verbose)
+        modules: Iterator[Tuple[str, Template]] = reader.iter_read(
+            pro_index, pro_name, pro_type, verbose, self._timing
+        )
+        if ProStructure.base_type(str(pro_type)) not in pro_index:
+            raise ATSValueError(f'unknown project type {pro_type}')
+        if schema is not None:
+            modules = chain(modules, schema.modules(pro_type))
+        from gen_message_queue.pro.archive_write import ArchiveWrite
+        archive: ArchiveWrite = ArchiveWrite(verbose)
+        if stream is None:
+            return archive.render(modules, pro_name, self._timing, params)
+        archive.write(
+            modules, pro_name, stream, archive_format, self._timing, params
+        )
+        return {}
@@ -0,0 +1,223 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    archive_write.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ArchiveWrite with attribute(s) and method(s).
+    Creates an API for rendering modules in memory (bytes, tar or zip).
+'''
+
+import sys
+from typing import List, Dict, Tuple, Iterable, Iterator, BinaryIO, Optional
+from io import BytesIO
+from tarfile import TarInfo, open as tar_open
+from time import time, perf_counter
+from string import Template
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
+
+try:
+    from ats_utilities.checker import ATSChecker
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.gen_timing import GenTiming
+    from gen_message_queue.pro.gen_params import GenParams
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ArchiveWrite(ATSChecker):
+    '''
+        Defines class ArchiveWrite with attribute(s) and method(s).
+        Creates an API for rendering modules in memory (bytes, tar or zip).
+        Archive is written as stream (tar members one by one), so output
+        can be non-seekable (pipe, stdout) and nothing touches disk.
+
+        It defines:
+
+            :attributes:
+                | _GEN_VERBOSE - Console text indicator for process-phase.
+                | FORMATS - Supported archive formats.
+            :methods:
+                | __init__ - Initials ArchiveWrite constructor.
+                | render - Renders modules to dict of bytes.
+                | write - Writes modules as archive to binary stream.
+                | _values - Checks project name, gets placeholder values.
+                | _iter_rendered - Yields archive paths and rendered modules.
+    '''
+
+    _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE::PRO::ARCHIVE_WRITE'
+    FORMATS: Tuple[str, ...] = ('tar', 'tgz', 'zip')
+
+    def __init__(self, verbose: bool = False) -> None:
+        '''
+            Initials ArchiveWrite constructor.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        super().__init__()
+        verbose_message(
+            verbose, [f'{self._GEN_VERBOSE.lower()} init archive writer']
+        )
+
+    def render(
+        self,
+        modules: Iterable[Tuple[str, str | Template]],
+        pro_name: Optional[str],
+        timing: Optional[GenTiming] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, bytes]:
+        '''
+            Renders modules to dict of bytes.
+
+            :param modules: Module names with content or compiled template
+            :type modules: <Iterable[Tuple[str, str | Template]]>
+            :param pro_name: Project name | None
+            :type pro_name: <Optional[str]>
+            :param timing: Records durations and bytes per module | None
+            :type timing: <Optional[GenTiming]>
+            :param params: Generation parameters | None (defaults)
+            :type params: <Optional[Dict[str, str]]>
+            :return: Rendered modules by path (project/module)
+            :rtype: <Dict[str, bytes]>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        return dict(self._iter_rendered(
+            modules, self._values(pro_name, params), timing
+        ))
+
+    def write(
+        self,
+        modules: Iterable[Tuple[str, str | Template]],
+        pro_name: Optional[str],
+        stream: BinaryIO,
+        archive_format: str = 'tar',
+        timing: Optional[GenTiming] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> int:
+        '''
+            Writes modules as archive to binary stream.
+
+            :param modules: Module names with content or compiled template
+            :type modules: <Iterable[Tuple[str, str | Template]]>
+            :param pro_name: Project name | None
+            :type pro_name: <Optional[str]>
+            :param stream: Binary output (file, pipe, BytesIO)
+            :type stream: <BinaryIO>
+            :param archive_format: Archive format (tar | tgz | zip)
+            :type archive_format: <str>
+            :param timing: Records durations and bytes per module | None
+            :type timing: <Optional[GenTiming]>
+            :param params: Generation parameters | None (defaults)
+            :type params: <Optional[Dict[str, str]]>
+            :return: Number of modules in archive
+            :rtype: <int>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        if archive_format not in self.FORMATS:
+            raise ATSValueError(f'unsupported archive {archive_format}')
+        rendered: Iterator[Tuple[str, bytes]] = self._iter_rendered(
+            modules, self._values(pro_name, params), timing
+        )
+        count: int = 0
+        mtime: float = time()
+        if archive_format == 'zip':
+            with ZipFile(stream, 'w', ZIP_DEFLATED) as archive:
+                for path, content in rendered:
+                    info: ZipInfo = ZipInfo(path)
+                    info.compress_type = ZIP_DEFLATED
+                    info.external_attr = 0o644 << 16
+                    archive.writestr(info, content)
+                    count += 1
+            return count
+        with tar_open(
+            fileobj=stream, mode='w|gz' if archive_format == 'tgz' else 'w|'
+        ) as tar:
+            for path, content in rendered:
+                member: TarInfo = TarInfo(path)
+                member.size, member.mode, member.mtime = (
+                    len(content), 0o644, mtime
+                )
+                tar.addfile(member, BytesIO(content))
+                count += 1
+        return count
+
+    def _values(
+        self, pro_name: Optional[str], params: Optional[Dict[str, str]]
+    ) -> Dict[str, str]:
+        '''
+            Checks project name, gets placeholder values.
+
+            :param pro_name: Project name | None
+            :type pro_name: <Optional[str]>
+            :param params: Generation parameters | None (defaults)
+            :type params: <Optional[Dict[str, str]]>
+            :return: Values for template placeholders
+            :rtype: <Dict[str, str]>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        error_msg, error_id = self.check_params([('str:pro_name', pro_name)])
+        if error_id == self.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
+        if not bool(pro_name):
+            raise ATSValueError('missing model name')
+        return GenParams.values(str(pro_name), params)
+
+    def _iter_rendered(
+        self,
+        modules: Iterable[Tuple[str, str | Template]],
+        values: Dict[str, str],
+        timing: Optional[GenTiming] = None
+    ) -> Iterator[Tuple[str, bytes]]:
+        '''
+            Yields archive paths and rendered modules.
+
+            :param modules: Module names with content or compiled template
+            :type modules: <Iterable[Tuple[str, str | Template]]>
+            :param values: Values for template placeholders
+            :type values: <Dict[str, str]>
+            :param timing: Records durations and bytes per module | None
+            :type timing: <Optional[GenTiming]>
+            :return: Iterator of archive paths and rendered modules
+            :rtype: <Iterator[Tuple[str, bytes]]>
+            :exceptions: KeyError | ValueError
+        '''
+        for module_name, module_content in modules:
+            template: Template = module_content if isinstance(
+                module_content, Template
+            ) else Template(module_content)
+            start: float = perf_counter()
+            content: bytes = template.substitute(values).encode('utf-8')
+            path: str = f'{values["PRO"]}/{module_name}'
+            if timing is not None:
+                timing.add(
+                    'substitute', perf_counter() - start, path, len(content)
+                )
+            yield path, content
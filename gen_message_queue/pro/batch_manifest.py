@@ -0,0 +1,173 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    batch_manifest.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class BatchManifest with attribute(s) and method(s).
+    Creates an API for loading a batch generation manifest.
+'''
+
+import sys
+from typing import Any, List, Dict, Optional
+from os import getcwd
+from os.path import abspath, join
+
+try:
+    from ats_utilities.config_io.file_check import FileCheck
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.success import success_message
+    from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class BatchManifest(FileCheck):
+    '''
+        Defines class BatchManifest with attribute(s) and method(s).
+        Creates an API for loading a batch generation manifest.
+
+        Manifest is YAML file with list of projects, for example:
+
+            projects:
+              - name: queue_a
+                type: posix
+                output: build/queues
+              - name: queue_b
+                type: sysv
+
+        Key output is optional (default current working directory),
+        relative output paths are resolved against current directory.
+
+        It defines:
+
+            :attributes:
+                | _GEN_VERBOSE - Console text indicator for process-phase.
+                | _PROJECTS - Manifest key with list of projects.
+                | _KEYS - Required keys for manifest entry.
+            :methods:
+                | __init__ - Initials BatchManifest constructor.
+                | load - Loads and checks manifest entries.
+                | show - Shows batch generation report.
+    '''
+
+    _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE::PRO::BATCH_MANIFEST'
+    _PROJECTS: str = 'projects'
+    _KEYS: List[str] = ['name', 'type']
+
+    def __init__(self, verbose: bool = False) -> None:
+        '''
+            Initials BatchManifest constructor.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        super().__init__(verbose)
+        verbose_message(
+            verbose, [f'{self._GEN_VERBOSE.lower()} init manifest']
+        )
+
+    def load(
+        self, manifest_path: Optional[str], verbose: bool = False
+    ) -> List[Dict[str, str]]:
+        '''
+            Loads and checks manifest entries.
+
+            :param manifest_path: Manifest file path | None
+            :type manifest_path: <Optional[str]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: Entries with keys name, type and output
+            :rtype: <List[Dict[str, str]]>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        error_msg, error_id = self.check_params([
+            ('str:manifest_path', manifest_path)
+        ])
+        if error_id == self.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
+        if not bool(manifest_path):
+            raise ATSValueError('missing manifest path')
+        self.check_path(manifest_path, verbose)
+        self.check_mode('r', verbose)
+        self.check_format(manifest_path, 'yaml', verbose)
+        if not self.is_file_ok():
+            raise ATSValueError(f'check manifest {manifest_path}')
+        yml2obj: Yaml2Object = Yaml2Object(manifest_path)
+        manifest: Dict[Any, Any] = yml2obj.read_configuration()
+        projects: Any = None
+        if isinstance(manifest, dict):
+            projects = manifest.get(self._PROJECTS)
+        if not isinstance(projects, list) or not bool(projects):
+            raise ATSValueError(f'missing {self._PROJECTS} in manifest')
+        entries: List[Dict[str, str]] = []
+        for index, project in enumerate(projects):
+            if not isinstance(project, dict):
+                raise ATSValueError(f'manifest entry {index} is not mapping')
+            for key in self._KEYS:
+                if not bool(project.get(key)):
+                    raise ATSValueError(f'manifest entry {index} no {key}')
+            output: str = str(project.get('output') or '')
+            entries.append({
+                'name': str(project['name']),
+                'type': str(project['type']),
+                'output': abspath(join(getcwd(), output))
+            })
+        verbose_message(
+            verbose, [f'{self._GEN_VERBOSE.lower()} entries {entries}']
+        )
+        return entries
+
+    def show(self, report: Dict[str, Any], quiet: bool = False) -> None:
+        '''
+            Shows batch generation report.
+
+            :param report: Report from MessageQueue.gen_batch
+            :type report: <Dict[str, Any]>
+            :param quiet: Show only failed projects
+            :type quiet: <bool>
+            :exceptions: None
+        '''
+        for result in report['entries']:
+            line: List[str] = [
+                'gen_message_queue', f'{result["name"]}',
+                f'[{result["type"]}]', f'{result["elapsed"]:.3f}s'
+            ]
+            if not result['status']:
+                error_message(line + [f'{result["error"] or "failed"}'])
+            elif not quiet:
+                success_message(line)
+        if not quiet:
+            print(" ".join([
+                '[gen_message_queue]',
+                f'batch {len(report["entries"])} project(s)',
+                f'in {report["elapsed"]:.3f}s'
+            ]))
@@ -0,0 +1,137 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gen_batch.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class GenBatch with attribute(s) and method(s).
+    Generates MSG QUEUE for list of projects.
+'''
+
+import sys
+from typing import TYPE_CHECKING, Any, List, Dict, Callable, Optional
+from time import perf_counter
+from os import makedirs
+from os.path import exists
+
+try:
+    from ats_utilities.checker import ATSChecker
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+if TYPE_CHECKING:
+    # Schema is needed only for annotations, loaded with --schema option
+    from gen_message_queue.pro.message_schema import MessageSchema
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class GenBatch(ATSChecker):
+    '''
+        Defines class GenBatch with attribute(s) and method(s).
+        Generates MSG QUEUE for list of projects.
+        Loaded by MessageQueue only for batch generation.
+
+        It defines:
+
+            :attributes:
+                | _gen_setup - Generates one MSG QUEUE (MessageQueue).
+            :methods:
+                | __init__ - Initials GenBatch constructor.
+                | gen_batch - Generates MSG QUEUE for list of projects.
+    '''
+
+    def __init__(self, gen_setup: Callable[..., bool]) -> None:
+        '''
+            Initials GenBatch constructor.
+
+            :param gen_setup: Generates one MSG QUEUE (MessageQueue)
+            :type gen_setup: <Callable[..., bool]>
+            :exceptions: None
+        '''
+        super().__init__()
+        self._gen_setup: Callable[..., bool] = gen_setup
+
+    def gen_batch(
+        self,
+        entries: List[Dict[str, str]],
+        verbose: bool = False,
+        workers: int = 1,
+        incremental: bool = False,
+        params: Optional[Dict[str, str]] = None,
+        schema: Optional['MessageSchema'] = None
+    ) -> Dict[str, Any]:
+        '''
+            Generates MSG QUEUE for list of projects.
+
+            :param entries: Projects with keys name, type and output
+            :type entries: <List[Dict[str, str]]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param workers: Number of writer threads
+            :type workers: <int>
+            :param incremental: Rewrite only changed modules of projects
+            :type incremental: <bool>
+            :param params: Generation parameters for all projects | None
+            :type params: <Optional[Dict[str, str]]>
+            :param schema: Message schema for all projects | None
+            :type schema: <Optional[MessageSchema]>
+            :return: Report with per project status and total wall time
+            :rtype: <Dict[str, Any]>
+            :exceptions: ATSTypeError
+        '''
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        error_msg, error_id = self.check_params([('list:entries', entries)])
+        if error_id == self.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
+        results: List[Dict[str, Any]] = []
+        batch_start: float = perf_counter()
+        for entry in entries:
+            start: float = perf_counter()
+            output_dir: str = entry.get('output') or '.'
+            result: Dict[str, Any] = {
+                'name': entry.get('name'), 'type': entry.get('type'),
+                'output': output_dir, 'status': False, 'error': None
+            }
+            if exists(f'{output_dir}/{entry.get("name")}') and not incremental:
+                result['error'] = 'project exists'
+            else:
+                try:
+                    makedirs(output_dir, exist_ok=True)
+                    result['status'] = self._gen_setup(
+                        entry.get('name'), entry.get('type'),
+                        verbose, output_dir, workers, incremental, params,
+                        schema
+                    )
+                except (ATSTypeError, ATSValueError, OSError) as e:
+                    result['error'] = str(e)
+            result['elapsed'] = perf_counter() - start
+            results.append(result)
+        return {
+            'entries': results,
+            'status': all(result['status'] for result in results),
+            'elapsed': perf_counter() - batch_start
+        }
@@ -0,0 +1,159 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gen_params.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class GenParams with attribute(s) and method(s).
+    Checks generation parameters (template placeholders) with defaults.
+'''
+
+import sys
+from typing import Callable, List, Dict, Tuple, Iterable, Mapping, Optional
+from datetime import date
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class GenParams:
+    '''
+        Defines class GenParams with attribute(s) and method(s).
+        Checks generation parameters (template placeholders) with defaults.
+
+        Every parameter is integer with default and allowed range, all
+        parameters are substituted in every template (with PRO and YEAR),
+        so templates never miss placeholder. Derived values (queue sizes
+        in bytes) are computed from checked parameters.
+
+        It defines:
+
+            :attributes:
+                | PARAMETERS - Default, minimum and maximum by parameter.
+                | DERIVED - Values computed from parameters by name.
+            :methods:
+                | parse - Parses KEY=VALUE items to checked parameters.
+                | check - Checks parameters (names and ranges).
+                | values - Gets values for template placeholders.
+    '''
+
+    PARAMETERS: Dict[str, Tuple[int, int, int]] = {
+        'METRICS_QUEUES': (64, 1, 4096),
+        'POSIX_MAX_MESSAGES': (10, 1, 65536),
+        'POSIX_MESSAGE_SIZE': (8192, 128, 16777216),
+        'POSIX_REGISTRY_HANDLES': (64, 1, 4096),
+        'QUEUE_GROUP_SHARDS': (4, 1, 1024),
+        'SYSV_MESSAGE_SIZE': (8192, 1, 1048576),
+        'SYSV_QUEUE_BYTES': (16384, 1, 2147483647)
+    }
+
+    # Kernel charges message pointer for each slot (RLIMIT_MSGQUEUE)
+    DERIVED: Dict[str, Callable[[Dict[str, int]], int]] = {
+        'POSIX_QUEUE_BYTES': lambda value: value['POSIX_MAX_MESSAGES'] * (
+            value['POSIX_MESSAGE_SIZE'] + 8
+        ),
+        'SYSV_QUEUE_MESSAGES': lambda value: max(
+            1, value['SYSV_QUEUE_BYTES'] // value['SYSV_MESSAGE_SIZE']
+        )
+    }
+
+    @classmethod
+    def parse(cls, items: Optional[Iterable[str]]) -> Dict[str, str]:
+        '''
+            Parses KEY=VALUE items to checked parameters.
+
+            :param items: Parameters as KEY=VALUE | None
+            :type items: <Optional[Iterable[str]]>
+            :return: Checked parameters (without defaults)
+            :rtype: <Dict[str, str]>
+            :exceptions: ATSValueError
+        '''
+        params: Dict[str, str] = {}
+        for item in items or []:
+            name, separator, value = item.partition('=')
+            if not separator:
+                raise ATSValueError(f'expected KEY=VALUE parameter {item}')
+            params[name.strip().upper()] = value.strip()
+        return cls.check(params)
+
+    @classmethod
+    def check(cls, params: Optional[Mapping[str, object]]) -> Dict[str, str]:
+        '''
+            Checks parameters (names and ranges).
+
+            :param params: Parameters by name | None
+            :type params: <Optional[Mapping[str, object]]>
+            :return: Checked parameters as strings
+            :rtype: <Dict[str, str]>
+            :exceptions: ATSValueError
+        '''
+        checked: Dict[str, str] = {}
+        for name, value in (params or {}).items():
+            if name not in cls.PARAMETERS:
+                raise ATSValueError(f'unknown parameter {name}')
+            _, minimum, maximum = cls.PARAMETERS[name]
+            try:
+                number: int = int(str(value), 0)
+            except ValueError as error:
+                raise ATSValueError(
+                    f'parameter {name} expects integer'
+                ) from error
+            if not minimum <= number <= maximum:
+                raise ATSValueError(
+                    f'parameter {name} out of range {minimum}..{maximum}'
+                )
+            checked[name] = str(number)
+        return checked
+
+    @classmethod
+    def values(
+        cls, pro_name: str, params: Optional[Mapping[str, object]] = None
+    ) -> Dict[str, str]:
+        '''
+            Gets values for template placeholders.
+
+            :param pro_name: Project name
+            :type pro_name: <str>
+            :param params: Parameters by name | None (defaults)
+            :type params: <Optional[Mapping[str, object]]>
+            :return: Values for template placeholders
+            :rtype: <Dict[str, str]>
+            :exceptions: ATSValueError
+        '''
+        values: Dict[str, str] = {
+            name: str(default)
+            for name, (default, _, _) in cls.PARAMETERS.items()
+        }
+        values.update(cls.check(params))
+        numbers: Dict[str, int] = {
+            name: int(value) for name, value in values.items()
+        }
+        values.update({
+            name: str(derive(numbers)) for name, derive in cls.DERIVED.items()
+        })
+        values.update({'PRO': pro_name, 'YEAR': f'{date.today().year}'})
+        return values
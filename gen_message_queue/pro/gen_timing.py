@@ -0,0 +1,170 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gen_timing.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class GenTiming with attribute(s) and method(s).
+    Records per-phase and per-module durations and written bytes.
+'''
+
+import sys
+from typing import Any, List, Dict, Iterator, Optional, TextIO
+from contextlib import contextmanager
+from json import dump
+from threading import Lock
+from time import perf_counter
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class GenTiming:
+    '''
+        Defines class GenTiming with attribute(s) and method(s).
+        Records per-phase and per-module durations and written bytes.
+
+        Phases are config, read, substitute, write and check, module
+        durations are keyed by project/module. With several writer
+        threads phase durations are summed over threads.
+
+        It defines:
+
+            :attributes:
+                | _phases - Durations by phase.
+                | _modules - Durations and bytes by project/module.
+                | _lock - Guards records (writer threads).
+            :methods:
+                | __init__ - Initials GenTiming constructor.
+                | add - Adds duration (and bytes) to phase and module.
+                | phase - Context manager measuring phase (and module).
+                | reset - Removes all records.
+                | report - Gets records as JSON serializable dict.
+                | emit - Writes report as JSON to file or stdout.
+    '''
+
+    def __init__(self) -> None:
+        '''
+            Initials GenTiming constructor.
+
+            :exceptions: None
+        '''
+        self._phases: Dict[str, float] = {}
+        self._modules: Dict[str, Dict[str, float]] = {}
+        self._lock: Lock = Lock()
+
+    def add(
+        self,
+        phase: str,
+        seconds: float,
+        module: Optional[str] = None,
+        size: int = 0
+    ) -> None:
+        '''
+            Adds duration (and bytes) to phase and module.
+
+            :param phase: Phase name
+            :type phase: <str>
+            :param seconds: Duration in seconds
+            :type seconds: <float>
+            :param module: Project/module key | None (phase only)
+            :type module: <Optional[str]>
+            :param size: Number of bytes written
+            :type size: <int>
+            :exceptions: None
+        '''
+        with self._lock:
+            self._phases[phase] = self._phases.get(phase, 0.0) + seconds
+            if module is not None:
+                record: Dict[str, float] = self._modules.setdefault(
+                    module, {'bytes': 0}
+                )
+                record[phase] = record.get(phase, 0.0) + seconds
+                record['bytes'] += size
+
+    @contextmanager
+    def phase(
+        self, phase: str, module: Optional[str] = None
+    ) -> Iterator[None]:
+        '''
+            Context manager measuring phase (and module).
+
+            :param phase: Phase name
+            :type phase: <str>
+            :param module: Project/module key | None (phase only)
+            :type module: <Optional[str]>
+            :return: Context measuring block
+            :rtype: <Iterator[None]>
+            :exceptions: None
+        '''
+        start: float = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, perf_counter() - start, module)
+
+    def reset(self) -> None:
+        '''
+            Removes all records.
+
+            :exceptions: None
+        '''
+        with self._lock:
+            self._phases.clear()
+            self._modules.clear()
+
+    def report(self) -> Dict[str, Any]:
+        '''
+            Gets records as JSON serializable dict.
+
+            :return: Phases, modules and total bytes written
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        with self._lock:
+            return {
+                'phases': dict(self._phases),
+                'modules': {
+                    module: dict(record)
+                    for module, record in self._modules.items()
+                },
+                'bytes': int(sum(
+                    record['bytes'] for record in self._modules.values()
+                ))
+            }
+
+    def emit(self, path: str, stream: Optional[TextIO] = None) -> None:
+        '''
+            Writes report as JSON to file or stdout.
+
+            :param path: Report file path | - (stream)
+            :type path: <str>
+            :param stream: Output for - | None (stdout)
+            :type stream: <Optional[TextIO]>
+            :exceptions: OSError
+        '''
+        if path == '-':
+            out: TextIO = stream or sys.stdout
+            dump(self.report(), out, indent=4)
+            out.write('\n')
+            return
+        with open(path, 'w', encoding='utf-8') as report_file:
+            dump(self.report(), report_file, indent=4)
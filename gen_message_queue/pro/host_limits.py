@@ -0,0 +1,114 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    host_limits.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class HostLimits with attribute(s) and method(s).
+    Reads message queue limits of host as generation parameters.
+'''
+
+import sys
+from typing import List, Dict, Mapping, Optional
+from os.path import join
+
+try:
+    from gen_message_queue.pro.gen_params import GenParams
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class HostLimits:
+    '''
+        Defines class HostLimits with attribute(s) and method(s).
+        Reads message queue limits of host as generation parameters.
+
+        Limits are maximums an unprivileged process may request, so they
+        are used as queue sizing (largest queue without EINVAL). Missing
+        or unreadable limit keeps parameter default, limit out of range
+        is clamped to range of parameter.
+
+        It defines:
+
+            :attributes:
+                | PROC - Default proc file system mount point.
+                | LIMITS - Proc file (relative to PROC) by parameter.
+            :methods:
+                | read - Reads host limits as checked parameters.
+                | merge - Merges host limits with explicit parameters.
+    '''
+
+    PROC: str = '/proc'
+    LIMITS: Dict[str, str] = {
+        'POSIX_MAX_MESSAGES': 'sys/fs/mqueue/msg_max',
+        'POSIX_MESSAGE_SIZE': 'sys/fs/mqueue/msgsize_max',
+        'SYSV_MESSAGE_SIZE': 'sys/kernel/msgmax',
+        'SYSV_QUEUE_BYTES': 'sys/kernel/msgmnb'
+    }
+
+    @classmethod
+    def read(cls, proc: Optional[str] = None) -> Dict[str, str]:
+        '''
+            Reads host limits as checked parameters.
+
+            :param proc: Proc file system mount point | None (/proc)
+            :type proc: <Optional[str]>
+            :return: Parameters by name (only limits found on host)
+            :rtype: <Dict[str, str]>
+            :exceptions: None
+        '''
+        params: Dict[str, str] = {}
+        for name, limit_file in cls.LIMITS.items():
+            try:
+                with open(
+                    join(proc or cls.PROC, limit_file), encoding='utf-8'
+                ) as limit:
+                    value: int = int(limit.read().split()[0])
+            except (OSError, ValueError, IndexError):
+                continue
+            _, minimum, maximum = GenParams.PARAMETERS[name]
+            params[name] = str(min(max(value, minimum), maximum))
+        return params
+
+    @classmethod
+    def merge(
+        cls,
+        params: Optional[Mapping[str, str]],
+        proc: Optional[str] = None
+    ) -> Dict[str, str]:
+        '''
+            Merges host limits with explicit parameters (which win).
+
+            :param params: Checked parameters by name | None
+            :type params: <Optional[Mapping[str, str]]>
+            :param proc: Proc file system mount point | None (/proc)
+            :type proc: <Optional[str]>
+            :return: Parameters by name
+            :rtype: <Dict[str, str]>
+            :exceptions: None
+        '''
+        merged: Dict[str, str] = cls.read(proc)
+        merged.update(params or {})
+        return merged
@@ -0,0 +1,297 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    incremental_write.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class IncrementalWrite with attribute(s) and method(s).
+    Creates an API for rewriting only changed modules of existing project.
+'''
+
+import sys
+from typing import Any, List, Dict, Tuple, Iterable, Optional
+from hashlib import sha256
+from json import load, dump
+from os import getcwd, chmod, makedirs, replace, unlink
+from os.path import basename, exists
+from secrets import token_hex
+from time import perf_counter
+from string import Template
+
+try:
+    from ats_utilities.config_io.file_check import FileCheck
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.gen_timing import GenTiming
+    from gen_message_queue.pro.gen_params import GenParams
+    from gen_message_queue.pro.write_template import WriteTemplate
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class IncrementalWrite(FileCheck):
+    '''
+        Defines class IncrementalWrite with attribute(s) and method(s).
+        Creates an API for rewriting only changed modules of existing project.
+
+        Project directory keeps manifest with SHA-256 of every rendered
+        module, module is replaced (atomically) only when its hash changed
+        or file is missing, so unchanged modules keep their mtime. Without
+        manifest, hashes of existing files are used. Modules listed in
+        manifest but no longer generated are removed.
+
+        It defines:
+
+            :attributes:
+                | _GEN_VERBOSE - Console text indicator for process-phase.
+                | _MANIFEST - Manifest file name in project directory.
+                | _FORMAT - Version of manifest format.
+                | _changed - Modules written by last run.
+                | _unchanged - Modules left untouched by last run.
+                | _removed - Stale modules removed by last run.
+            :methods:
+                | __init__ - Initials IncrementalWrite constructor.
+                | changed - Property method for getting written modules.
+                | unchanged - Property method for getting skipped modules.
+                | write - Writes changed modules and updates manifest.
+                | _load_manifest - Loads module hashes from manifest.
+                | _save_manifest - Saves module hashes to manifest.
+                | _replace_module - Writes and checks one module in place.
+    '''
+
+    _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE::PRO::INCREMENTAL_WRITE'
+    _MANIFEST: str = '.gen_message_queue.json'
+    _FORMAT: int = 1
+
+    def __init__(self, verbose: bool = False) -> None:
+        '''
+            Initials IncrementalWrite constructor.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        super().__init__(verbose)
+        self._changed: List[str] = []
+        self._unchanged: List[str] = []
+        self._removed: List[str] = []
+        verbose_message(
+            verbose, [f'{self._GEN_VERBOSE.lower()} init incremental writer']
+        )
+
+    @property
+    def changed(self) -> List[str]:
+        '''
+            Property method for getting written modules.
+
+            :return: Modules written by last run
+            :rtype: <List[str]>
+            :exceptions: None
+        '''
+        return self._changed
+
+    @property
+    def unchanged(self) -> List[str]:
+        '''
+            Property method for getting skipped modules.
+
+            :return: Modules left untouched by last run
+            :rtype: <List[str]>
+            :exceptions: None
+        '''
+        return self._unchanged
+
+    def write(
+        self,
+        modules: Iterable[Tuple[str, str | Template]],
+        pro_name: Optional[str],
+        verbose: bool = False,
+        output_dir: Optional[str] = None,
+        timing: Optional[GenTiming] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> bool:
+        '''
+            Writes changed modules, removes stale modules and rewrites
+            manifest from current modules.
+
+            :param modules: Module names with content or compiled template
+            :type modules: <Iterable[Tuple[str, str | Template]]>
+            :param pro_name: Project name | None
+            :type pro_name: <Optional[str]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param output_dir: Parent directory for project | None (cwd)
+            :type output_dir: <Optional[str]>
+            :param timing: Records durations and bytes per module | None
+            :type timing: <Optional[GenTiming]>
+            :param params: Generation parameters | None (defaults)
+            :type params: <Optional[Dict[str, str]]>
+            :return: True (success operation) | False
+            :rtype: <bool>
+            :exception: ATSTypeError | ATSValueError | OSError
+        '''
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        error_msg, error_id = self.check_params([('str:pro_name', pro_name)])
+        if error_id == self.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
+        if not bool(pro_name):
+            raise ATSValueError('missing model name')
+        values: Dict[str, str] = GenParams.values(str(pro_name), params)
+        pro_dir: str = f'{output_dir or getcwd()}/{pro_name}'
+        makedirs(pro_dir, exist_ok=True)
+        known: Dict[str, str] = self._load_manifest(pro_dir)
+        hashes: Dict[str, str] = {}
+        self._changed, self._unchanged, self._removed = [], [], []
+        all_stat: List[bool] = []
+        for module_name, module_content in modules:
+            template: Template = module_content if isinstance(
+                module_content, Template
+            ) else Template(module_content)
+            start: float = perf_counter()
+            content: bytes = template.substitute(values).encode('utf-8')
+            if timing is not None:
+                timing.add(
+                    'substitute', perf_counter() - start,
+                    f'{pro_name}/{module_name}'
+                )
+            hashes[module_name] = sha256(content).hexdigest()
+            module_path: str = f'{pro_dir}/{module_name}'
+            previous: Optional[str] = known.get(module_name)
+            if previous is None and exists(module_path):
+                with open(module_path, 'rb') as module_file:
+                    previous = sha256(module_file.read()).hexdigest()
+            if previous == hashes[module_name] and exists(module_path):
+                self._unchanged.append(module_name)
+                continue
+            all_stat.append(self._replace_module(
+                pro_dir, module_name, content, verbose, timing,
+                f'{pro_name}/{module_name}'
+            ))
+            self._changed.append(module_name)
+        status: bool = bool(hashes) and all(all_stat)
+        if status:
+            # Manifest names only files generated in project directory
+            for module_name in sorted(set(known) - set(hashes)):
+                module_path = f'{pro_dir}/{module_name}'
+                if basename(module_name) == module_name and exists(
+                    module_path
+                ):
+                    unlink(module_path)
+                    self._removed.append(module_name)
+            self._save_manifest(pro_dir, hashes)
+        verbose_message(verbose, [
+            f'{self._GEN_VERBOSE.lower()} changed {len(self._changed)}',
+            f'unchanged {len(self._unchanged)}',
+            f'removed {len(self._removed)}'
+        ])
+        return status
+
+    def _load_manifest(self, pro_dir: str) -> Dict[str, str]:
+        '''
+            Loads module hashes from manifest.
+
+            :param pro_dir: Project directory
+            :type pro_dir: <str>
+            :return: Module hashes | empty (missing or invalid manifest)
+            :rtype: <Dict[str, str]>
+            :exceptions: None
+        '''
+        try:
+            with open(
+                f'{pro_dir}/{self._MANIFEST}', 'r', encoding='utf-8'
+            ) as manifest_file:
+                manifest: Dict[str, Any] = load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('format') != self._FORMAT:
+            return {}
+        return dict(manifest.get('modules') or {})
+
+    def _save_manifest(self, pro_dir: str, hashes: Dict[str, str]) -> None:
+        '''
+            Saves module hashes to manifest.
+
+            :param pro_dir: Project directory
+            :type pro_dir: <str>
+            :param hashes: Module hashes
+            :type hashes: <Dict[str, str]>
+            :exceptions: OSError
+        '''
+        manifest_path: str = f'{pro_dir}/{self._MANIFEST}'
+        tmp_path: str = f'{manifest_path}.{token_hex(4)}'
+        with open(tmp_path, 'w', encoding='utf-8') as manifest_file:
+            dump(
+                {'format': self._FORMAT, 'modules': hashes},
+                manifest_file, indent=4, sort_keys=True
+            )
+        replace(tmp_path, manifest_path)
+
+    def _replace_module(
+        self,
+        pro_dir: str,
+        module_name: str,
+        content: bytes,
+        verbose: bool = False,
+        timing: Optional[GenTiming] = None,
+        key: str = ''
+    ) -> bool:
+        '''
+            Writes and checks one module in place.
+
+            :param pro_dir: Project directory
+            :type pro_dir: <str>
+            :param module_name: Module file name
+            :type module_name: <str>
+            :param content: Rendered module content
+            :type content: <bytes>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param timing: Records durations and bytes | None
+            :type timing: <Optional[GenTiming]>
+            :param key: Module key for timing (project/module)
+            :type key: <str>
+            :return: True (module is replaced) | False
+            :rtype: <bool>
+            :exception: OSError
+        '''
+        tmp_path: str = f'{pro_dir}/.{token_hex(4)}.{module_name}'
+        start: float = perf_counter()
+        with open(tmp_path, 'wb') as module_file:
+            module_file.write(content)
+        chmod(tmp_path, 0o644)
+        written: float = perf_counter()
+        checked: bool = WriteTemplate.check_module(
+            tmp_path, module_name, verbose
+        )
+        if timing is not None:
+            timing.add('write', written - start, key, len(content))
+            timing.add('check', perf_counter() - written, key)
+        if not checked:
+            unlink(tmp_path)
+            return False
+        replace(tmp_path, f'{pro_dir}/{module_name}')
+        return True
@@ -0,0 +1,232 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    message_schema.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MessageSchema with attribute(s) and method(s).
+    Creates an API for loading message schema (typed message codecs).
+'''
+
+import sys
+from typing import Any, List, Dict, Tuple, Optional
+from keyword import iskeyword
+from re import fullmatch
+from string import Template
+
+try:
+    from ats_utilities.config_io.file_check import FileCheck
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.pro_structure import ProStructure
+    from gen_message_queue.pro.schema_codec import SchemaCodec
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MessageSchema(FileCheck):
+    '''
+        Defines class MessageSchema with attribute(s) and method(s).
+        Creates an API for loading message schema (typed message codecs).
+
+        Schema is YAML file with list of message types, for example:
+
+            messages:
+              - name: order
+                id: 1
+                fields:
+                  order_id: uint64
+                  price: float64
+                  quantity: uint32
+                  symbol: char[8]
+
+        Key id is optional (default position in list, from 1), fields keep
+        order of schema. Every message type gets packed C struct with send
+        and receive functions (posix, sysv) and Python decoder, layout is
+        fixed (no padding, host byte order), so payload is copied as is.
+
+        It defines:
+
+            :attributes:
+                | _GEN_VERBOSE - Console text indicator for process-phase.
+                | _MESSAGES - Schema key with list of message types.
+                | _ARRAYS - Field types allowed as fixed arrays (bytes).
+                | _MAX_ID - Maximum message id (System V message type).
+                | _RESERVED - Names not allowed for fields (C, decoder).
+                | messages - Checked message types (name, id, size, fields).
+            :methods:
+                | __init__ - Initials MessageSchema constructor.
+                | load - Loads and checks message types.
+                | modules - Gets generated modules for project type.
+                | _field - Checks field type, gets type and array length.
+    '''
+
+    _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE::PRO::MESSAGE_SCHEMA'
+    _MESSAGES: str = 'messages'
+    _ARRAYS: Tuple[str, ...] = ('char', 'uint8')
+    _MAX_ID: int = 2147483647
+    _RESERVED: Tuple[str, ...] = (
+        'auto', 'bool', 'break', 'case', 'char', 'const', 'continue',
+        'count', 'decode', 'decode_all', 'default', 'do', 'double', 'else',
+        'encode', 'enum', 'extern', 'false', 'float', 'for', 'goto', 'if',
+        'index', 'inline', 'int', 'long', 'register', 'restrict', 'return',
+        'short', 'signed', 'sizeof', 'static', 'struct', 'switch', 'true',
+        'typedef', 'union', 'unsigned', 'void', 'volatile', 'while'
+    )
+
+    def __init__(self, verbose: bool = False) -> None:
+        '''
+            Initials MessageSchema constructor.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        super().__init__(verbose)
+        verbose_message(verbose, [f'{self._GEN_VERBOSE.lower()} init schema'])
+        self.messages: List[Dict[str, Any]] = []
+
+    def load(
+        self, schema_path: Optional[str], verbose: bool = False
+    ) -> 'MessageSchema':
+        '''
+            Loads and checks message types.
+
+            :param schema_path: Schema file path | None
+            :type schema_path: <Optional[str]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: Loaded schema (self)
+            :rtype: <MessageSchema>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        error_msg, error_id = self.check_params([
+            ('str:schema_path', schema_path)
+        ])
+        if error_id == self.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
+        if not bool(schema_path):
+            raise ATSValueError('missing schema path')
+        self.check_path(schema_path, verbose)
+        self.check_mode('r', verbose)
+        self.check_format(schema_path, 'yaml', verbose)
+        if not self.is_file_ok():
+            raise ATSValueError(f'check schema {schema_path}')
+        schema: Any = Yaml2Object(schema_path).read_configuration()
+        types: Any = None
+        if isinstance(schema, dict):
+            types = schema.get(self._MESSAGES)
+        if not isinstance(types, list) or not bool(types):
+            raise ATSValueError(f'missing {self._MESSAGES} in schema')
+        self.messages = []
+        for index, message in enumerate(types, 1):
+            if not isinstance(message, dict):
+                raise ATSValueError(f'schema message {index} is not mapping')
+            name: str = str(message.get('name') or '')
+            if not fullmatch(r'[a-z][a-z0-9_]*', name) or iskeyword(name):
+                raise ATSValueError(f'schema message {index} name {name}')
+            fields: Any = message.get('fields')
+            if not isinstance(fields, dict) or not bool(fields):
+                raise ATSValueError(f'schema message {name} no fields')
+            message_id: Any = message.get('id', index)
+            if not isinstance(message_id, int) or not (
+                0 < message_id <= self._MAX_ID
+            ):
+                raise ATSValueError(f'schema message {name} id {message_id}')
+            checked: List[Tuple[str, str, int]] = [
+                (field, *self._field(name, field, field_type))
+                for field, field_type in fields.items()
+            ]
+            self.messages.append({
+                'name': name, 'id': message_id, 'fields': checked,
+                'size': sum(
+                    SchemaCodec.TYPES[field_type][2] * max(count, 1)
+                    for _, field_type, count in checked
+                )
+            })
+        for key in ('name', 'id'):
+            values: List[Any] = [message[key] for message in self.messages]
+            if len(set(values)) != len(values):
+                raise ATSValueError(f'duplicate message {key} in schema')
+        verbose_message(
+            verbose, [f'{self._GEN_VERBOSE.lower()} messages {self.messages}']
+        )
+        return self
+
+    def modules(self, pro_type: Optional[str]) -> List[Tuple[str, Template]]:
+        '''
+            Gets generated modules for project type (C header and source
+            of backend, Python decoder).
+
+            :param pro_type: Project type with options (posix+metrics)
+            :type pro_type: <Optional[str]>
+            :return: Module names with compiled templates (PRO, YEAR)
+            :rtype: <List[Tuple[str, Template]]>
+            :exceptions: ATSValueError
+        '''
+        backend: str = ProStructure.base_type(str(pro_type))
+        if backend not in SchemaCodec.BACKENDS:
+            raise ATSValueError(f'message schema not supported for {backend}')
+        codec: SchemaCodec = SchemaCodec(backend, self.messages)
+        return [
+            (f'mq_{backend}_messages.h', Template(codec.header())),
+            (f'mq_{backend}_messages.c', Template(codec.source())),
+            ('mq_messages.py', Template(codec.decoder()))
+        ]
+
+    def _field(
+        self, message: str, field: Any, field_type: Any
+    ) -> Tuple[str, int]:
+        '''
+            Checks field type, gets type and array length.
+
+            :param message: Message type name
+            :type message: <str>
+            :param field: Field name
+            :type field: <Any>
+            :param field_type: Field type (uint32, char[8], ...)
+            :type field_type: <Any>
+            :return: Field type and array length (0 for scalar)
+            :rtype: <Tuple[str, int]>
+            :exceptions: ATSValueError
+        '''
+        if not fullmatch(r'[a-z][a-z0-9_]*', str(field)) or iskeyword(
+            field
+        ) or field in self._RESERVED:
+            raise ATSValueError(f'schema message {message} field {field}')
+        matched: Any = fullmatch(
+            r'([a-z0-9]+)(?:\[([1-9][0-9]*)\])?', str(field_type)
+        )
+        if matched is None or matched.group(1) not in SchemaCodec.TYPES:
+            raise ATSValueError(f'schema field {message}.{field} {field_type}')
+        if matched.group(2) and matched.group(1) not in self._ARRAYS:
+            raise ATSValueError(
+                f'schema field {message}.{field} array of {matched.group(1)}'
+            )
+        return matched.group(1), int(matched.group(2) or 0)
@@ -0,0 +1,279 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    pro_structure.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ProStructure with attribute(s) and method(s).
+    Compiles project structure (YAML) to cached index by project type.
+'''
+
+import sys
+from typing import Any, List, Dict, Tuple, Optional
+from os import stat, replace, getpid
+from os.path import splitext
+from json import load, dump
+from threading import Lock
+
+try:
+    from ats_utilities.config_io.file_check import FileCheck
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+ProIndex = Dict[str, List[Tuple[str, str]]]
+
+
+class ProStructure(FileCheck):
+    '''
+        Defines class ProStructure with attribute(s) and method(s).
+        Compiles project structure (YAML) to cached index by project type.
+
+        Index maps project type to list of (module, template) pairs and
+        is stored as JSON next to YAML, cache is valid while modification
+        time of YAML is unchanged, so YAML is parsed only after edit.
+        Optional components are indexed as type+option (posix+event_loop)
+        and selected by project type posix+option[+option...].
+
+        It defines:
+
+            :attributes:
+                | _GEN_VERBOSE - Console text indicator for process-phase.
+                | OPTION - Separator of project type and options.
+                | _CACHE_EXT - Extension of cached index file.
+                | _FORMAT - Version of cached index format.
+                | _LOADED - Indexes loaded in this process by YAML path.
+                | _LOCK - Guards loaded indexes.
+            :methods:
+                | __init__ - Initials ProStructure constructor.
+                | load - Loads project index (cached) for YAML.
+                | is_raw - Checks is configuration raw project structure.
+                | index - Indexes raw project structure by project type.
+                | base_type - Gets project type without options.
+                | pairs - Gets modules and templates for type with options.
+                | _read_cache - Reads cached index file.
+                | _write_cache - Writes cached index file.
+    '''
+
+    _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE::PRO::PRO_STRUCTURE'
+    OPTION: str = '+'
+    _CACHE_EXT: str = '.cache.json'
+    _FORMAT: int = 1
+    _LOADED: Dict[str, Tuple[int, ProIndex]] = {}
+    _LOCK: Lock = Lock()
+
+    def __init__(self, verbose: bool = False) -> None:
+        '''
+            Initials ProStructure constructor.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        super().__init__(verbose)
+        verbose_message(
+            verbose, [f'{self._GEN_VERBOSE.lower()} init pro structure']
+        )
+
+    def load(
+        self, pro_structure: Optional[str], verbose: bool = False
+    ) -> ProIndex:
+        '''
+            Loads project index (cached) for YAML.
+
+            :param pro_structure: Project structure (YAML) file path | None
+            :type pro_structure: <Optional[str]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: Project index by project type
+            :rtype: <ProIndex>
+            :exceptions: ATSTypeError | ATSValueError | OSError
+        '''
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        error_msg, error_id = self.check_params([
+            ('str:pro_structure', pro_structure)
+        ])
+        if error_id == self.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
+        if not bool(pro_structure):
+            raise ATSValueError('missing project structure')
+        source: str = str(pro_structure)
+        mtime: int = stat(source).st_mtime_ns
+        with self._LOCK:
+            loaded: Optional[Tuple[int, ProIndex]] = self._LOADED.get(source)
+        if loaded is not None and loaded[0] == mtime:
+            return loaded[1]
+        cache_file: str = f'{splitext(source)[0]}{self._CACHE_EXT}'
+        pro_index: Optional[ProIndex] = self._read_cache(cache_file, mtime)
+        if pro_index is None:
+            # YAML support is loaded only when cache is missing or stale
+            from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
+            pro_index = self.index(Yaml2Object(source).read_configuration())
+            self._write_cache(cache_file, mtime, pro_index)
+            verbose_message(
+                verbose, [f'{self._GEN_VERBOSE.lower()} compiled {source}']
+            )
+        with self._LOCK:
+            self._LOADED[source] = (mtime, pro_index)
+        return pro_index
+
+    @staticmethod
+    def is_raw(config: Dict[Any, Any]) -> bool:
+        '''
+            Checks is configuration raw project structure.
+
+            :param config: Raw project structure or project index
+            :type config: <Dict[Any, Any]>
+            :return: True (raw project structure) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return all(
+            isinstance(config.get(key), list) and bool(config.get(key)) and
+            isinstance(config[key][0], dict)
+            for key in ('modules', 'templates')
+        )
+
+    @staticmethod
+    def index(config: Dict[Any, Any]) -> ProIndex:
+        '''
+            Indexes raw project structure by project type.
+
+            :param config: Raw project structure (modules, templates)
+            :type config: <Dict[Any, Any]>
+            :return: Project index by project type
+            :rtype: <ProIndex>
+            :exceptions: ATSValueError
+        '''
+        if not ProStructure.is_raw(config):
+            raise ATSValueError('expected project modules and templates')
+        modules: Dict[str, List[str]] = {}
+        templates: Dict[str, List[str]] = {}
+        for entry in config['modules']:
+            modules.update(entry)
+        for entry in config['templates']:
+            templates.update(entry)
+        pro_index: ProIndex = {}
+        for pro_type, pro_modules in modules.items():
+            pro_templates: List[str] = templates.get(pro_type) or []
+            if len(pro_modules) != len(pro_templates):
+                raise ATSValueError(f'modules/templates mismatch {pro_type}')
+            pro_index[pro_type] = list(zip(pro_modules, pro_templates))
+        return pro_index
+
+    @staticmethod
+    def base_type(pro_type: str) -> str:
+        '''
+            Gets project type without options (posix+event_loop -> posix).
+
+            :param pro_type: Project type with options
+            :type pro_type: <str>
+            :return: Project type
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return pro_type.split(ProStructure.OPTION, 1)[0]
+
+    @staticmethod
+    def pairs(
+        pro_index: ProIndex, pro_type: str
+    ) -> Optional[List[Tuple[str, str]]]:
+        '''
+            Gets modules and templates for project type with options.
+
+            :param pro_index: Project index by project type
+            :type pro_index: <ProIndex>
+            :param pro_type: Project type with options (posix+event_loop)
+            :type pro_type: <str>
+            :return: Modules and templates | None (unknown project type)
+            :rtype: <Optional[List[Tuple[str, str]]]>
+            :exceptions: ATSValueError
+        '''
+        base: str = ProStructure.base_type(pro_type)
+        if base not in pro_index:
+            return None
+        pairs: List[Tuple[str, str]] = list(pro_index[base])
+        for option in pro_type.split(ProStructure.OPTION)[1:]:
+            option_type: str = f'{base}{ProStructure.OPTION}{option}'
+            if option_type not in pro_index:
+                raise ATSValueError(f'unknown option {option} for {base}')
+            pairs.extend(
+                pair for pair in pro_index[option_type] if pair not in pairs
+            )
+        return pairs
+
+    def _read_cache(self, cache_file: str, mtime: int) -> Optional[ProIndex]:
+        '''
+            Reads cached index file.
+
+            :param cache_file: Cached index file path
+            :type cache_file: <str>
+            :param mtime: Modification time of YAML (ns)
+            :type mtime: <int>
+            :return: Project index | None (missing or stale cache)
+            :rtype: <Optional[ProIndex]>
+            :exceptions: None
+        '''
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as cache:
+                cached: Dict[str, Any] = load(cache)
+        except (OSError, ValueError):
+            return None
+        if cached.get('format') != self._FORMAT:
+            return None
+        if cached.get('source_mtime_ns') != mtime:
+            return None
+        return {
+            pro_type: [(module, template) for module, template in pairs]
+            for pro_type, pairs in cached['index'].items()
+        }
+
+    def _write_cache(
+        self, cache_file: str, mtime: int, pro_index: ProIndex
+    ) -> None:
+        '''
+            Writes cached index file (skipped on read-only installation).
+
+            :param cache_file: Cached index file path
+            :type cache_file: <str>
+            :param mtime: Modification time of YAML (ns)
+            :type mtime: <int>
+            :param pro_index: Project index
+            :type pro_index: <ProIndex>
+            :exceptions: None
+        '''
+        tmp_file: str = f'{cache_file}.{getpid()}'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as cache:
+                dump({
+                    'format': self._FORMAT, 'source_mtime_ns': mtime,
+                    'index': pro_index
+                }, cache, indent=4)
+            replace(tmp_file, cache_file)
+        except OSError:
+            pass
@@ -21,14 +21,20 @@ Info
 '''
 
 import sys
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Tuple, Iterator, Optional
 from os.path import dirname, realpath
+from threading import Lock
+from time import perf_counter
+from string import Template
 
 try:
     from ats_utilities.config_io.file_check import FileCheck
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.template_cache import TemplateCache
+    from gen_message_queue.pro.pro_structure import ProStructure, ProIndex
+    from gen_message_queue.pro.gen_timing import GenTiming
 except ImportError as ats_error_message:  # pragma: no cover
     # Force exit python #######################################################
     sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
@@ -53,13 +59,25 @@ class ReadTemplate(FileCheck):
             :attributes:
                 | _GEN_VERBOSE - Console text indicator for process-phase.
                 | _TEMPLATE_DIR - Prefix path to templates.
+                | _CACHE - Compiled templates shared by all readers.
+                | _CACHE_LOCK - Guards creation of shared cache.
+                | _cache_hits - Number of templates served from cache.
+                | _cache_misses - Number of templates loaded from file.
             :methods:
                 | __init__ - Initials ReadTemplate constructor.
+                | cache_hits - Property method for getting cache hits.
+                | cache_misses - Property method for getting cache misses.
                 | read - Reads a template.
+                | read_compiled - Reads a compiled template.
+                | iter_read - Reads compiled templates one by one.
+                | _cache - Gets shared cache (created on first use).
+                | _iter_compiled - Yields compiled templates from cache.
     '''
 
     _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE::PRO::READ_TEMPLATE'
     _TEMPLATE_DIR: str = '/../conf/template/'
+    _CACHE: Optional[TemplateCache] = None
+    _CACHE_LOCK: Lock = Lock()
 
     def __init__(self, verbose: bool = False) -> None:
         '''
@@ -70,8 +88,32 @@ class ReadTemplate(FileCheck):
             :exceptions: None
         '''
         super().__init__(verbose)
+        self._cache_hits: int = 0
+        self._cache_misses: int = 0
         verbose_message(verbose, [f'{self._GEN_VERBOSE.lower()} init reader'])
 
+    @property
+    def cache_hits(self) -> int:
+        '''
+            Property method for getting cache hits.
+
+            :return: Number of templates served from cache
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        '''
+            Property method for getting cache misses.
+
+            :return: Number of templates loaded from file
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._cache_misses
+
     def read(
         self,
         config: Dict[Any, Any],
@@ -94,6 +136,68 @@ class ReadTemplate(FileCheck):
             :rtype: <Dict[str, str]>
             :exceptions: ATSTypeError | ATSValueError
         '''
+        return {
+            module: template.template for module, template in
+            self.read_compiled(config, pro_name, pro_type, verbose).items()
+        }
+
+    def read_compiled(
+        self,
+        config: Dict[Any, Any],
+        pro_name: Optional[str],
+        pro_type: Optional[str],
+        verbose: bool = False
+    ) -> Dict[str, Template]:
+        '''
+            Reads a compiled template.
+
+            :param config: Project index or raw LKM configuration
+            :type config: <Dict[Any, Any]>
+            :param pro_name: LKM name | None
+            :type pro_name: <Optional[str]>
+            :param pro_type: LKM type | None
+            :type pro_type: <Optional[str]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: Compiled templates
+            :rtype: <Dict[str, Template]>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        template_content: Dict[str, Template] = dict(
+            self.iter_read(config, pro_name, pro_type, verbose)
+        )
+        verbose_message(
+            verbose, [f'{self._GEN_VERBOSE.lower()} {template_content}']
+        )
+        return template_content
+
+    def iter_read(
+        self,
+        config: Dict[Any, Any],
+        pro_name: Optional[str],
+        pro_type: Optional[str],
+        verbose: bool = False,
+        timing: Optional[GenTiming] = None
+    ) -> Iterator[Tuple[str, Template]]:
+        '''
+            Reads compiled templates one by one.
+            Parameters are checked immediately, templates are loaded
+            lazily while caller consumes iterator.
+
+            :param config: Project index or raw LKM configuration
+            :type config: <Dict[Any, Any]>
+            :param pro_name: LKM name | None
+            :type pro_name: <Optional[str]>
+            :param pro_type: LKM type | None
+            :type pro_type: <Optional[str]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param timing: Records read duration per module | None
+            :type timing: <Optional[GenTiming]>
+            :return: Iterator of module names and compiled templates
+            :rtype: <Iterator[Tuple[str, Template]]>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
         error_msg: Optional[str] = None
         error_id: Optional[int] = None
         error_msg, error_id = self.check_params([
@@ -111,22 +215,68 @@ class ReadTemplate(FileCheck):
             raise ATSValueError('missing project type')
         current_dir: str = dirname(realpath(__file__))
         pro_structure: str = f'{current_dir}{self._TEMPLATE_DIR}'
-        template_dir: str = f'{pro_structure}{pro_type}/'
-        template_content: Dict[str, str] = {}
-        index: int = -1
-        if pro_type in config['modules'][0]:
-            index = 0
-        elif pro_type in config['modules'][1]:
-            index = 1
-        else:
-            return template_content
-        modules: List[str] = config['modules'][index][pro_type]
-        templates: List[str] = config['templates'][index][pro_type]
-        for module, template in zip(modules, templates):
-            template_file: str = f'{template_dir}{template}'
-            with open(template_file, 'r', encoding='utf-8') as module_file:
-                template_content[module] = module_file.read()
+        template_dir: str = (
+            f'{pro_structure}{ProStructure.base_type(str(pro_type))}/'
+        )
+        pro_index: ProIndex = config
+        if ProStructure.is_raw(config):
+            pro_index = ProStructure.index(config)
         verbose_message(
-            verbose, [f'{self._GEN_VERBOSE.lower()} {template_content}']
+            verbose, [f'{self._GEN_VERBOSE.lower()} stream {pro_type}']
         )
-        return template_content
+        # Each read is generation run, templates are checked once in it
+        self._cache().new_generation()
+        return self._iter_compiled(
+            template_dir, ProStructure.pairs(pro_index, str(pro_type)),
+            str(pro_name), timing
+        )
+
+    @classmethod
+    def _cache(cls) -> TemplateCache:
+        '''
+            Gets shared cache, created on first use (not at import, its
+            parameter check is costly for fast-start).
+
+            :return: Compiled templates shared by all readers
+            :rtype: <TemplateCache>
+            :exceptions: None
+        '''
+        with cls._CACHE_LOCK:
+            if cls._CACHE is None:
+                cls._CACHE = TemplateCache()
+            return cls._CACHE
+
+    def _iter_compiled(
+        self,
+        template_dir: str,
+        pairs: Optional[List[Tuple[str, str]]],
+        pro_name: str,
+        timing: Optional[GenTiming] = None
+    ) -> Iterator[Tuple[str, Template]]:
+        '''
+            Yields compiled templates from cache.
+
+            :param template_dir: Directory with templates
+            :type template_dir: <str>
+            :param pairs: Module and template names | None (unknown type)
+            :type pairs: <Optional[List[Tuple[str, str]]]>
+            :param pro_name: LKM name
+            :type pro_name: <str>
+            :param timing: Records read duration per module | None
+            :type timing: <Optional[GenTiming]>
+            :return: Iterator of module names and compiled templates
+            :rtype: <Iterator[Tuple[str, Template]]>
+            :exceptions: OSError
+        '''
+        for module, template in pairs or []:
+            start: float = perf_counter()
+            compiled, hit = self._cache().get(f'{template_dir}{template}')
+            if timing is not None:
+                timing.add(
+                    'read', perf_counter() - start, f'{pro_name}/{module}'
+                )
+            if hit:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+            yield module, compiled
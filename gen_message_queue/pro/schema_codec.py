@@ -0,0 +1,205 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    schema_codec.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class SchemaCodec with attribute(s) and method(s).
+    Renders typed message codecs (C structs, Python decoder) of schema.
+'''
+
+from typing import Any, List, Dict, Tuple
+from os.path import dirname, realpath
+from string import Template
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class SchemaCodec:
+    '''
+        Defines class SchemaCodec with attribute(s) and method(s).
+        Renders typed message codecs (C structs, Python decoder) of schema.
+
+        Snippets (conf/template/schema) are filled with message types
+        (safe substitution), project placeholders (PRO, YEAR) are kept
+        for writer, so rendered modules are written as other templates.
+
+        It defines:
+
+            :attributes:
+                | _SCHEMA_DIR - Directory of codec snippets.
+                | BACKENDS - Project types with typed message codecs.
+                | TYPES - C type, struct format, size and Python type.
+                | _backend - Project type (posix | sysv).
+                | _messages - Checked message types (MessageSchema).
+            :methods:
+                | __init__ - Initials SchemaCodec constructor.
+                | header - Renders C header (structs, prototypes).
+                | source - Renders C source (send and receive).
+                | decoder - Renders Python decoder module.
+                | _snippet - Reads codec snippet.
+                | _values - Gets snippet values of message type.
+    '''
+
+    _SCHEMA_DIR: str = '/../conf/template/schema'
+    BACKENDS: Tuple[str, ...] = ('posix', 'sysv')
+    TYPES: Dict[str, Tuple[str, str, int, str]] = {
+        'bool': ('bool', '?', 1, 'bool'),
+        'char': ('char', 'c', 1, 'bytes'),
+        'int8': ('int8_t', 'b', 1, 'int'),
+        'uint8': ('uint8_t', 'B', 1, 'int'),
+        'int16': ('int16_t', 'h', 2, 'int'),
+        'uint16': ('uint16_t', 'H', 2, 'int'),
+        'int32': ('int32_t', 'i', 4, 'int'),
+        'uint32': ('uint32_t', 'I', 4, 'int'),
+        'int64': ('int64_t', 'q', 8, 'int'),
+        'uint64': ('uint64_t', 'Q', 8, 'int'),
+        'float32': ('float', 'f', 4, 'float'),
+        'float64': ('double', 'd', 8, 'float')
+    }
+
+    def __init__(self, backend: str, messages: List[Dict[str, Any]]) -> None:
+        '''
+            Initials SchemaCodec constructor.
+
+            :param backend: Project type (posix | sysv)
+            :type backend: <str>
+            :param messages: Checked message types (MessageSchema)
+            :type messages: <List[Dict[str, Any]]>
+            :exceptions: None
+        '''
+        self._backend: str = backend
+        self._messages: List[Dict[str, Any]] = messages
+
+    def header(self) -> str:
+        '''
+            Renders C header (structs, message ids, prototypes).
+
+            :return: Header content (project placeholders kept)
+            :rtype: <str>
+            :exceptions: OSError
+        '''
+        struct: Template = self._snippet('mq_message')
+        api: Template = self._snippet(f'mq_{self._backend}_message')
+        messages: str = ''
+        for message in self._messages:
+            values: Dict[str, str] = self._values(message)
+            values['members'] = '\n'.join(
+                f'    {self.TYPES[field_type][0]} {field}'
+                f'{f"[{count}]" if count else ""};'
+                for field, field_type, count in message['fields']
+            )
+            messages += '\n' + struct.safe_substitute(values)
+            messages += api.safe_substitute(values)
+        return self._snippet('mq_messages_h').safe_substitute(
+            module=f'mq_{self._backend}_messages.h', messages=messages,
+            backend=self._backend, backend_upper=self._backend.upper()
+        )
+
+    def source(self) -> str:
+        '''
+            Renders C source (open, send and receive of message types).
+
+            :return: Source content (project placeholders kept)
+            :rtype: <str>
+            :exceptions: OSError
+        '''
+        body: Template = self._snippet(f'mq_{self._backend}_message_body')
+        return self._snippet('mq_messages_c').safe_substitute(
+            module=f'mq_{self._backend}_messages.c', backend=self._backend,
+            messages=''.join(
+                body.safe_substitute(self._values(message))
+                for message in self._messages
+            )
+        )
+
+    def decoder(self) -> str:
+        '''
+            Renders Python decoder module (NamedTuple and Struct by type).
+
+            :return: Module content (project placeholders kept)
+            :rtype: <str>
+            :exceptions: OSError
+        '''
+        snippet: Template = self._snippet('mq_message_py')
+        layouts: str = ''
+        messages: str = ''
+        registry: str = ''
+        for message in self._messages:
+            values: Dict[str, str] = self._values(message)
+            layout: str = ''.join(
+                f'{count}s' if count else self.TYPES[field_type][1]
+                for _, field_type, count in message['fields']
+            )
+            layouts += f'\n{values["upper"]}_ID: int = {message["id"]}'
+            layouts += (
+                f"\n{values['upper']}_LAYOUT: Struct = Struct('={layout}')"
+            )
+            registry += f'\n    {values["upper"]}_ID: {values["class_name"]},'
+            values['fields'] = '\n'.join(
+                f'    {field}: '
+                f'{"bytes" if count else self.TYPES[field_type][3]}'
+                for field, field_type, count in message['fields']
+            )
+            values['attributes'] = '\n'.join(
+                f'                | {field} - {field_type}'
+                f'{f"[{count}]" if count else ""}.'
+                for field, field_type, count in message['fields']
+            )
+            messages += snippet.safe_substitute(values)
+        return self._snippet('mq_messages_py').safe_substitute(
+            backend=self._backend, layouts=layouts, messages=messages,
+            registry=registry
+        )
+
+    def _snippet(self, name: str) -> Template:
+        '''
+            Reads codec snippet.
+
+            :param name: Snippet name (without extension)
+            :type name: <str>
+            :return: Snippet as template
+            :rtype: <Template>
+            :exceptions: OSError
+        '''
+        path: str = f'{dirname(realpath(__file__))}{self._SCHEMA_DIR}'
+        with open(f'{path}/{name}.template', 'r', encoding='utf-8') as snippet:
+            return Template(snippet.read())
+
+    @staticmethod
+    def _values(message: Dict[str, Any]) -> Dict[str, str]:
+        '''
+            Gets snippet values of message type.
+
+            :param message: Checked message type (MessageSchema)
+            :type message: <Dict[str, Any]>
+            :return: Values for snippet placeholders
+            :rtype: <Dict[str, str]>
+            :exceptions: None
+        '''
+        return {
+            'name': message['name'], 'upper': message['name'].upper(),
+            'id': str(message['id']), 'size': str(message['size']),
+            'class_name': ''.join(
+                part.capitalize() for part in message['name'].split('_')
+            ) + 'Message'
+        }
@@ -0,0 +1,232 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    template_cache.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines classes CompiledTemplate and TemplateCache.
+    Creates an in-process cache of compiled templates.
+'''
+
+import sys
+from typing import List, Tuple, Mapping, Optional
+from collections import OrderedDict
+from threading import Lock
+from string import Template
+from os import stat
+
+try:
+    from ats_utilities.checker import ATSChecker
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class CompiledTemplate(Template):
+    '''
+        Defines class CompiledTemplate with attribute(s) and method(s).
+        Template split once into literal text and placeholder names.
+
+        It defines:
+
+            :attributes:
+                | _parts - Literals (even index) and placeholders (odd index).
+            :methods:
+                | __init__ - Initials CompiledTemplate constructor.
+                | substitute - Substitutes placeholders without re-parsing.
+    '''
+
+    def __init__(self, template: str) -> None:
+        '''
+            Initials CompiledTemplate constructor.
+
+            :param template: Template content
+            :type template: <str>
+            :exceptions: None
+        '''
+        super().__init__(template)
+        self._parts: Optional[List[str]] = []
+        literal: List[str] = []
+        position: int = 0
+        for match in self.pattern.finditer(template):
+            literal.append(template[position:match.start()])
+            position = match.end()
+            if match.group('escaped') is not None:
+                literal.append(self.delimiter)
+                continue
+            name: Optional[str] = match.group('named') or match.group('braced')
+            if name is None:
+                # Invalid placeholder, Template reports it on substitute
+                self._parts = None
+                return
+            self._parts.extend([''.join(literal), name])
+            literal = []
+        literal.append(template[position:])
+        self._parts.append(''.join(literal))
+
+    def substitute(
+        self,
+        mapping: Optional[Mapping[str, object]] = None,
+        /,
+        **kws: object
+    ) -> str:
+        '''
+            Substitutes placeholders without re-parsing.
+
+            :param mapping: Placeholder values | None
+            :type mapping: <Optional[Mapping[str, object]]>
+            :param kws: Placeholder values as keywords
+            :type kws: <object>
+            :return: Substituted content
+            :rtype: <str>
+            :exceptions: KeyError | ValueError
+        '''
+        if self._parts is None or kws or mapping is None:
+            return super().substitute(mapping or {}, **kws)
+        parts: List[str] = self._parts[:]
+        for index in range(1, len(parts), 2):
+            parts[index] = str(mapping[parts[index]])
+        return ''.join(parts)
+
+
+class TemplateCache(ATSChecker):
+    '''
+        Defines class TemplateCache with attribute(s) and method(s).
+        Creates an in-process cache of compiled templates.
+        Entries are keyed by path and validated by mtime and size once
+        per generation run (new_generation), later hits in same run are
+        served without I/O. Least recently used entry is evicted when
+        cache is full.
+
+        It defines:
+
+            :attributes:
+                | _MAX_SIZE - Default number of cached templates.
+                | _max_size - Number of cached templates.
+                | _entries - Cached templates by path.
+                | _generation - Current generation run.
+                | _lock - Guards cache entries.
+            :methods:
+                | __init__ - Initials TemplateCache constructor.
+                | new_generation - Starts generation run.
+                | get - Gets compiled template for path.
+                | clear - Removes all cached templates.
+                | __len__ - Number of cached templates.
+    '''
+
+    _MAX_SIZE: int = 256
+
+    def __init__(self, max_size: int = _MAX_SIZE) -> None:
+        '''
+            Initials TemplateCache constructor.
+
+            :param max_size: Number of cached templates
+            :type max_size: <int>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__()
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        error_msg, error_id = self.check_params([('int:max_size', max_size)])
+        if error_id == self.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
+        if max_size < 1:
+            raise ATSValueError('cache size must be positive')
+        self._max_size: int = max_size
+        # Entry is (mtime, size, generation of last check, template)
+        self._entries: OrderedDict[
+            str, Tuple[int, int, int, CompiledTemplate]
+        ] = OrderedDict()
+        self._generation: int = 0
+        self._lock: Lock = Lock()
+
+    def new_generation(self) -> None:
+        '''
+            Starts generation run, each cached template is checked
+            against its file (stat) on first get in run.
+
+            :exceptions: None
+        '''
+        with self._lock:
+            self._generation += 1
+
+    def get(self, template_file: str) -> Tuple[CompiledTemplate, bool]:
+        '''
+            Gets compiled template for path, file is checked (stat) only
+            on first get in generation run.
+
+            :param template_file: Template file path
+            :type template_file: <str>
+            :return: Compiled template and hit flag
+            :rtype: <Tuple[CompiledTemplate, bool]>
+            :exceptions: OSError
+        '''
+        with self._lock:
+            entry = self._entries.get(template_file)
+            if entry is not None and entry[2] == self._generation:
+                self._entries.move_to_end(template_file)
+                return entry[3], True
+        file_stat = stat(template_file)
+        with self._lock:
+            entry = self._entries.get(template_file)
+            if entry is not None and entry[:2] == (
+                file_stat.st_mtime_ns, file_stat.st_size
+            ):
+                self._entries[template_file] = (
+                    entry[0], entry[1], self._generation, entry[3]
+                )
+                self._entries.move_to_end(template_file)
+                return entry[3], True
+        with open(template_file, 'r', encoding='utf-8') as module_file:
+            template: CompiledTemplate = CompiledTemplate(module_file.read())
+        with self._lock:
+            self._entries[template_file] = (
+                file_stat.st_mtime_ns, file_stat.st_size, self._generation,
+                template
+            )
+            self._entries.move_to_end(template_file)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return template, False
+
+    def clear(self) -> None:
+        '''
+            Removes all cached templates.
+
+            :exceptions: None
+        '''
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        '''
+            Number of cached templates.
+
+            :return: Number of cached templates
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return len(self._entries)
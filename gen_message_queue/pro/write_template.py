@@ -21,9 +21,13 @@ Info
 '''
 
 import sys
-from typing import List, Dict, Optional
-from datetime import date
-from os import getcwd, chmod, mkdir
+from typing import TYPE_CHECKING, List, Dict, Deque, Tuple, Iterable
+from typing import Mapping, Optional
+from collections import deque
+from errno import EEXIST
+from os import getcwd, chmod, mkdir, rename, strerror, urandom
+from time import perf_counter
+from os.path import exists, splitext
 from string import Template
 
 try:
@@ -31,10 +35,16 @@ try:
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.gen_timing import GenTiming
+    from gen_message_queue.pro.gen_params import GenParams
 except ImportError as ats_error_message:  # pragma: no cover
     # Force exit python #######################################################
     sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
 
+if TYPE_CHECKING:
+    # Worker pool (and rmtree) are loaded only when used (fast-start)
+    from concurrent.futures import Future
+
 __author__: str = 'Vladimir Roncevic'
 __copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
 __credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
@@ -49,17 +59,26 @@ class WriteTemplate(FileCheck):
     '''
         Defines class WriteTemplate with attribute(s) and method(s).
         Creates an API for write a template content with parameters to a file.
+        Modules are written into staging directory (optionally by pool of
+        threads) and staging directory is renamed to project directory
+        after all modules pass validation. Modules can be streamed, with
+        bounded number of modules in flight (back-pressure on producer).
 
         It defines:
 
             :attributes:
                 | _GEN_VERBOSE - Console text indicator for process-phase.
+                | _STAGING - Prefix for staging directory name.
             :methods:
                 | __init__ - Initials WriteTemplate constructor.
                 | write - write a template content with parameters to a file.
+                | write_stream - Writes modules as they are produced.
+                | check_module - Checks written module (path, format).
+                | _write_module - Writes and checks one module.
     '''
 
     _GEN_VERBOSE: str = 'GEN_MESSAGE_QUEUE::PRO::WRITE_TEMPLATE'
+    _STAGING: str = '.staging'
 
     def __init__(self, verbose: bool = False) -> None:
         '''
@@ -74,61 +93,207 @@ class WriteTemplate(FileCheck):
 
     def write(
         self,
-        template_content: Dict[str, str],
+        template_content: Mapping[str, str | Template],
         pro_name: Optional[str],
-        verbose: bool = False
+        verbose: bool = False,
+        output_dir: Optional[str] = None,
+        workers: int = 1
     ) -> bool:
         '''
             Write setup content to file.
 
-            :param template_content: Template content
-            :type template_content: <Dict[str, str]>
+            :param template_content: Template content or compiled template
+            :type template_content: <Mapping[str, str | Template]>
             :param pro_name: Project name | None
             :type pro_name: <Optional[str]>
             :param verbose: Enable/Disable verbose option
             :type verbose: <bool>
+            :param output_dir: Parent directory for project | None (cwd)
+            :type output_dir: <Optional[str]>
+            :param workers: Number of writer threads (1 writes in caller)
+            :type workers: <int>
             :return: True (success operation) | False
             :rtype: <bool>
-            :exception: ATSTypeError | ATSValueError
+            :exception: ATSTypeError | ATSValueError | OSError
         '''
         error_msg: Optional[str] = None
         error_id: Optional[int] = None
         error_msg, error_id = self.check_params([
-            ('dict:template_content', template_content),
-            ('str:pro_name', pro_name)
+            ('dict:template_content', template_content)
         ])
         if error_id == self.TYPE_ERROR:
             raise ATSTypeError(error_msg)
         if not bool(template_content):
             raise ATSValueError('missing model content')
+        return self.write_stream(
+            template_content.items(), pro_name, verbose, output_dir, workers
+        )
+
+    def write_stream(
+        self,
+        modules: Iterable[Tuple[str, str | Template]],
+        pro_name: Optional[str],
+        verbose: bool = False,
+        output_dir: Optional[str] = None,
+        workers: int = 1,
+        pending: int = 0,
+        timing: Optional[GenTiming] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> bool:
+        '''
+            Writes modules as they are produced.
+            Next module is taken from iterable only when number of modules
+            in flight is below limit, so memory does not grow with number
+            of modules and reading overlaps with writing.
+
+            :param modules: Module names with content or compiled template
+            :type modules: <Iterable[Tuple[str, str | Template]]>
+            :param pro_name: Project name | None
+            :type pro_name: <Optional[str]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param output_dir: Parent directory for project | None (cwd)
+            :type output_dir: <Optional[str]>
+            :param workers: Number of writer threads (1 writes in caller)
+            :type workers: <int>
+            :param pending: Modules in flight | 0 (twice number of workers)
+            :type pending: <int>
+            :param timing: Records durations and bytes per module | None
+            :type timing: <Optional[GenTiming]>
+            :param params: Generation parameters | None (defaults)
+            :type params: <Optional[Dict[str, str]]>
+            :return: True (success operation) | False
+            :rtype: <bool>
+            :exception: ATSTypeError | ATSValueError | OSError
+        '''
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        error_msg, error_id = self.check_params([
+            ('str:pro_name', pro_name),
+            ('int:workers', workers),
+            ('int:pending', pending)
+        ])
+        if error_id == self.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
         if not bool(pro_name):
             raise ATSValueError('missing model name')
-        all_stat: List[bool] = []
-        num_of_modules: int = len(template_content)
-        module_pro_dir: str = f'{getcwd()}/{pro_name}/'
-        mkdir(module_pro_dir)
-        for module_name, module_content in template_content.items():
-            module_path: str = f'{module_pro_dir}{module_name}'
-            template: Template = Template(module_content)
-            with open(module_path, 'w', encoding='utf-8') as module_file:
-                module_file.write(template.substitute({
-                    'PRO': pro_name, 'YEAR': f'{date.today().year}'
-                }))
-                chmod(module_path, 0o644)
-                self.check_path(module_path, verbose)
-                self.check_mode('w', verbose)
-                if 'makefile'.capitalize() in module_path:
-                    self.check_format(
-                        module_path, 'makefile', verbose
-                    )
-                else:
-                    self.check_format(
-                        module_path, module_path.split('.')[1], verbose
-                    )
-                if self.is_file_ok():
-                    all_stat.append(True)
-                else:
-                    all_stat.append(False)
-        return all([
-            bool(all_stat), all(all_stat), num_of_modules == len(all_stat)
+        if workers < 1:
+            raise ATSValueError('number of workers must be positive')
+        if pending < 0:
+            raise ATSValueError('number of pending modules is negative')
+        values: Dict[str, str] = GenParams.values(str(pro_name), params)
+        parent_dir: str = output_dir or getcwd()
+        module_pro_dir: str = f'{parent_dir}/{pro_name}'
+        if exists(module_pro_dir):
+            raise FileExistsError(EEXIST, strerror(EEXIST), module_pro_dir)
+        staging_dir: str = '.'.join([
+            f'{parent_dir}/{self._STAGING}', str(pro_name), urandom(4).hex()
         ])
+        mkdir(staging_dir)
+        all_stat: List[bool] = []
+        status: bool = False
+        try:
+            if workers == 1:
+                for module_name, module_content in modules:
+                    all_stat.append(self._write_module(
+                        staging_dir, module_name, module_content,
+                        values, verbose, timing
+                    ))
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+                in_flight: Deque[Future[bool]] = deque()
+                limit: int = pending or 2 * workers
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for module_name, module_content in modules:
+                        if len(in_flight) >= limit:
+                            all_stat.append(in_flight.popleft().result())
+                        in_flight.append(pool.submit(
+                            self._write_module, staging_dir, module_name,
+                            module_content, values, verbose, timing
+                        ))
+                    while in_flight:
+                        all_stat.append(in_flight.popleft().result())
+            status = bool(all_stat) and all(all_stat)
+            if status:
+                rename(staging_dir, module_pro_dir)
+        finally:
+            if exists(staging_dir):
+                from shutil import rmtree
+                rmtree(staging_dir)
+        return status
+
+    @staticmethod
+    def check_module(
+        module_path: str, module_name: str, verbose: bool = False
+    ) -> bool:
+        '''
+            Checks written module (path, mode, format by module name).
+
+            :param module_path: Path of written module
+            :type module_path: <str>
+            :param module_name: Module file name (selects format)
+            :type module_name: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: True (module is checked) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        # Checker keeps state, each module (thread) uses own checker
+        checker: FileCheck = FileCheck(verbose)
+        checker.check_path(module_path, verbose)
+        checker.check_mode('w', verbose)
+        if 'makefile'.capitalize() in module_name:
+            checker.check_format(module_path, 'makefile', verbose)
+        else:
+            checker.check_format(
+                module_path, splitext(module_name)[1].lstrip('.'), verbose
+            )
+        return checker.is_file_ok()
+
+    def _write_module(
+        self,
+        module_dir: str,
+        module_name: str,
+        module_content: str | Template,
+        values: Dict[str, str],
+        verbose: bool = False,
+        timing: Optional[GenTiming] = None
+    ) -> bool:
+        '''
+            Writes and checks one module.
+
+            :param module_dir: Directory for module
+            :type module_dir: <str>
+            :param module_name: Module file name
+            :type module_name: <str>
+            :param module_content: Template content or compiled template
+            :type module_content: <str | Template>
+            :param values: Values for template placeholders
+            :type values: <Dict[str, str]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param timing: Records durations and bytes | None
+            :type timing: <Optional[GenTiming]>
+            :return: True (module is written and checked) | False
+            :rtype: <bool>
+            :exception: OSError
+        '''
+        module_path: str = f'{module_dir}/{module_name}'
+        template: Template = module_content if isinstance(
+            module_content, Template
+        ) else Template(module_content)
+        start: float = perf_counter()
+        content: bytes = template.substitute(values).encode('utf-8')
+        substituted: float = perf_counter()
+        with open(module_path, 'wb') as module_file:
+            module_file.write(content)
+        chmod(module_path, 0o644)
+        written: float = perf_counter()
+        checked: bool = self.check_module(module_path, module_name, verbose)
+        if timing is not None:
+            key: str = f'{values["PRO"]}/{module_name}'
+            timing.add('substitute', substituted - start, key)
+            timing.add('write', written - substituted, key, len(content))
+            timing.add('check', perf_counter() - written, key)
+        return checked
@@ -0,0 +1,299 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    queue_monitor.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class QueueMonitor with attribute(s) and method(s).
+    Samples live message queues of host, computes depth and rates.
+'''
+
+import ctypes
+import sys
+from typing import Any, List, Dict, Optional, TextIO
+from ctypes.util import find_library
+from json import dumps
+from os import O_NONBLOCK, O_RDONLY, listdir
+from os.path import join
+from time import monotonic, sleep, time
+
+try:
+    from gen_message_queue.metrics_reader import MetricsReader
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+Sample = Dict[str, Dict[str, Any]]
+
+
+class QueueMonitor:
+    '''
+        Defines class QueueMonitor with attribute(s) and method(s).
+        Samples live message queues of host, computes depth and rates.
+
+        POSIX queues are read from /dev/mqueue (QSIZE, bytes in queue),
+        depth is read with mq_getattr (queue is opened O_RDONLY, nothing
+        is received, depth is unknown without read permission). System V
+        queues are read from /proc/sysvipc/msg (qnum, cbytes). Kernel has
+        no send and receive counters, net rate is depth change per second,
+        send and receive rates are read from metrics segment (-o metrics)
+        when it is given (System V queue is matched by key, 0x%08x).
+
+        It defines:
+
+            :attributes:
+                | MQUEUE_DIR - Mount point of POSIX message queues.
+                | SYSVIPC - Proc file of System V message queues.
+                | COLUMNS - Table columns (header and row key).
+                | _mqueue_dir - Mount point of POSIX message queues.
+                | _sysvipc - Proc file of System V message queues.
+                | _metrics - Metrics segment reader | None.
+                | _libc - C library with mq_open and mq_getattr | None.
+            :methods:
+                | __init__ - Initials QueueMonitor constructor.
+                | sample - Samples depth and bytes of all queues.
+                | rates - Gets rows with depth and rates between samples.
+                | format_rows - Formats rows as table or JSON lines.
+                | run - Samples queues at interval and prints rows.
+    '''
+
+    MQUEUE_DIR: str = '/dev/mqueue'
+    SYSVIPC: str = '/proc/sysvipc/msg'
+    COLUMNS: List[str] = [
+        'backend', 'queue', 'depth', 'bytes', 'net_rate', 'send_rate',
+        'receive_rate'
+    ]
+
+    def __init__(
+        self,
+        mqueue_dir: Optional[str] = None,
+        sysvipc: Optional[str] = None,
+        metrics: Optional[str] = None
+    ) -> None:
+        '''
+            Initials QueueMonitor constructor.
+
+            :param mqueue_dir: POSIX queues mount point | None (/dev/mqueue)
+            :type mqueue_dir: <Optional[str]>
+            :param sysvipc: System V queues proc file | None
+            :type sysvipc: <Optional[str]>
+            :param metrics: Metrics segment name (/pro.metrics) | None
+            :type metrics: <Optional[str]>
+            :exceptions: None
+        '''
+        self._mqueue_dir: str = mqueue_dir or self.MQUEUE_DIR
+        self._sysvipc: str = sysvipc or self.SYSVIPC
+        self._metrics: Optional[MetricsReader] = (
+            MetricsReader(metrics) if metrics else None
+        )
+        self._libc: Optional[ctypes.CDLL] = None
+        for library in (None, find_library('rt')):
+            try:
+                libc: ctypes.CDLL = ctypes.CDLL(library, use_errno=True)
+            except OSError:
+                continue
+            if hasattr(libc, 'mq_getattr'):
+                self._libc = libc
+                break
+
+    def _posix_depth(self, name: str) -> Optional[int]:
+        '''
+            Gets depth of POSIX queue (mq_curmsgs).
+
+            :param name: Message queue name (/name)
+            :type name: <str>
+            :return: Number of messages | None (not permitted)
+            :rtype: <Optional[int]>
+            :exceptions: None
+        '''
+        if self._libc is None:
+            return None
+        attr = (ctypes.c_long * 8)()
+        mqd: int = self._libc.mq_open(name.encode(), O_RDONLY | O_NONBLOCK)
+        if mqd < 0:
+            return None
+        status: int = self._libc.mq_getattr(mqd, attr)
+        self._libc.mq_close(mqd)
+        return int(attr[3]) if status == 0 else None
+
+    def sample(self) -> Sample:
+        '''
+            Samples depth and bytes of all queues (missing source is
+            skipped, host may not mount /dev/mqueue).
+
+            :return: Queues by backend:queue (with metrics counters)
+            :rtype: <Sample>
+            :exceptions: None
+        '''
+        queues: Sample = {}
+        try:
+            names: List[str] = sorted(listdir(self._mqueue_dir))
+        except OSError:
+            names = []
+        for name in names:
+            try:
+                with open(join(self._mqueue_dir, name), 'rb') as mq:
+                    fields: Dict[bytes, bytes] = dict(
+                        field.split(b':', 1) for field in mq.read().split()
+                    )
+            except (OSError, ValueError):
+                continue
+            queues[f'posix:/{name}'] = {
+                'backend': 'posix', 'queue': f'/{name}',
+                'depth': self._posix_depth(f'/{name}'),
+                'bytes': int(fields.get(b'QSIZE', b'0'))
+            }
+        try:
+            with open(self._sysvipc, encoding='utf-8') as proc:
+                rows: List[List[str]] = [line.split() for line in proc][1:]
+        except OSError:
+            rows = []
+        for row in rows:
+            if len(row) < 5:
+                continue
+            key: str = f'0x{int(row[0]) & 0xffffffff:08x}'
+            queue: str = key if int(row[0]) else f'{key}/{row[1]}'
+            queues[f'sysv:{queue}'] = {
+                'backend': 'sysv', 'queue': queue,
+                'depth': int(row[4]), 'bytes': int(row[3])
+            }
+        if self._metrics is not None:
+            try:
+                counters: Dict[str, Any] = self._metrics.read()['queues']
+            except (OSError, ValueError):
+                counters = {}
+            for item in queues.values():
+                item['metrics'] = counters.get(item['queue'])
+        return queues
+
+    @staticmethod
+    def rates(
+        previous: Sample, current: Sample, seconds: float
+    ) -> List[Dict[str, Any]]:
+        '''
+            Gets rows with depth and rates between samples.
+
+            :param previous: Earlier sample
+            :type previous: <Sample>
+            :param current: Later sample
+            :type current: <Sample>
+            :param seconds: Time between samples
+            :type seconds: <float>
+            :return: Rows (depth, bytes in flight, rates per second)
+            :rtype: <List[Dict[str, Any]]>
+            :exceptions: None
+        '''
+        rows: List[Dict[str, Any]] = []
+        for name, item in current.items():
+            before: Dict[str, Any] = previous.get(name, {})
+            row: Dict[str, Any] = {
+                'backend': item['backend'], 'queue': item['queue'],
+                'depth': item['depth'], 'bytes': item['bytes'],
+                'net_rate': None, 'send_rate': None, 'receive_rate': None
+            }
+            if item['depth'] is not None and before.get('depth') is not None:
+                row['net_rate'] = (item['depth'] - before['depth']) / seconds
+            if item.get('metrics') and before.get('metrics'):
+                for rate, counter in (
+                    ('send_rate', 'send_messages'),
+                    ('receive_rate', 'receive_messages')
+                ):
+                    row[rate] = (
+                        item['metrics'][counter] - before['metrics'][counter]
+                    ) / seconds
+            rows.append(row)
+        return rows
+
+    @classmethod
+    def format_rows(
+        cls, rows: List[Dict[str, Any]], output_format: str = 'table'
+    ) -> str:
+        '''
+            Formats rows as table or JSON lines (with sample time).
+
+            :param rows: Rows (rates)
+            :type rows: <List[Dict[str, Any]]>
+            :param output_format: Output format (table | json)
+            :type output_format: <str>
+            :return: Formatted rows
+            :rtype: <str>
+            :exceptions: None
+        '''
+        if output_format == 'json':
+            now: float = round(time(), 3)
+            return '\n'.join(dumps({'time': now, **row}) for row in rows)
+        lines: List[List[str]] = [[column.upper() for column in cls.COLUMNS]]
+        for row in rows:
+            lines.append([
+                '-' if row[column] is None else
+                f'{row[column]:.1f}' if isinstance(row[column], float)
+                else str(row[column]) for column in cls.COLUMNS
+            ])
+        widths: List[int] = [max(map(len, column)) for column in zip(*lines)]
+        return '\n'.join(
+            '  '.join(
+                cell.ljust(width) if index < 2 else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(line, widths))
+            ).rstrip() for line in lines
+        )
+
+    def run(
+        self,
+        interval: float = 1.0,
+        samples: int = 0,
+        output_format: str = 'table',
+        stream: Optional[TextIO] = None
+    ) -> int:
+        '''
+            Samples queues at interval and prints rows after each sample.
+
+            :param interval: Seconds between samples
+            :type interval: <float>
+            :param samples: Number of printed samples | 0 (until interrupt)
+            :type samples: <int>
+            :param output_format: Output format (table | json)
+            :type output_format: <str>
+            :param stream: Output stream | None (stdout)
+            :type stream: <Optional[TextIO]>
+            :return: Number of printed samples
+            :rtype: <int>
+            :exceptions: None
+        '''
+        out: TextIO = stream or sys.stdout
+        previous: Sample = self.sample()
+        started: float = monotonic()
+        printed: int = 0
+        while samples <= 0 or printed < samples:
+            sleep(interval)
+            current: Sample = self.sample()
+            now: float = monotonic()
+            text: str = self.format_rows(
+                self.rates(previous, current, max(now - started, 1e-9)),
+                output_format
+            )
+            if text:
+                out.write(text + ('\n' if output_format == 'json' else '\n\n'))
+                out.flush()
+            previous, started, printed = current, now, printed + 1
+        return printed
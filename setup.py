@@ -70,24 +70,94 @@ setup(
             f'{CONF}/gen_message_queue.cfg',
             f'{CONF}/gen_message_queue_util.cfg',
             f'{CONF}/project.yaml',
+            f'{TEMPLATE}/posix/Makefile.template',
             f'{TEMPLATE}/posix/mq_posix.template',
+            f'{TEMPLATE}/posix/mq_posix_aio.template',
+            f'{TEMPLATE}/posix/mq_posix_benchmark.template',
             f'{TEMPLATE}/posix/mq_posix_close.template',
+            f'{TEMPLATE}/posix/mq_posix_event_loop.template',
+            f'{TEMPLATE}/posix/mq_posix_event_loop_add.template',
+            f'{TEMPLATE}/posix/mq_posix_event_loop_destroy.template',
+            f'{TEMPLATE}/posix/mq_posix_event_loop_dispatch.template',
+            f'{TEMPLATE}/posix/mq_posix_event_loop_init.template',
+            f'{TEMPLATE}/posix/mq_posix_event_loop_remove.template',
+            f'{TEMPLATE}/posix/mq_posix_event_loop_run.template',
             f'{TEMPLATE}/posix/mq_posix_fatal_error.template',
+            f'{TEMPLATE}/posix/mq_posix_group.template',
+            f'{TEMPLATE}/posix/mq_posix_group_close.template',
+            f'{TEMPLATE}/posix/mq_posix_group_open.template',
+            f'{TEMPLATE}/posix/mq_posix_group_receive.template',
+            f'{TEMPLATE}/posix/mq_posix_group_send.template',
+            f'{TEMPLATE}/posix/mq_posix_metrics.template',
+            f'{TEMPLATE}/posix/mq_posix_metrics_open.template',
+            f'{TEMPLATE}/posix/mq_posix_metrics_send.template',
             f'{TEMPLATE}/posix/mq_posix_open.template',
             f'{TEMPLATE}/posix/mq_posix_open_mode.template',
             f'{TEMPLATE}/posix/mq_posix_receive.template',
+            f'{TEMPLATE}/posix/mq_posix_receive_batch.template',
+            f'{TEMPLATE}/posix/mq_posix_registry.template',
+            f'{TEMPLATE}/posix/mq_posix_registry_buffer.template',
+            f'{TEMPLATE}/posix/mq_posix_registry_init.template',
+            f'{TEMPLATE}/posix/mq_posix_registry_open.template',
             f'{TEMPLATE}/posix/mq_posix_send.template',
+            f'{TEMPLATE}/posix/mq_posix_send_batch.template',
+            f'{TEMPLATE}/posix/mq_posix_sizing.template',
+            f'{TEMPLATE}/posix/mq_posix_sizing_attr.template',
+            f'{TEMPLATE}/posix/mq_posix_sizing_report.template',
+            f'{TEMPLATE}/posix/mq_posix_timedreceive.template',
+            f'{TEMPLATE}/posix/mq_posix_timedsend.template',
             f'{TEMPLATE}/posix/mq_posix_unlink.template',
+            f'{TEMPLATE}/posix/mq_posix_worker_pool.template',
+            f'{TEMPLATE}/posix/mq_posix_worker_pool_start.template',
+            f'{TEMPLATE}/posix/mq_posix_worker_pool_stats.template',
+            f'{TEMPLATE}/posix/mq_posix_worker_pool_stop.template',
+            f'{TEMPLATE}/schema/mq_message.template',
+            f'{TEMPLATE}/schema/mq_message_py.template',
+            f'{TEMPLATE}/schema/mq_messages_c.template',
+            f'{TEMPLATE}/schema/mq_messages_h.template',
+            f'{TEMPLATE}/schema/mq_messages_py.template',
+            f'{TEMPLATE}/schema/mq_posix_message.template',
+            f'{TEMPLATE}/schema/mq_posix_message_body.template',
+            f'{TEMPLATE}/schema/mq_sysv_message.template',
+            f'{TEMPLATE}/schema/mq_sysv_message_body.template',
+            f'{TEMPLATE}/shm/Makefile.template',
+            f'{TEMPLATE}/shm/mq_shm.template',
+            f'{TEMPLATE}/shm/mq_shm_benchmark.template',
+            f'{TEMPLATE}/shm/mq_shm_close.template',
+            f'{TEMPLATE}/shm/mq_shm_create.template',
+            f'{TEMPLATE}/shm/mq_shm_open.template',
+            f'{TEMPLATE}/shm/mq_shm_receive.template',
+            f'{TEMPLATE}/shm/mq_shm_send.template',
+            f'{TEMPLATE}/sysv/Makefile.template',
             f'{TEMPLATE}/sysv/mq_sysv.template',
+            f'{TEMPLATE}/sysv/mq_sysv_benchmark.template',
             f'{TEMPLATE}/sysv/mq_sysv_control.template',
             f'{TEMPLATE}/sysv/mq_sysv_file_to_key.template',
             f'{TEMPLATE}/sysv/mq_sysv_get_buffer.template',
             f'{TEMPLATE}/sysv/mq_sysv_get_buffer_type.template',
+            f'{TEMPLATE}/sysv/mq_sysv_group.template',
+            f'{TEMPLATE}/sysv/mq_sysv_group_open.template',
+            f'{TEMPLATE}/sysv/mq_sysv_group_receive.template',
+            f'{TEMPLATE}/sysv/mq_sysv_group_send.template',
             f'{TEMPLATE}/sysv/mq_sysv_key_to_id.template',
+            f'{TEMPLATE}/sysv/mq_sysv_metrics.template',
+            f'{TEMPLATE}/sysv/mq_sysv_metrics_open.template',
+            f'{TEMPLATE}/sysv/mq_sysv_metrics_send.template',
+            f'{TEMPLATE}/sysv/mq_sysv_pool_acquire.template',
+            f'{TEMPLATE}/sysv/mq_sysv_pool_create.template',
+            f'{TEMPLATE}/sysv/mq_sysv_pool_receive.template',
+            f'{TEMPLATE}/sysv/mq_sysv_pool_send.template',
             f'{TEMPLATE}/sysv/mq_sysv_receive.template',
             f'{TEMPLATE}/sysv/mq_sysv_send.template',
             f'{TEMPLATE}/sysv/mq_sysv_set_buffer.template',
             f'{TEMPLATE}/sysv/mq_sysv_set_buffer_type.template',
+            f'{TEMPLATE}/sysv/mq_sysv_sizing.template',
+            f'{TEMPLATE}/sysv/mq_sysv_sizing_attr.template',
+            f'{TEMPLATE}/sysv/mq_sysv_sizing_report.template',
+            f'{TEMPLATE}/sysv/mq_sysv_worker_pool.template',
+            f'{TEMPLATE}/sysv/mq_sysv_worker_pool_start.template',
+            f'{TEMPLATE}/sysv/mq_sysv_worker_pool_stats.template',
+            f'{TEMPLATE}/sysv/mq_sysv_worker_pool_stop.template',
             f'{LOG}/gen_message_queue.log'
         ]
     },
@@ -0,0 +1,119 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    archive_write_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ArchiveWriteTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of ArchiveWrite.
+Execute
+    python3 -m unittest -v archive_write_test
+'''
+
+import sys
+from typing import List, Dict
+from io import BytesIO
+from tarfile import open as tar_open
+from zipfile import ZipFile
+from unittest import TestCase, main
+
+try:
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.archive_write import ArchiveWrite
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ArchiveWriteTestCase(TestCase):
+    '''
+        Defines class ArchiveWriteTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of ArchiveWrite.
+        ArchiveWrite unit tests.
+
+        It defines:
+
+            :attributes:
+                | _MODULES - Module contents.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_archive_name_none - Test name None.
+                | test_archive_format - Test unsupported format.
+                | test_archive_render - Test render to bytes.
+                | test_archive_tar - Test tar stream.
+                | test_archive_zip - Test zip stream.
+    '''
+
+    _MODULES: Dict[str, str] = {
+        'mq.h': '// ${PRO} ${YEAR}\n', 'mq.c': '#include "mq.h"\n'
+    }
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_archive_name_none(self) -> None:
+        '''Test name None'''
+        with self.assertRaises(ATSTypeError):
+            ArchiveWrite().render(self._MODULES.items(), None)
+
+    def test_archive_format(self) -> None:
+        '''Test unsupported format'''
+        stream: BytesIO = BytesIO()
+        with self.assertRaises(ATSValueError):
+            ArchiveWrite().write(self._MODULES.items(), 'pro', stream, 'rar')
+        self.assertEqual(stream.getvalue(), b'')
+
+    def test_archive_render(self) -> None:
+        '''Test render to bytes'''
+        rendered: Dict[str, bytes] = ArchiveWrite().render(
+            self._MODULES.items(), 'pro'
+        )
+        self.assertEqual(sorted(rendered), ['pro/mq.c', 'pro/mq.h'])
+        self.assertTrue(rendered['pro/mq.h'].startswith(b'// pro '))
+
+    def test_archive_tar(self) -> None:
+        '''Test tar stream'''
+        stream: BytesIO = BytesIO()
+        self.assertEqual(
+            ArchiveWrite().write(self._MODULES.items(), 'pro', stream), 2
+        )
+        stream.seek(0)
+        with tar_open(fileobj=stream, mode='r') as tar:
+            self.assertEqual(sorted(tar.getnames()), ['pro/mq.c', 'pro/mq.h'])
+
+    def test_archive_zip(self) -> None:
+        '''Test zip stream'''
+        stream: BytesIO = BytesIO()
+        ArchiveWrite().write(self._MODULES.items(), 'pro', stream, 'zip')
+        with ZipFile(stream) as archive:
+            self.assertEqual(archive.read('pro/mq.c'), b'#include "mq.h"\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    batch_manifest_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class BatchManifestTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of BatchManifest.
+Execute
+    python3 -m unittest -v batch_manifest_test
+'''
+
+import sys
+from typing import List, Dict
+from os.path import dirname, realpath
+from unittest import TestCase, main
+
+try:
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.batch_manifest import BatchManifest
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class BatchManifestTestCase(TestCase):
+    '''
+        Defines class BatchManifestTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of BatchManifest.
+        BatchManifest unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_manifest_create - Test manifest create.
+                | test_manifest_empty - Test manifest empty path.
+                | test_manifest_none - Test manifest None path.
+                | test_manifest_wrong_format - Test manifest wrong format.
+                | test_manifest_load - Test manifest load.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_manifest_create(self) -> None:
+        '''Test manifest create'''
+        manifest = BatchManifest()
+        self.assertIsNotNone(manifest)
+
+    def test_manifest_empty(self) -> None:
+        '''Test manifest empty path'''
+        manifest = BatchManifest()
+        with self.assertRaises(ATSValueError):
+            manifest.load('')
+
+    def test_manifest_none(self) -> None:
+        '''Test manifest None path'''
+        manifest = BatchManifest()
+        with self.assertRaises(ATSTypeError):
+            manifest.load(None)
+
+    def test_manifest_wrong_format(self) -> None:
+        '''Test manifest wrong format'''
+        manifest = BatchManifest()
+        with self.assertRaises(ATSValueError):
+            manifest.load(realpath(__file__))
+
+    def test_manifest_load(self) -> None:
+        '''Test manifest load'''
+        manifest = BatchManifest()
+        current_dir: str = dirname(realpath(__file__))
+        entries: List[Dict[str, str]] = manifest.load(
+            f'{current_dir}/batch_manifest.yaml'
+        )
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0]['name'], 'batch_posix')
+        self.assertEqual(entries[1]['type'], 'sysv')
+        self.assertTrue(entries[0]['output'].endswith('batch_out'))
+
+
+if __name__ == '__main__':
+    main()
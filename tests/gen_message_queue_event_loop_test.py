@@ -0,0 +1,255 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gen_message_queue_event_loop_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MessageQueueEventLoopTestCase with attribute(s) and
+    method(s).
+    Creates test cases for checking POSIX event loop of MessageQueue.
+Execute
+    python3 -m unittest -v gen_message_queue_event_loop_test
+'''
+
+import sys
+from typing import List, Dict
+from glob import glob
+from os import getpid
+from os.path import join
+from shutil import which
+from subprocess import run
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main, skipUnless
+
+try:
+    from gen_message_queue.pro import MessageQueue
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+EVENT_LOOP: str = r'''
+#include <pthread.h>
+#include "mq_posix_event_loop.h"
+
+static size_t handled;
+
+static void on_batch(
+    mqd_t mq_descriptor, const char * buffer, size_t message_size,
+    const size_t * message_lengths, const unsigned int * message_priorities,
+    size_t message_count, void * context
+)
+{
+    (void) mq_descriptor;
+    (void) buffer;
+    (void) message_size;
+    (void) message_lengths;
+    (void) message_priorities;
+    (void) context;
+    handled += message_count;
+}
+
+static void on_remove(
+    mqd_t mq_descriptor, const char * buffer, size_t message_size,
+    const size_t * message_lengths, const unsigned int * message_priorities,
+    size_t message_count, void * context
+)
+{
+    on_batch(
+        mq_descriptor, buffer, message_size, message_lengths,
+        message_priorities, message_count, NULL
+    );
+    mq_posix_event_loop_remove(context, mq_descriptor);
+}
+
+static void * stop_loop(void * loop)
+{
+    struct timespec delay = {0, 50000000};
+
+    nanosleep(&delay, NULL);
+    mq_posix_event_loop_stop(loop);
+    return NULL;
+}
+
+int main(void)
+{
+    struct mq_attr attr = {.mq_maxmsg = 10, .mq_msgsize = 64};
+    mq_posix_event_loop loop;
+    pthread_t thread;
+    mqd_t reader, writer;
+    int index;
+
+    mq_unlink(NAME);
+    reader = mq_open(NAME, O_RDONLY | O_CREAT, 0600, &attr);
+    writer = mq_open(NAME, O_WRONLY);
+    mq_unlink(NAME);
+
+    if (
+        reader == MQ_POSIX_ERROR || writer == MQ_POSIX_ERROR ||
+        mq_posix_event_loop_init(&loop, 2) != 0 ||
+        mq_posix_event_loop_add(&loop, reader, on_batch, NULL) != 0
+    )
+    {
+        return 1;
+    }
+
+    for (index = 0; index < 10; index++)
+    {
+        mq_send(writer, "m", 1, 0);
+    }
+
+    /* Two batches of two messages per wakeup, rest on next wakeups */
+    if (
+        mq_posix_event_loop_dispatch(&loop, 0) != 4 ||
+        mq_posix_event_loop_dispatch(&loop, 0) != 4 ||
+        mq_posix_event_loop_dispatch(&loop, 0) != 2 || handled != 10
+    )
+    {
+        return 2;
+    }
+
+    /* Run waits without timeout, stop wakes it through eventfd */
+    pthread_create(&thread, NULL, stop_loop, &loop);
+
+    if (mq_posix_event_loop_run(&loop) != 0)
+    {
+        return 3;
+    }
+
+    pthread_join(thread, NULL);
+
+    /* Callback removes own queue, entry is freed after dispatch */
+    if (
+        mq_posix_event_loop_remove(&loop, reader) != 0 ||
+        mq_posix_event_loop_add(&loop, reader, on_remove, &loop) != 0
+    )
+    {
+        return 4;
+    }
+
+    for (index = 0; index < 4; index++)
+    {
+        mq_send(writer, "m", 1, 0);
+    }
+
+    if (
+        mq_posix_event_loop_dispatch(&loop, 0) != 2 ||
+        loop.queue_count != 0 ||
+        mq_posix_event_loop_remove(&loop, reader) != MQ_POSIX_ERROR ||
+        errno != ENOENT
+    )
+    {
+        return 5;
+    }
+
+    /* Receive error (write only descriptor) is returned to caller */
+    if (
+        mq_posix_event_loop_add(&loop, writer, on_batch, NULL) != 0 ||
+        mq_posix_event_loop_dispatch(&loop, 0) != MQ_POSIX_ERROR ||
+        errno != EBADF
+    )
+    {
+        return 6;
+    }
+
+    mq_posix_event_loop_destroy(&loop);
+    return 0;
+}
+'''
+
+
+class MessageQueueEventLoopTestCase(TestCase):
+    '''
+        Defines class MessageQueueEventLoopTestCase with attribute(s) and
+        method(s).
+        Creates test cases for checking POSIX event loop of MessageQueue.
+        MessageQueue event loop unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test case.
+                | tearDown - Call after test case.
+                | test_gen_event_loop - Generate wakeup and batch cap.
+                | test_event_loop_run - Dispatch, stop, remove and errors.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_gen_event_loop(self) -> None:
+        '''Generate wakeup and batch cap'''
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive(
+            'mem_loop', 'posix+event_loop'
+        )
+        self.assertIn(
+            b'#define MQ_POSIX_EVENT_LOOP_BATCHES 16',
+            rendered['mem_loop/mq_posix_event_loop.h']
+        )
+        self.assertIn(
+            b'eventfd_write', rendered['mem_loop/mq_posix_event_loop_run.c']
+        )
+        self.assertIn(
+            b'mq_posix_event_loop_dispatch(loop, -1)',
+            rendered['mem_loop/mq_posix_event_loop_run.c']
+        )
+
+    @skipUnless(which('gcc'), 'requires gcc')
+    def test_event_loop_run(self) -> None:
+        '''Dispatch, stop, remove and errors'''
+        with TemporaryDirectory() as work_dir:
+            generator: MessageQueue = MessageQueue()
+            self.assertTrue(generator.gen_setup(
+                'mem_loop', 'posix+event_loop', output_dir=work_dir
+            ))
+            pro_dir: str = join(work_dir, 'mem_loop')
+            with open(
+                join(pro_dir, 'mem_loop.c'), 'w', encoding='utf-8'
+            ) as program:
+                program.write(EVENT_LOOP)
+            sources: List[str] = [
+                source for source in glob(join(pro_dir, '*.c'))
+                if not source.endswith('_benchmark.c')
+            ]
+            binary: str = join(pro_dir, 'mem_loop')
+            compiled = run(
+                [
+                    'gcc', '-std=gnu11', '-pthread', '-I', pro_dir,
+                    '-DMQ_POSIX_EVENT_LOOP_BATCHES=2',
+                    f'-DNAME="/mem_loop_{getpid()}"', '-o', binary
+                ] + sources + ['-lrt'], capture_output=True, check=False
+            )
+            self.assertEqual(compiled.returncode, 0, compiled.stderr)
+            self.assertEqual(
+                run([binary], check=False, timeout=30).returncode, 0
+            )
+
+
+if __name__ == '__main__':
+    main()
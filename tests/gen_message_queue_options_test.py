@@ -0,0 +1,180 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gen_message_queue_options_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MessageQueueOptionsTestCase with attribute(s) and method(s).
+    Creates test cases for checking optional components of MessageQueue.
+Execute
+    python3 -m unittest -v gen_message_queue_options_test
+'''
+
+import sys
+from typing import List, Dict
+from os.path import dirname, join, realpath
+from shutil import which
+from subprocess import run
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main, skipUnless
+
+try:
+    from gen_message_queue.pro import MessageQueue
+    from gen_message_queue.pro.message_schema import MessageSchema
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+WAITERS: str = r'''
+import asyncio
+import os
+from mq_posix_aio import MessageQueue
+
+
+async def waiters() -> None:
+    queue = MessageQueue(
+        f'/mem_waiters_{os.getpid()}', max_messages=1, message_size=64
+    )
+    receivers = [asyncio.ensure_future(queue.receive()) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    receivers.pop().cancel()
+    await queue.send(b'a\0b', 1)
+    await queue.send(b'c', 2)
+    received = await asyncio.wait_for(asyncio.gather(*receivers), 2)
+    assert sorted(received) == [(b'a\0b', 1), (b'c', 2)], received
+    waiter = asyncio.ensure_future(queue.receive())
+    await asyncio.sleep(0.05)
+    queue.close()
+    queue.unlink()
+    try:
+        await waiter
+    except asyncio.CancelledError:
+        return
+    raise AssertionError('waiter not cancelled on close')
+
+
+asyncio.run(waiters())
+'''
+
+
+class MessageQueueOptionsTestCase(TestCase):
+    '''
+        Defines class MessageQueueOptionsTestCase with attribute(s) and
+        method(s).
+        Creates test cases for checking optional components of MessageQueue.
+        MessageQueue optional components unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test case.
+                | tearDown - Call after test case.
+                | test_gen_registry - Generate POSIX handle registry.
+                | test_gen_metrics - Generate metrics for each backend.
+                | test_gen_schema - Generate typed message codecs.
+                | test_python_waiters - Concurrent asyncio waiters wake.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_gen_registry(self) -> None:
+        '''Generate POSIX handle registry'''
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive(
+            'mem_registry', 'posix+registry',
+            params={'POSIX_REGISTRY_HANDLES': '128'}
+        )
+        header: bytes = rendered['mem_registry/mq_posix_registry.h']
+        self.assertIn(b'MQ_POSIX_REGISTRY_HANDLES 128', header)
+        self.assertIn('mem_registry/mq_posix_registry_open.c', rendered)
+        self.assertIn(
+            b'mq_posix_registry_acquire',
+            rendered['mem_registry/mq_posix_registry_buffer.c']
+        )
+
+    def test_gen_metrics(self) -> None:
+        '''Generate metrics for each backend'''
+        generator: MessageQueue = MessageQueue()
+        for pro_type in ('posix', 'sysv'):
+            rendered: Dict[str, bytes] = generator.gen_archive(
+                'mem_metrics', f'{pro_type}+metrics',
+                params={'METRICS_QUEUES': '16'}
+            )
+            header: bytes = rendered[
+                f'mem_metrics/mq_{pro_type}_metrics.h'
+            ]
+            self.assertIn(b'_METRICS_QUEUES 16', header)
+            self.assertIn(b'"/mem_metrics.metrics"', header)
+            self.assertIn(
+                f'mem_metrics/mq_{pro_type}_metrics_send.c', rendered
+            )
+
+    def test_gen_schema(self) -> None:
+        '''Generate typed message codecs'''
+        schema: MessageSchema = MessageSchema().load(
+            f'{dirname(realpath(__file__))}/message_schema.yaml'
+        )
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive(
+            'mem_schema', 'sysv', schema=schema
+        )
+        self.assertIn('mem_schema/mq_sysv.h', rendered)
+        self.assertIn(
+            b'mq_sysv_send_order(',
+            rendered['mem_schema/mq_sysv_messages.h']
+        )
+        self.assertIn(
+            b'mem_schema is free software',
+            rendered['mem_schema/mq_messages.py']
+        )
+
+    @skipUnless(which('gcc') and which('make'), 'requires gcc and make')
+    def test_python_waiters(self) -> None:
+        '''Concurrent asyncio waiters wake'''
+        with TemporaryDirectory() as work_dir:
+            generator: MessageQueue = MessageQueue()
+            self.assertTrue(generator.gen_setup(
+                'mem_waiters', 'posix+python', output_dir=work_dir
+            ))
+            pro_dir: str = join(work_dir, 'mem_waiters')
+            built = run(
+                ['make', '-C', pro_dir, 'shared'],
+                capture_output=True, check=False
+            )
+            self.assertEqual(built.returncode, 0, built.stderr)
+            waited = run(
+                [sys.executable, '-c', WAITERS], cwd=pro_dir,
+                capture_output=True, check=False, timeout=30
+            )
+            self.assertEqual(waited.returncode, 0, waited.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -23,7 +23,9 @@ Execute
 '''
 
 import sys
-from typing import List
+from typing import Any, List, Dict
+from io import BytesIO
+from tempfile import TemporaryDirectory
 from unittest import TestCase, main
 
 try:
@@ -63,6 +65,18 @@ class MessageQueueTestCase(TestCase):
                 | test_gen_project_empty - Create project with missing name.
                 | test_gen_project_none - Create project with None name.
                 | test_gen_project - Create project.
+                | test_gen_batch - Create projects in batch.
+                | test_gen_incremental - Regenerate existing project.
+                | test_gen_timing - Timing records of generation.
+                | test_gen_archive - Generate project in memory.
+                | test_gen_python - Generate project with asyncio binding.
+                | test_gen_worker_pool - Generate project with worker pool.
+                | test_gen_queue_group - Generate project with queue group.
+                | test_gen_sysv_pool - Generate SysV inline buffer and pool.
+                | test_gen_shm - Generate shared memory ring buffer.
+                | test_gen_benchmark - Generate benchmark for each backend.
+                | test_gen_makefile - Generate Makefile for each backend.
+                | test_gen_sizing - Generate queue sizing from parameters.
     '''
 
     def setUp(self) -> None:
@@ -115,6 +129,167 @@ class MessageQueueTestCase(TestCase):
         generator: MessageQueue = MessageQueue()
         self.assertTrue(generator.gen_setup('full_simple_new', 'posix'))
 
+    def test_gen_batch(self) -> None:
+        '''Create projects in batch'''
+        generator: MessageQueue = MessageQueue()
+        out: str = 'sub_batch'
+        report: Dict[str, Any] = generator.gen_batch([
+            {'name': 'sub_batch_posix', 'type': 'posix', 'output': out},
+            {'name': 'sub_batch_sysv', 'type': 'sysv', 'output': out},
+            {'name': 'sub_batch_posix', 'type': 'posix', 'output': out}
+        ])
+        self.assertFalse(report['status'])
+        self.assertEqual(
+            [result['status'] for result in report['entries']],
+            [True, True, False]
+        )
+        self.assertGreater(report['elapsed'], 0.0)
+
+    def test_gen_incremental(self) -> None:
+        '''Regenerate existing project'''
+        generator: MessageQueue = MessageQueue()
+        with TemporaryDirectory() as work_dir:
+            self.assertTrue(
+                generator.gen_setup('inc_sysv', 'sysv', False, work_dir)
+            )
+            with self.assertRaises(FileExistsError):
+                generator.gen_setup('inc_sysv', 'sysv', False, work_dir)
+            self.assertTrue(generator.gen_setup(
+                'inc_sysv', 'sysv', False, work_dir, incremental=True
+            ))
+
+    def test_gen_timing(self) -> None:
+        '''Timing records of generation'''
+        generator: MessageQueue = MessageQueue()
+        with TemporaryDirectory() as work_dir:
+            self.assertTrue(generator.gen_setup(
+                'timing_posix', 'posix', False, work_dir, 2
+            ))
+        report: Dict[str, Any] = generator.get_timing().report()
+        self.assertEqual(
+            sorted(report['phases']),
+            ['check', 'config', 'read', 'substitute', 'write']
+        )
+        self.assertIn('timing_posix/mq_posix.h', report['modules'])
+        self.assertGreater(report['bytes'], 0)
+
+    def test_gen_archive(self) -> None:
+        '''Generate project in memory'''
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive('mem_sysv', 'sysv')
+        self.assertIn('mem_sysv/mq_sysv.h', rendered)
+        stream: BytesIO = BytesIO()
+        self.assertEqual(
+            generator.gen_archive('mem_sysv', 'sysv', stream, 'tgz'), {}
+        )
+        self.assertGreater(len(stream.getvalue()), 0)
+        with self.assertRaises(ATSValueError):
+            generator.gen_archive('mem_sysv', 'mpsc')
+
+    def test_gen_python(self) -> None:
+        '''Generate project with asyncio binding'''
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive(
+            'mem_aio', 'posix+python'
+        )
+        source: bytes = rendered['mem_aio/mq_posix_aio.py']
+        compile(source, 'mq_posix_aio.py', 'exec')
+        self.assertIn(b"'libmem_aio.so'", source)
+        with self.assertRaises(ATSValueError):
+            generator.gen_archive('mem_aio', 'sysv+python')
+
+    def test_gen_worker_pool(self) -> None:
+        '''Generate project with worker pool'''
+        generator: MessageQueue = MessageQueue()
+        for pro_type in ('posix', 'sysv'):
+            rendered: Dict[str, bytes] = generator.gen_archive(
+                'mem_pool', f'{pro_type}+worker_pool'
+            )
+            self.assertIn(f'mem_pool/mq_{pro_type}.h', rendered)
+            self.assertIn(
+                f'mem_pool/mq_{pro_type}_worker_pool_start.c', rendered
+            )
+
+    def test_gen_queue_group(self) -> None:
+        '''Generate project with queue group'''
+        generator: MessageQueue = MessageQueue()
+        for pro_type in ('posix', 'sysv'):
+            rendered: Dict[str, bytes] = generator.gen_archive(
+                'mem_group', f'{pro_type}+queue_group',
+                params={'QUEUE_GROUP_SHARDS': '8'}
+            )
+            header: bytes = rendered[f'mem_group/mq_{pro_type}_group.h']
+            self.assertIn(
+                f'{pro_type.upper()}_GROUP_SHARDS 8'.encode(), header
+            )
+        with self.assertRaises(ATSValueError):
+            generator.gen_archive(
+                'mem_group', 'posix+queue_group',
+                params={'QUEUE_GROUP_SHARDS': '0'}
+            )
+
+    def test_gen_sysv_pool(self) -> None:
+        '''Generate SysV inline buffer and pool'''
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive(
+            'mem_sysv', 'sysv', params={'SYSV_MESSAGE_SIZE': '512'}
+        )
+        self.assertIn(
+            b'MQ_SYSV_MESSAGE_SIZE 512', rendered['mem_sysv/mq_sysv.h']
+        )
+        self.assertIn('mem_sysv/mq_sysv_pool_acquire.c', rendered)
+
+    def test_gen_shm(self) -> None:
+        '''Generate shared memory ring buffer'''
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive('mem_shm', 'shm')
+        self.assertIn('mem_shm/mq_shm.h', rendered)
+        self.assertIn(b'mem_shm', rendered['mem_shm/mq_shm_send.c'])
+        with self.assertRaises(ATSValueError):
+            generator.gen_archive('mem_shm', 'shm+python')
+
+    def test_gen_benchmark(self) -> None:
+        '''Generate benchmark for each backend'''
+        generator: MessageQueue = MessageQueue()
+        for pro_type in ('posix', 'sysv', 'shm'):
+            rendered: Dict[str, bytes] = generator.gen_archive(
+                'mem_bench', f'{pro_type}+benchmark'
+            )
+            benchmark: bytes = rendered[
+                f'mem_bench/mq_{pro_type}_benchmark.c'
+            ]
+            self.assertIn(b'int main(int argc, char ** argv)', benchmark)
+            self.assertIn(b'p99_9', benchmark)
+
+    def test_gen_makefile(self) -> None:
+        '''Generate Makefile for each backend'''
+        generator: MessageQueue = MessageQueue()
+        for pro_type in ('posix', 'sysv', 'shm'):
+            rendered: Dict[str, bytes] = generator.gen_archive(
+                'mem_make', pro_type
+            )
+            makefile: bytes = rendered['mem_make/Makefile']
+            self.assertIn(b'PRO := mem_make', makefile)
+            self.assertIn(b'PREFIX := mq_' + pro_type.encode(), makefile)
+            self.assertIn(b'-flto', makefile)
+            self.assertIn(b'$(SOURCES:.c=.o)', makefile)
+
+    def test_gen_sizing(self) -> None:
+        '''Generate queue sizing from parameters'''
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive(
+            'mem_size', 'posix+sizing', params={'POSIX_MAX_MESSAGES': '64'}
+        )
+        header: bytes = rendered['mem_size/mq_posix_sizing.h']
+        report: bytes = rendered['mem_size/mq_posix_sizing_report.txt']
+        self.assertIn(b'MQ_POSIX_SIZING_MAX_MESSAGES 64L', header)
+        self.assertIn(b'524800 bytes per full queue', report)
+        rendered = generator.gen_archive(
+            'mem_size', 'sysv+sizing', params={'SYSV_QUEUE_BYTES': '65536'}
+        )
+        header = rendered['mem_size/mq_sysv_sizing.h']
+        self.assertIn(b'MQ_SYSV_SIZING_QUEUE_MESSAGES 8', header)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,173 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gen_message_queue_sysv_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MessageQueueSysvTestCase with attribute(s) and method(s).
+    Creates test cases for checking System V payload of MessageQueue.
+Execute
+    python3 -m unittest -v gen_message_queue_sysv_test
+'''
+
+import sys
+from typing import List, Dict
+from glob import glob
+from os.path import join
+from shutil import which
+from subprocess import run
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main, skipUnless
+
+try:
+    from gen_message_queue.pro import MessageQueue
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+ROUND_TRIP: str = r'''
+#include "mq_sysv.h"
+
+int main(void)
+{
+    static const char payload[] = {'a', '\0', 'b', '\0', '\0', 'c'};
+    static char large[MQ_SYSV_MESSAGE_SIZE + 1];
+    mq_buffer sent, received;
+    ssize_t length;
+    int mq_id = msgget(IPC_PRIVATE, IPC_CREAT | 0600);
+
+    if (mq_id == MQ_SYSV_ERROR)
+    {
+        return 1;
+    }
+
+    mq_sysv_set_buffer_type(&sent, 1);
+    if (mq_sysv_set_buffer(&sent, payload, sizeof(payload)) != 0 ||
+        mq_sysv_send(mq_id, &sent, sizeof(payload)) != 0)
+    {
+        return 2;
+    }
+
+    length = mq_sysv_receive(mq_id, &received, 1, IPC_NOWAIT);
+    if (length != (ssize_t) sizeof(payload) ||
+        memcmp(received.message_buffer, payload, sizeof(payload)) != 0)
+    {
+        return 3;
+    }
+
+    if (mq_sysv_set_buffer(&sent, large, sizeof(large)) != MQ_SYSV_ERROR ||
+        errno != EMSGSIZE)
+    {
+        return 4;
+    }
+
+    if (mq_sysv_send(mq_id, &sent, sizeof(large)) != MQ_SYSV_ERROR ||
+        errno != EMSGSIZE)
+    {
+        return 5;
+    }
+
+    msgctl(mq_id, IPC_RMID, NULL);
+    return 0;
+}
+'''
+
+
+class MessageQueueSysvTestCase(TestCase):
+    '''
+        Defines class MessageQueueSysvTestCase with attribute(s) and method(s).
+        Creates test cases for checking System V payload of MessageQueue.
+        MessageQueue System V payload unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test case.
+                | tearDown - Call after test case.
+                | test_gen_payload_length - Generate explicit payload length.
+                | test_payload_round_trip - Binary payload at exact length.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_gen_payload_length(self) -> None:
+        '''Generate explicit payload length'''
+        generator: MessageQueue = MessageQueue()
+        rendered: Dict[str, bytes] = generator.gen_archive(
+            'mem_payload', 'sysv', params={'SYSV_MESSAGE_SIZE': '256'}
+        )
+        header: bytes = rendered['mem_payload/mq_sysv.h']
+        self.assertIn(b'#define MQ_SYSV_MESSAGE_SIZE 256', header)
+        self.assertIn(
+            b'mq_buffer * buffer, const void * message_buffer, '
+            b'size_t message_length', header
+        )
+        self.assertIn(
+            b'int mq_sysv_send(int mq_id, const mq_buffer * buffer, '
+            b'size_t message_length)', rendered['mem_payload/mq_sysv_send.c']
+        )
+        for module in ('send', 'set_buffer'):
+            source: bytes = rendered[f'mem_payload/mq_sysv_{module}.c']
+            self.assertIn(b'message_length > MQ_SYSV_MESSAGE_SIZE', source)
+            self.assertIn(b'errno = EMSGSIZE', source)
+            self.assertNotIn(b'strlen', source)
+        self.assertIn(
+            b'ssize_t mq_sysv_receive(',
+            rendered['mem_payload/mq_sysv_receive.c']
+        )
+
+    @skipUnless(which('gcc'), 'requires gcc')
+    def test_payload_round_trip(self) -> None:
+        '''Binary payload with NUL bytes at exact length, EMSGSIZE'''
+        with TemporaryDirectory() as work_dir:
+            generator: MessageQueue = MessageQueue()
+            self.assertTrue(generator.gen_setup(
+                'round_trip', 'sysv', output_dir=work_dir
+            ))
+            pro_dir: str = join(work_dir, 'round_trip')
+            with open(
+                join(pro_dir, 'round_trip.c'), 'w', encoding='utf-8'
+            ) as program:
+                program.write(ROUND_TRIP)
+            sources: List[str] = [
+                source for source in glob(join(pro_dir, '*.c'))
+                if not source.endswith('_benchmark.c')
+            ]
+            binary: str = join(pro_dir, 'round_trip')
+            compiled = run(
+                ['gcc', '-std=gnu11', '-pthread', '-I', pro_dir, '-o', binary]
+                + sources, capture_output=True, check=False
+            )
+            self.assertEqual(compiled.returncode, 0, compiled.stderr)
+            self.assertEqual(run([binary], check=False).returncode, 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -23,8 +23,15 @@ Execute
 '''
 
 import sys
-from typing import List
-from os import makedirs, rmdir
+from typing import Any, List, Dict, TextIO
+from os import makedirs, rmdir, remove, environ
+from json import JSONDecoder, load
+from io import BytesIO, StringIO, TextIOWrapper
+from os.path import exists, dirname, realpath
+from shutil import rmtree
+from subprocess import run
+from tarfile import open as tar_open
+from tempfile import TemporaryDirectory
 from unittest import TestCase, main
 
 try:
@@ -62,6 +69,17 @@ class GenMessageQueueTestCase(TestCase):
                 | test_process - Generate project structure.
                 | test_tool_not_operational - Test not operational.
                 | test_pro_already_exists - Test pro already exists.
+                | test_process_batch - Generate projects from manifest.
+                | test_process_quiet - Generate project in fast-start mode.
+                | test_quiet_environment - Fast-start mode from environment.
+                | test_process_timing - Generate project with timing report.
+                | test_process_timing_error - Unwritable timing report.
+                | test_process_archive - Generate project archive to stdout.
+                | test_process_archive_timing - Archive with timing to stderr.
+                | test_process_options - Generate project with options.
+                | test_process_monitor - Monitor live queues to stdout.
+                | test_import_lazy - Import loads no optional components.
+                | test_quiet_output - Fast-start mode prints nothing.
     '''
 
     def setUp(self) -> None:
@@ -113,6 +131,169 @@ class GenMessageQueueTestCase(TestCase):
         self.assertFalse(generator.process())
         rmdir('fresh_new')
 
+    def test_process_batch(self) -> None:
+        '''Generate projects from manifest'''
+        sys.argv.clear()
+        sys.argv.insert(0, '-b')
+        sys.argv.insert(1, 'batch_manifest.yaml')
+        generator: GenMessageQueue = GenMessageQueue()
+        self.assertTrue(generator.process())
+
+    def test_process_quiet(self) -> None:
+        '''Generate project in fast-start mode'''
+        sys.argv.clear()
+        sys.argv.extend(['-q', '-n', 'quiet_pro', '-t', 'sysv'])
+        generator: GenMessageQueue = GenMessageQueue()
+        self.assertTrue(generator.process())
+
+    def test_quiet_environment(self) -> None:
+        '''Fast-start mode from environment'''
+        self.assertFalse(GenMessageQueue.is_quiet([]))
+        environ['GEN_MESSAGE_QUEUE_QUIET'] = '1'
+        try:
+            self.assertTrue(GenMessageQueue.is_quiet([]))
+        finally:
+            del environ['GEN_MESSAGE_QUEUE_QUIET']
+
+    def test_process_timing(self) -> None:
+        '''Generate project with timing report'''
+        sys.argv.clear()
+        sys.argv.extend([
+            '-q', '-n', 'timing_pro', '-t', 'posix',
+            '--timing', 'timing_pro.json'
+        ])
+        generator: GenMessageQueue = GenMessageQueue()
+        self.assertTrue(generator.process())
+        with open('timing_pro.json', 'r', encoding='utf-8') as report_file:
+            report: Dict[str, Any] = load(report_file)
+        remove('timing_pro.json')
+        self.assertIn('write', report['phases'])
+        self.assertGreater(report['bytes'], 0)
+
+    def test_process_timing_error(self) -> None:
+        '''Unwritable timing report'''
+        sys.argv.clear()
+        sys.argv.extend([
+            '-q', '-n', 'timing_error', '-t', 'posix',
+            '--timing', 'missing_dir/timing_error.json'
+        ])
+        generator: GenMessageQueue = GenMessageQueue()
+        try:
+            # Generation succeeded, write error is reported (no exception)
+            self.assertTrue(generator.process())
+        finally:
+            rmtree('timing_error', ignore_errors=True)
+
+    def test_process_archive(self) -> None:
+        '''Generate project archive to stdout'''
+        sys.argv.clear()
+        sys.argv.extend(['-n', 'archive_pro', '-t', 'posix', '-a', 'tar'])
+        stdout: TextIO = sys.stdout
+        sys.stdout = TextIOWrapper(BytesIO())
+        try:
+            generator: GenMessageQueue = GenMessageQueue()
+            self.assertTrue(generator.process())
+            archive: bytes = getattr(sys.stdout.buffer, 'getvalue')()
+        finally:
+            sys.stdout = stdout
+        with tar_open(fileobj=BytesIO(archive), mode='r') as tar:
+            self.assertIn('archive_pro/mq_posix.h', tar.getnames())
+        self.assertFalse(exists('archive_pro'))
+
+    def test_process_archive_timing(self) -> None:
+        '''Generate project archive to stdout with timing report (-)'''
+        sys.argv.clear()
+        sys.argv.extend([
+            '-n', 'archive_timing', '-t', 'posix', '-a', 'tgz',
+            '--timing', '-'
+        ])
+        stdout: TextIO = sys.stdout
+        stderr: TextIO = sys.stderr
+        sys.stdout, sys.stderr = TextIOWrapper(BytesIO()), StringIO()
+        try:
+            generator: GenMessageQueue = GenMessageQueue()
+            self.assertTrue(generator.process())
+            archive: bytes = getattr(sys.stdout.buffer, 'getvalue')()
+            errors: str = getattr(sys.stderr, 'getvalue')()
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+        with tar_open(fileobj=BytesIO(archive), mode='r:gz') as tar:
+            self.assertIn('archive_timing/mq_posix.h', tar.getnames())
+        report: Dict[str, Any] = JSONDecoder().raw_decode(
+            errors, errors.index('{')
+        )[0]
+        self.assertIn('substitute', report['phases'])
+
+    def test_process_options(self) -> None:
+        '''Generate project with optional components'''
+        sys.argv.clear()
+        sys.argv.extend([
+            '-n', 'option_pro', '-t', 'posix', '-o', 'event_loop', '-a', 'tar'
+        ])
+        stdout: TextIO = sys.stdout
+        sys.stdout = TextIOWrapper(BytesIO())
+        try:
+            generator: GenMessageQueue = GenMessageQueue()
+            self.assertTrue(generator.process())
+            archive: bytes = getattr(sys.stdout.buffer, 'getvalue')()
+        finally:
+            sys.stdout = stdout
+        with tar_open(fileobj=BytesIO(archive), mode='r') as tar:
+            names: List[str] = tar.getnames()
+        self.assertIn('option_pro/mq_posix.h', names)
+        self.assertIn('option_pro/mq_posix_event_loop.h', names)
+
+    def test_process_monitor(self) -> None:
+        '''Monitor live queues to stdout'''
+        sys.argv.clear()
+        sys.argv.extend([
+            '-m', 'json', '--interval', '0.01', '--samples', '1'
+        ])
+        generator: GenMessageQueue = GenMessageQueue()
+        self.assertTrue(generator.process())
+
+    def test_import_lazy(self) -> None:
+        '''Import loads no optional components'''
+        deferred: List[str] = [
+            'gen_message_queue.pro.incremental_write',
+            'gen_message_queue.pro.archive_write',
+            'gen_message_queue.pro.gen_batch',
+            'gen_message_queue.pro.message_schema',
+            'gen_message_queue.pro.host_limits',
+            'gen_message_queue.pro.batch_manifest',
+            'gen_message_queue.queue_monitor', 'ats_utilities.splash',
+            'concurrent.futures', 'tarfile', 'zipfile', 'shutil'
+        ]
+        loaded = run([
+            sys.executable, '-c',
+            'import sys, gen_message_queue\n'
+            'from gen_message_queue.pro.read_template import ReadTemplate\n'
+            'print(*sorted(sys.modules), ReadTemplate._CACHE)'
+        ], capture_output=True, check=True, text=True, env={
+            **environ, 'PYTHONPATH': dirname(dirname(realpath(__file__)))
+        })
+        modules: List[str] = loaded.stdout.split()
+        self.assertEqual(modules[-1], 'None')
+        for module in deferred:
+            self.assertNotIn(module, modules)
+
+    def test_quiet_output(self) -> None:
+        '''Fast-start mode prints nothing'''
+        root_dir: str = dirname(dirname(realpath(__file__)))
+        with TemporaryDirectory() as work_dir:
+            generated = run([
+                sys.executable,
+                f'{root_dir}/gen_message_queue/run/gen_message_queue_run.py',
+                '-n', 'quiet_output', '-t', 'posix'
+            ], capture_output=True, check=False, text=True, cwd=work_dir, env={
+                **environ, 'PYTHONPATH': root_dir,
+                'GEN_MESSAGE_QUEUE_QUIET': '1'
+            })
+            self.assertTrue(exists(f'{work_dir}/quiet_output/mq_posix.h'))
+        self.assertEqual(generated.returncode, 0)
+        self.assertEqual(generated.stdout, '')
+        self.assertEqual(generated.stderr, '')
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,109 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gen_params_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class GenParamsTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of GenParams.
+Execute
+    python3 -m unittest -v gen_params_test
+'''
+
+import sys
+from typing import List, Dict
+from unittest import TestCase, main
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.gen_params import GenParams
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class GenParamsTestCase(TestCase):
+    '''
+        Defines class GenParamsTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of GenParams.
+        GenParams unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_params_parse - Test parsing KEY=VALUE parameters.
+                | test_params_malformed - Test parameter without value.
+                | test_params_check - Test unknown and out of range.
+                | test_params_values - Test values with defaults.
+                | test_params_derived - Test queue sizes from parameters.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_params_parse(self) -> None:
+        '''Test parsing KEY=VALUE parameters'''
+        params: Dict[str, str] = GenParams.parse(['queue_group_shards=0x10'])
+        self.assertEqual(params, {'QUEUE_GROUP_SHARDS': '16'})
+        self.assertEqual(GenParams.parse(None), {})
+
+    def test_params_malformed(self) -> None:
+        '''Test parameter without value'''
+        with self.assertRaises(ATSValueError):
+            GenParams.parse(['QUEUE_GROUP_SHARDS'])
+
+    def test_params_check(self) -> None:
+        '''Test unknown and out of range'''
+        with self.assertRaises(ATSValueError):
+            GenParams.check({'UNKNOWN': '1'})
+        with self.assertRaises(ATSValueError):
+            GenParams.check({'QUEUE_GROUP_SHARDS': 'many'})
+        with self.assertRaises(ATSValueError):
+            GenParams.check({'QUEUE_GROUP_SHARDS': '0'})
+
+    def test_params_values(self) -> None:
+        '''Test values with defaults'''
+        values: Dict[str, str] = GenParams.values('simple')
+        self.assertEqual(values['PRO'], 'simple')
+        self.assertEqual(values['QUEUE_GROUP_SHARDS'], '4')
+        self.assertIn('YEAR', values)
+
+    def test_params_derived(self) -> None:
+        '''Test queue sizes from parameters'''
+        values: Dict[str, str] = GenParams.values('simple', {
+            'POSIX_MAX_MESSAGES': '64', 'SYSV_QUEUE_BYTES': '65536'
+        })
+        self.assertEqual(values['POSIX_QUEUE_BYTES'], str(64 * (8192 + 8)))
+        self.assertEqual(values['SYSV_QUEUE_MESSAGES'], '8')
+
+
+if __name__ == '__main__':
+    main()
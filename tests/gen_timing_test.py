@@ -0,0 +1,111 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gen_timing_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class GenTimingTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of GenTiming.
+Execute
+    python3 -m unittest -v gen_timing_test
+'''
+
+import sys
+from typing import Any, List, Dict
+from os.path import join
+from json import load
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+try:
+    from gen_message_queue.pro.gen_timing import GenTiming
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class GenTimingTestCase(TestCase):
+    '''
+        Defines class GenTimingTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of GenTiming.
+        GenTiming unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_timing_add - Test timing add.
+                | test_timing_phase - Test timing phase context.
+                | test_timing_reset - Test timing reset.
+                | test_timing_emit - Test timing emit to file.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_timing_add(self) -> None:
+        '''Test timing add'''
+        timing: GenTiming = GenTiming()
+        timing.add('write', 0.5, 'pro/mq.h', 10)
+        timing.add('write', 0.25, 'pro/mq.c', 20)
+        report: Dict[str, Any] = timing.report()
+        self.assertEqual(report['phases']['write'], 0.75)
+        self.assertEqual(report['modules']['pro/mq.c']['bytes'], 20)
+        self.assertEqual(report['bytes'], 30)
+
+    def test_timing_phase(self) -> None:
+        '''Test timing phase context'''
+        timing: GenTiming = GenTiming()
+        with timing.phase('config'):
+            pass
+        self.assertIn('config', timing.report()['phases'])
+        self.assertEqual(timing.report()['modules'], {})
+
+    def test_timing_reset(self) -> None:
+        '''Test timing reset'''
+        timing: GenTiming = GenTiming()
+        timing.add('read', 0.1, 'pro/mq.h')
+        timing.reset()
+        self.assertEqual(
+            timing.report(), {'phases': {}, 'modules': {}, 'bytes': 0}
+        )
+
+    def test_timing_emit(self) -> None:
+        '''Test timing emit to file'''
+        timing: GenTiming = GenTiming()
+        timing.add('check', 0.1, 'pro/mq.h')
+        with TemporaryDirectory() as work_dir:
+            timing.emit(join(work_dir, 'timing.json'))
+            with open(join(work_dir, 'timing.json'), 'r') as report_file:
+                self.assertEqual(load(report_file), timing.report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    generator_benchmark.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Measures generator hot path: template read, substitution, write and
+    end-to-end generation (gen_setup) for number of projects per type.
+    Run for 10000 projects writes 20000 projects per type (hours), it is
+    enabled by --large.
+Execute
+    python3 generator_benchmark.py -c 1,100 -o generator_benchmark.json
+    python3 generator_benchmark.py --large
+'''
+
+import sys
+from typing import Any, Callable, Dict, List
+from string import Template
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from json import dump
+from argparse import Namespace
+
+try:
+    from ats_utilities.option import ATSOptionParser
+    from ats_utilities.console_io.success import success_message
+    from gen_message_queue.pro import MessageQueue
+    from gen_message_queue.pro.gen_params import GenParams
+    from gen_message_queue.pro.read_template import ReadTemplate
+    from gen_message_queue.pro.write_template import WriteTemplate
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+def measure(count: int, step: Callable[[int], Any]) -> Dict[str, float]:
+    '''
+        Runs step for each project and summarizes elapsed time.
+
+        :param count: Number of projects
+        :type count: <int>
+        :param step: Measured step called with project index
+        :type step: <Callable[[int], Any]>
+        :return: Total time, time per project and projects per second
+        :rtype: <Dict[str, float]>
+        :exceptions: None
+    '''
+    start: float = perf_counter()
+    for index in range(count):
+        step(index)
+    total: float = perf_counter() - start
+    return {
+        'total': total, 'per_project': total / count,
+        'per_second': count / total if total else 0.0
+    }
+
+
+def bench_type(pro_type: str, count: int) -> Dict[str, Dict[str, float]]:
+    '''
+        Measures all phases for project type.
+
+        :param pro_type: Project type
+        :type pro_type: <str>
+        :param count: Number of projects
+        :type count: <int>
+        :return: Summary per phase
+        :rtype: <Dict[str, Dict[str, float]]>
+        :exceptions: None
+    '''
+    generator: MessageQueue = MessageQueue()
+    config: Dict[Any, Any] = generator.config or {}
+    reader: ReadTemplate = ReadTemplate()
+    writer: WriteTemplate = WriteTemplate()
+    compiled: Dict[str, Template] = reader.read_compiled(
+        config, 'bench', pro_type
+    )
+
+    def render(index: int) -> List[str]:
+        values: Dict[str, str] = GenParams.values(f'bench_{index}')
+        return [template.substitute(values) for template in compiled.values()]
+
+    results: Dict[str, Dict[str, float]] = {
+        'read': measure(count, lambda index: reader.read(
+            config, f'bench_{index}', pro_type
+        )),
+        'substitute': measure(count, render)
+    }
+    with TemporaryDirectory() as work_dir:
+        results['write'] = measure(count, lambda index: writer.write(
+            compiled, f'write_{index}', output_dir=work_dir
+        ))
+    with TemporaryDirectory() as work_dir:
+        results['gen_setup'] = measure(count, lambda index: (
+            generator.gen_setup(f'setup_{index}', pro_type, False, work_dir)
+        ))
+    return results
+
+
+if __name__ == '__main__':
+    cli: ATSOptionParser = ATSOptionParser(
+        'generator_benchmark 2026', '1.0.0', 'GPLv3', False
+    )
+    cli.add_operation(
+        '-c', '--counts', dest='counts', default='1,10',
+        help='comma separated numbers of projects (default 1,10)'
+    )
+    cli.add_operation(
+        '-l', '--large', dest='large', action='store_true', default=False,
+        help='add run for 10000 projects (slow)'
+    )
+    cli.add_operation(
+        '-t', '--types', dest='types', default='posix,sysv',
+        help='comma separated project types (default posix,sysv)'
+    )
+    cli.add_operation(
+        '-o', '--output', dest='output', default='generator_benchmark.json',
+        help='results file (default generator_benchmark.json)'
+    )
+    args: Namespace = cli.parse_args(sys.argv)
+    counts: List[int] = [
+        int(count) for count in str(getattr(args, 'counts')).split(',')
+    ]
+    if getattr(args, 'large') and 10000 not in counts:
+        counts.append(10000)
+    types: List[str] = str(getattr(args, 'types')).split(',')
+    results: Dict[str, Any] = {
+        'python': sys.version.split()[0],
+        'version': __version__,
+        'counts': counts,
+        'results': {
+            pro_type: {
+                str(count): bench_type(pro_type, count) for count in counts
+            } for pro_type in types
+        }
+    }
+    with open(getattr(args, 'output'), 'w', encoding='utf-8') as report:
+        dump(results, report, indent=4)
+    success_message(
+        [f'generator_benchmark: results {getattr(args, "output")}']
+    )
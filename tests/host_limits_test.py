@@ -0,0 +1,113 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    host_limits_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class HostLimitsTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of HostLimits.
+Execute
+    python3 -m unittest -v host_limits_test
+'''
+
+import sys
+from typing import List, Dict
+from os import makedirs
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+try:
+    from gen_message_queue.pro.host_limits import HostLimits
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class HostLimitsTestCase(TestCase):
+    '''
+        Defines class HostLimitsTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of HostLimits.
+        HostLimits unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | write_limits - Writes limit files under proc directory.
+                | test_limits_read - Test reading limits from proc files.
+                | test_limits_missing - Test host without limit files.
+                | test_limits_merge - Test explicit parameters override.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    @staticmethod
+    def write_limits(proc: str, limits: Dict[str, str]) -> None:
+        '''Writes limit files under proc directory'''
+        for limit_file, value in limits.items():
+            makedirs(dirname(join(proc, limit_file)), exist_ok=True)
+            with open(join(proc, limit_file), 'w', encoding='utf-8') as out:
+                out.write(f'{value}\n')
+
+    def test_limits_read(self) -> None:
+        '''Test reading limits from proc files'''
+        with TemporaryDirectory() as proc:
+            self.write_limits(proc, {
+                'sys/fs/mqueue/msg_max': '256',
+                'sys/fs/mqueue/msgsize_max': '1',
+                'sys/kernel/msgmax': 'broken',
+                'sys/kernel/msgmnb': '65536'
+            })
+            params: Dict[str, str] = HostLimits.read(proc)
+        self.assertEqual(params, {
+            'POSIX_MAX_MESSAGES': '256',
+            'POSIX_MESSAGE_SIZE': '128',
+            'SYSV_QUEUE_BYTES': '65536'
+        })
+
+    def test_limits_missing(self) -> None:
+        '''Test host without limit files'''
+        with TemporaryDirectory() as proc:
+            self.assertEqual(HostLimits.read(proc), {})
+
+    def test_limits_merge(self) -> None:
+        '''Test explicit parameters override'''
+        with TemporaryDirectory() as proc:
+            self.write_limits(proc, {'sys/fs/mqueue/msg_max': '256'})
+            params: Dict[str, str] = HostLimits.merge(
+                {'POSIX_MAX_MESSAGES': '32'}, proc
+            )
+        self.assertEqual(params, {'POSIX_MAX_MESSAGES': '32'})
+
+
+if __name__ == '__main__':
+    main()
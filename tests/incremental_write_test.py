@@ -0,0 +1,179 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    incremental_write_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class IncrementalWriteTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of IncrementalWrite.
+Execute
+    python3 -m unittest -v incremental_write_test
+'''
+
+import sys
+from typing import Any, List, Dict
+from json import load
+from os import stat, remove
+from os.path import dirname, realpath, exists, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+try:
+    from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.read_template import ReadTemplate
+    from gen_message_queue.pro.incremental_write import IncrementalWrite
+    from gen_message_queue.pro.gen_timing import GenTiming
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class IncrementalWriteTestCase(TestCase):
+    '''
+        Defines class IncrementalWriteTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of IncrementalWrite.
+        IncrementalWrite unit tests.
+
+        It defines:
+
+            :attributes:
+                | _config - Project structure (templates, modules).
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_incremental_name_none - Test name None.
+                | test_incremental_name_empty - Test name empty.
+                | test_incremental_rerun - Test rerun keeps modules.
+                | test_incremental_changed - Test changed module rewritten.
+                | test_incremental_no_manifest - Test rerun without manifest.
+                | test_incremental_stale - Test stale module removed.
+                | test_incremental_timing - Test write and check timing.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+        current_dir: str = dirname(realpath(__file__))
+        pro: str = '../gen_message_queue/conf/project.yaml'
+        self._config: Dict[Any, Any] = Yaml2Object(
+            f'{current_dir}/{pro}'
+        ).read_configuration()
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_incremental_name_none(self) -> None:
+        '''Test name None'''
+        with self.assertRaises(ATSTypeError):
+            IncrementalWrite().write({}.items(), None)
+
+    def test_incremental_name_empty(self) -> None:
+        '''Test name empty'''
+        with self.assertRaises(ATSValueError):
+            IncrementalWrite().write({}.items(), '')
+
+    def test_incremental_rerun(self) -> None:
+        '''Test rerun keeps modules'''
+        writer = IncrementalWrite()
+        with TemporaryDirectory() as work_dir:
+            self.assertTrue(writer.write(ReadTemplate().iter_read(
+                self._config, 'inc_pro', 'posix'
+            ), 'inc_pro', output_dir=work_dir))
+            module: str = join(work_dir, 'inc_pro', 'mq_posix.h')
+            mtime: int = stat(module).st_mtime_ns
+            self.assertTrue(writer.write(ReadTemplate().iter_read(
+                self._config, 'inc_pro', 'posix'
+            ), 'inc_pro', output_dir=work_dir))
+            self.assertEqual(writer.changed, [])
+            self.assertEqual(stat(module).st_mtime_ns, mtime)
+
+    def test_incremental_changed(self) -> None:
+        '''Test changed module rewritten'''
+        writer = IncrementalWrite()
+        with TemporaryDirectory() as work_dir:
+            writer.write(
+                {'mq.h': '// ${PRO} v1\n'}.items(), 'inc_pro',
+                output_dir=work_dir
+            )
+            self.assertTrue(writer.write(
+                {'mq.h': '// ${PRO} v2\n', 'mq.c': '// ${PRO}\n'}.items(),
+                'inc_pro', output_dir=work_dir
+            ))
+            self.assertEqual(writer.changed, ['mq.h', 'mq.c'])
+            with open(join(work_dir, 'inc_pro', 'mq.h'), 'r') as module:
+                self.assertEqual(module.read(), '// inc_pro v2\n')
+
+    def test_incremental_no_manifest(self) -> None:
+        '''Test rerun without manifest'''
+        writer = IncrementalWrite()
+        with TemporaryDirectory() as work_dir:
+            writer.write(
+                {'mq.h': '// ${PRO}\n'}.items(), 'inc_pro',
+                output_dir=work_dir
+            )
+            manifest: str = join(
+                work_dir, 'inc_pro', '.gen_message_queue.json'
+            )
+            remove(manifest)
+            writer.write(
+                {'mq.h': '// ${PRO}\n'}.items(), 'inc_pro',
+                output_dir=work_dir
+            )
+            self.assertEqual(writer.unchanged, ['mq.h'])
+            self.assertTrue(exists(manifest))
+
+    def test_incremental_stale(self) -> None:
+        '''Test stale module removed'''
+        writer = IncrementalWrite()
+        with TemporaryDirectory() as work_dir:
+            writer.write(
+                {'mq.h': '// ${PRO}\n', 'mq.c': '// ${PRO}\n'}.items(),
+                'inc_pro', output_dir=work_dir
+            )
+            self.assertTrue(writer.write(
+                {'mq.h': '// ${PRO}\n'}.items(), 'inc_pro',
+                output_dir=work_dir
+            ))
+            self.assertFalse(exists(join(work_dir, 'inc_pro', 'mq.c')))
+            with open(
+                join(work_dir, 'inc_pro', '.gen_message_queue.json'), 'r'
+            ) as manifest:
+                self.assertEqual(list(load(manifest)['modules']), ['mq.h'])
+
+    def test_incremental_timing(self) -> None:
+        '''Test write and check timing'''
+        timing: GenTiming = GenTiming()
+        with TemporaryDirectory() as work_dir:
+            IncrementalWrite().write(
+                {'mq.h': '// ${PRO}\n'}.items(), 'inc_pro',
+                output_dir=work_dir, timing=timing
+            )
+        phases: Dict[str, Any] = timing.report()['phases']
+        for phase in ('substitute', 'write', 'check'):
+            self.assertIn(phase, phases)
+
+
+if __name__ == '__main__':
+    main()
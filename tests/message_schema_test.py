@@ -0,0 +1,158 @@
+# -*- coding: UTF-8 -*-
+
+'''
+    message_schema_test.py
+    batch_manifest_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MessageSchemaTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of MessageSchema.
+Execute
+    python3 -m unittest -v message_schema_test
+'''
+
+import sys
+from typing import Any, List, Dict, Tuple
+from os.path import dirname, join, realpath
+from string import Template
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.message_schema import MessageSchema
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MessageSchemaTestCase(TestCase):
+    '''
+        Defines class MessageSchemaTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of MessageSchema.
+        MessageSchema unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_schema_load - Test schema load (ids, sizes).
+                | test_schema_invalid - Test schema with invalid types.
+                | test_schema_modules - Test C codecs and Python decoder.
+                | test_schema_not_supported - Test shm project type.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_schema_load(self) -> None:
+        '''Test schema load (ids, sizes)'''
+        current_dir: str = dirname(realpath(__file__))
+        schema: MessageSchema = MessageSchema().load(
+            f'{current_dir}/message_schema.yaml'
+        )
+        self.assertEqual(
+            [(message['name'], message['id'], message['size'])
+             for message in schema.messages],
+            [('order', 7, 30), ('heartbeat', 2, 12)]
+        )
+        self.assertEqual(
+            schema.messages[0]['fields'][-1], ('symbol', 'char', 8)
+        )
+
+    def test_schema_invalid(self) -> None:
+        '''Test schema with invalid types'''
+        invalid: List[str] = [
+            'orders: []',
+            'messages:\n  - name: Order\n    fields: {id: uint32}',
+            'messages:\n  - name: order\n    fields: {id: uint128}',
+            'messages:\n  - name: order\n    fields: {ids: "uint32[4]"}',
+            'messages:\n  - name: order\n    fields: {count: uint32}',
+            'messages:\n  - name: order\n    id: 0\n    fields: {a: int8}',
+            'messages:\n  - name: a\n    fields: {a: int8}\n'
+            '  - name: b\n    id: 1\n    fields: {b: int8}'
+        ]
+        with TemporaryDirectory() as schema_dir:
+            for index, content in enumerate(invalid):
+                path: str = join(schema_dir, f'schema_{index}.yaml')
+                with open(path, 'w', encoding='utf-8') as schema_file:
+                    schema_file.write(f'{content}\n')
+                with self.assertRaises(ATSValueError, msg=content):
+                    MessageSchema().load(path)
+
+    def test_schema_modules(self) -> None:
+        '''Test C codecs and Python decoder'''
+        current_dir: str = dirname(realpath(__file__))
+        schema: MessageSchema = MessageSchema().load(
+            f'{current_dir}/message_schema.yaml'
+        )
+        values: Dict[str, str] = {'PRO': 'typed', 'YEAR': '2026'}
+        for pro_type in ('posix', 'sysv+metrics'):
+            modules: Dict[str, str] = {
+                name: template.substitute(values)
+                for name, template in schema.modules(pro_type)
+            }
+            backend: str = pro_type.split('+')[0]
+            header: str = modules[f'mq_{backend}_messages.h']
+            self.assertIn('#define MQ_MESSAGE_ORDER_ID 7', header)
+            self.assertIn('    char symbol[8];', header)
+            self.assertIn(
+                f'int mq_{backend}_receive_heartbeat(',
+                modules[f'mq_{backend}_messages.c']
+            )
+        namespace: Dict[str, Any] = {}
+        exec(  # pylint: disable=exec-used
+            compile(modules['mq_messages.py'], 'mq_messages', 'exec'),
+            namespace
+        )
+        order: Tuple[Any, ...] = namespace['OrderMessage'](
+            42, 101.5, 7, b'B', True, b'ACME'
+        )
+        payload: bytes = order.encode()
+        self.assertEqual(len(payload), 30)
+        self.assertEqual(
+            namespace['decode'](7, memoryview(payload))[:5], order[:5]
+        )
+        self.assertEqual(
+            len(list(namespace['OrderMessage'].decode_all(payload * 3))), 3
+        )
+
+    def test_schema_not_supported(self) -> None:
+        '''Test shm project type'''
+        current_dir: str = dirname(realpath(__file__))
+        schema: MessageSchema = MessageSchema().load(
+            f'{current_dir}/message_schema.yaml'
+        )
+        with self.assertRaises(ATSValueError):
+            schema.modules('shm')
+        self.assertIsInstance(schema.modules('posix')[0][1], Template)
+
+
+if __name__ == '__main__':
+    main()
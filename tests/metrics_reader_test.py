@@ -0,0 +1,132 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    metrics_reader_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MetricsReaderTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of MetricsReader.
+Execute
+    python3 -m unittest -v metrics_reader_test
+'''
+
+import sys
+from typing import Any, List, Dict, Tuple
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.metrics_reader import MetricsReader
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+
+
+class MetricsReaderTestCase(TestCase):
+    '''
+        Defines class MetricsReaderTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of MetricsReader.
+        MetricsReader unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | write_segment - Writes metrics segment file.
+                | test_metrics_read - Test reading counters by queue.
+                | test_metrics_invalid - Test file which is not segment.
+                | test_metrics_rates - Test rates between samples.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    @staticmethod
+    def write_segment(path: str, slots: List[Tuple[bytes, int]]) -> None:
+        '''Writes metrics segment file (4 slots)'''
+        data: bytearray = bytearray(
+            MetricsReader.HEADER.size + 4 * MetricsReader.SLOT.size
+        )
+        MetricsReader.HEADER.pack_into(
+            data, 0, MetricsReader.MAGIC, MetricsReader.VERSION, 4,
+            MetricsReader.SLOT.size, len(slots), b'posix'
+        )
+        for index, (name, messages) in enumerate(slots):
+            MetricsReader.SLOT.pack_into(
+                data, MetricsReader.HEADER.size +
+                index * MetricsReader.SLOT.size,
+                name, messages, messages * 8, 0, 0, 1, 0, 0, 1000
+            )
+        with open(path, 'wb') as segment:
+            segment.write(data)
+
+    def test_metrics_read(self) -> None:
+        '''Test reading counters by queue'''
+        with TemporaryDirectory() as shm_dir:
+            self.write_segment(join(shm_dir, 'pro.metrics'), [
+                (b'/orders', 3), (b'/audit', 1), (b'/orders', 2), (b'', 9)
+            ])
+            sample: Dict[str, Any] = MetricsReader(
+                '/pro.metrics', shm_dir
+            ).read()
+        self.assertEqual(sample['backend'], 'posix')
+        self.assertEqual(sorted(sample['queues']), ['/audit', '/orders'])
+        orders: Dict[str, int] = sample['queues']['/orders']
+        self.assertEqual(orders['send_messages'], 5)
+        self.assertEqual(orders['send_bytes'], 40)
+        self.assertEqual(orders['eagain'], 2)
+
+    def test_metrics_invalid(self) -> None:
+        '''Test file which is not segment'''
+        with TemporaryDirectory() as shm_dir:
+            with open(join(shm_dir, 'other'), 'wb') as other:
+                other.write(bytes(256))
+            with self.assertRaises(ATSValueError):
+                MetricsReader(join(shm_dir, 'other')).read()
+
+    def test_metrics_rates(self) -> None:
+        '''Test rates between samples'''
+        previous: Dict[str, Any] = {'queues': {'/q': {
+            'send_messages': 10, 'wait_ns': 0
+        }}}
+        current: Dict[str, Any] = {'queues': {'/q': {
+            'send_messages': 30, 'wait_ns': 500000000
+        }}}
+        rates: Dict[str, Dict[str, float]] = MetricsReader.rates(
+            previous, current, 2.0
+        )
+        self.assertEqual(rates['/q']['send_messages'], 10.0)
+        self.assertEqual(rates['/q']['wait_ns'], 0.25)
+        with self.assertRaises(ATSValueError):
+            MetricsReader.rates(previous, current, 0)
+
+
+if __name__ == '__main__':
+    main()
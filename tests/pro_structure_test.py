@@ -0,0 +1,163 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    pro_structure_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ProStructureTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of ProStructure.
+Execute
+    python3 -m unittest -v pro_structure_test
+'''
+
+import sys
+from typing import List
+from os import utime, stat
+from os.path import dirname, realpath, exists, join
+from shutil import copy
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+try:
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.pro_structure import ProStructure, ProIndex
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ProStructureTestCase(TestCase):
+    '''
+        Defines class ProStructureTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of ProStructure.
+        ProStructure unit tests.
+
+        It defines:
+
+            :attributes:
+                | _PRO_STRUCTURE - Path to project structure (YAML).
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_structure_empty - Test structure empty path.
+                | test_structure_none - Test structure None path.
+                | test_structure_index - Test structure index.
+                | test_structure_mismatch - Test structure mismatch.
+                | test_structure_cache - Test structure cache file.
+                | test_structure_stale - Test structure stale cache.
+                | test_structure_options - Test structure optional components.
+    '''
+
+    _PRO_STRUCTURE: str = '../gen_message_queue/conf/project.yaml'
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_structure_empty(self) -> None:
+        '''Test structure empty path'''
+        with self.assertRaises(ATSValueError):
+            ProStructure().load('')
+
+    def test_structure_none(self) -> None:
+        '''Test structure None path'''
+        with self.assertRaises(ATSTypeError):
+            ProStructure().load(None)
+
+    def test_structure_index(self) -> None:
+        '''Test structure index'''
+        current_dir: str = dirname(realpath(__file__))
+        pro_index: ProIndex = ProStructure().load(
+            f'{current_dir}/{self._PRO_STRUCTURE}'
+        )
+        self.assertEqual(
+            sorted({ProStructure.base_type(key) for key in pro_index}),
+            ['posix', 'shm', 'sysv']
+        )
+        self.assertEqual(
+            pro_index['posix'][0], ('mq_posix.h', 'mq_posix.template')
+        )
+        self.assertEqual(pro_index['sysv'][-1][0], 'mq_sysv_pool_receive.c')
+
+    def test_structure_mismatch(self) -> None:
+        '''Test structure mismatch'''
+        with self.assertRaises(ATSValueError):
+            ProStructure.index({
+                'templates': [{'posix': ['mq_posix.template']}],
+                'modules': [{'posix': ['mq_posix.h', 'mq_posix_open.c']}]
+            })
+
+    def test_structure_cache(self) -> None:
+        '''Test structure cache file'''
+        current_dir: str = dirname(realpath(__file__))
+        with TemporaryDirectory() as work_dir:
+            pro_structure: str = join(work_dir, 'project.yaml')
+            copy(f'{current_dir}/{self._PRO_STRUCTURE}', pro_structure)
+            first: ProIndex = ProStructure().load(pro_structure)
+            self.assertTrue(exists(join(work_dir, 'project.cache.json')))
+            ProStructure._LOADED.clear()
+            self.assertEqual(ProStructure().load(pro_structure), first)
+
+    def test_structure_stale(self) -> None:
+        '''Test structure stale cache'''
+        current_dir: str = dirname(realpath(__file__))
+        with TemporaryDirectory() as work_dir:
+            pro_structure: str = join(work_dir, 'project.yaml')
+            copy(f'{current_dir}/{self._PRO_STRUCTURE}', pro_structure)
+            ProStructure().load(pro_structure)
+            with open(pro_structure, 'w', encoding='utf-8') as yaml_file:
+                yaml_file.write(
+                    'templates:\n  - mpsc:\n    - mq_mpsc.template\n'
+                    'modules:\n  - mpsc:\n    - mq_mpsc.h\n'
+                )
+            mtime: int = stat(pro_structure).st_mtime_ns + 1000000000
+            utime(pro_structure, ns=(mtime, mtime))
+            pro_index: ProIndex = ProStructure().load(pro_structure)
+            self.assertEqual(
+                pro_index, {'mpsc': [('mq_mpsc.h', 'mq_mpsc.template')]}
+            )
+
+    def test_structure_options(self) -> None:
+        '''Test structure optional components'''
+        pro_index: ProIndex = {
+            'posix': [('mq_posix.h', 'mq_posix.template')],
+            'posix+loop': [('mq_loop.h', 'mq_loop.template')]
+        }
+        self.assertEqual(ProStructure.base_type('posix+loop'), 'posix')
+        self.assertIsNone(ProStructure.pairs(pro_index, 'sysv+loop'))
+        self.assertEqual(
+            ProStructure.pairs(pro_index, 'posix+loop+loop'), [
+                ('mq_posix.h', 'mq_posix.template'),
+                ('mq_loop.h', 'mq_loop.template')
+            ]
+        )
+        with self.assertRaises(ATSValueError):
+            ProStructure.pairs(pro_index, 'posix+missing')
+
+
+if __name__ == '__main__':
+    main()
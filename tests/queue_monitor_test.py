@@ -0,0 +1,141 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    queue_monitor_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class QueueMonitorTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of QueueMonitor.
+Execute
+    python3 -m unittest -v queue_monitor_test
+'''
+
+import sys
+from typing import Any, List, Dict
+from io import StringIO
+from json import loads
+from os import mkdir
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+try:
+    from gen_message_queue.queue_monitor import QueueMonitor, Sample
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+
+
+class QueueMonitorTestCase(TestCase):
+    '''
+        Defines class QueueMonitorTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of QueueMonitor.
+        QueueMonitor unit tests.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | write_sources - Writes queue sources (mqueue, sysvipc).
+                | test_monitor_sample - Test sampling POSIX and System V.
+                | test_monitor_rates - Test depth and rates between samples.
+                | test_monitor_run - Test table and JSON lines output.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    @staticmethod
+    def write_sources(root: str, qnum: int) -> QueueMonitor:
+        '''Writes queue sources (one POSIX, two System V queues)'''
+        mqueue_dir: str = join(root, 'mqueue')
+        mkdir(mqueue_dir)
+        with open(join(mqueue_dir, 'orders'), 'w', encoding='utf-8') as mq:
+            mq.write('QSIZE:96    NOTIFY:0     SIGNO:0     NOTIFY_PID:0\n')
+        with open(join(root, 'msg'), 'w', encoding='utf-8') as proc:
+            proc.write('       key      msqid perms      cbytes       qnum\n')
+            proc.write(f'  305419896          3   600        512 {qnum:10}\n')
+            proc.write('          0          7   600          0          0\n')
+        return QueueMonitor(mqueue_dir, join(root, 'msg'))
+
+    def test_monitor_sample(self) -> None:
+        '''Test sampling POSIX and System V queues'''
+        with TemporaryDirectory() as root:
+            sample: Sample = self.write_sources(root, 4).sample()
+        self.assertEqual(sorted(sample), [
+            'posix:/orders', 'sysv:0x00000000/7', 'sysv:0x12345678'
+        ])
+        self.assertEqual(sample['posix:/orders']['bytes'], 96)
+        self.assertEqual(sample['sysv:0x12345678']['depth'], 4)
+        self.assertEqual(sample['sysv:0x12345678']['bytes'], 512)
+        empty: Sample = QueueMonitor('/nonexistent', '/nonexistent').sample()
+        self.assertEqual(empty, {})
+
+    def test_monitor_rates(self) -> None:
+        '''Test depth and rates between samples'''
+        previous: Sample = {'sysv:0x1': {
+            'backend': 'sysv', 'queue': '0x1', 'depth': 10, 'bytes': 80,
+            'metrics': {'send_messages': 100, 'receive_messages': 100}
+        }}
+        current: Sample = {'sysv:0x1': {
+            'backend': 'sysv', 'queue': '0x1', 'depth': 4, 'bytes': 32,
+            'metrics': {'send_messages': 120, 'receive_messages': 132}
+        }}
+        rows: List[Dict[str, Any]] = QueueMonitor.rates(
+            previous, current, 2.0
+        )
+        self.assertEqual(rows[0]['net_rate'], -3.0)
+        self.assertEqual(rows[0]['send_rate'], 10.0)
+        self.assertEqual(rows[0]['receive_rate'], 16.0)
+        rows = QueueMonitor.rates({}, current, 2.0)
+        self.assertIsNone(rows[0]['net_rate'])
+        self.assertIsNone(rows[0]['send_rate'])
+
+    def test_monitor_run(self) -> None:
+        '''Test table and JSON lines output'''
+        with TemporaryDirectory() as root:
+            monitor: QueueMonitor = self.write_sources(root, 2)
+            table: StringIO = StringIO()
+            self.assertEqual(monitor.run(0.01, 1, 'table', table), 1)
+            lines: StringIO = StringIO()
+            self.assertEqual(monitor.run(0.01, 2, 'json', lines), 2)
+        header: str = table.getvalue().splitlines()[0]
+        self.assertEqual(header.split(), [
+            column.upper() for column in QueueMonitor.COLUMNS
+        ])
+        rows: List[Dict[str, Any]] = [
+            loads(line) for line in lines.getvalue().splitlines()
+        ]
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[1]['queue'], '0x12345678')
+        self.assertEqual(rows[1]['net_rate'], 0.0)
+        self.assertIn('time', rows[1])
+
+
+if __name__ == '__main__':
+    main()
@@ -23,8 +23,9 @@ Execute
 '''
 
 import sys
-from typing import List, Dict
+from typing import Any, List, Dict, Tuple
 from os.path import dirname, realpath
+from string import Template
 from unittest import TestCase, main
 
 try:
@@ -63,6 +64,9 @@ class ReadTemplateTestCase(TestCase):
                 | test_read_template_empty - Test read templates empty.
                 | test_read_template_none - Test read templates None.
                 | test_read_template - Test read templates.
+                | test_read_template_cached - Test read cached templates.
+                | test_read_template_iter - Test read templates one by one.
+                | test_read_template_posix_batch - Test posix batch modules.
     '''
 
     def setUp(self) -> None:
@@ -108,6 +112,56 @@ class ReadTemplateTestCase(TestCase):
             )
         ))
 
+    def test_read_template_cached(self) -> None:
+        '''Test read cached templates'''
+        template_read = ReadTemplate()
+        current_dir: str = dirname(realpath(__file__))
+        pro: str = '../gen_message_queue/conf/project.yaml'
+        yml2obj: Yaml2Object = Yaml2Object(f'{current_dir}/{pro}')
+        config: Dict[Any, Any] = yml2obj.read_configuration()
+        template_read.read_compiled(config, 'simple_read', 'sysv')
+        misses: int = template_read.cache_misses
+        hits: int = template_read.cache_hits
+        compiled: Dict[str, Template] = template_read.read_compiled(
+            config, 'simple_read', 'sysv'
+        )
+        self.assertEqual(template_read.cache_misses, misses)
+        self.assertEqual(template_read.cache_hits, hits + len(compiled))
+
+    def test_read_template_iter(self) -> None:
+        '''Test read templates one by one'''
+        template_read = ReadTemplate()
+        current_dir: str = dirname(realpath(__file__))
+        pro: str = '../gen_message_queue/conf/project.yaml'
+        yml2obj: Yaml2Object = Yaml2Object(f'{current_dir}/{pro}')
+        config: Dict[Any, Any] = yml2obj.read_configuration()
+        with self.assertRaises(ATSValueError):
+            template_read.iter_read(config, '', 'posix')
+        self.assertEqual(
+            list(template_read.iter_read(config, 'simple_read', 'mpsc')), []
+        )
+        first: Tuple[str, Template] = next(
+            template_read.iter_read(config, 'simple_read', 'posix')
+        )
+        self.assertEqual(first[0], 'mq_posix.h')
+
+    def test_read_template_posix_batch(self) -> None:
+        '''Test posix batch modules'''
+        template_read = ReadTemplate()
+        current_dir: str = dirname(realpath(__file__))
+        pro: str = '../gen_message_queue/conf/project.yaml'
+        yml2obj: Yaml2Object = Yaml2Object(f'{current_dir}/{pro}')
+        config: Dict[Any, Any] = yml2obj.read_configuration()
+        modules: Dict[str, str] = template_read.read(
+            config, 'simple_read', 'posix'
+        )
+        for function in (
+            'mq_posix_send_batch', 'mq_posix_receive_batch',
+            'mq_posix_timedsend', 'mq_posix_timedreceive'
+        ):
+            self.assertIn(f'{function}.c', modules)
+            self.assertIn(f'ssize_t {function}(', modules['mq_posix.h'])
+
 
 if __name__ == '__main__':
     main()
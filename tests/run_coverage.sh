@@ -8,7 +8,7 @@
 #
 
 rm -rf htmlcov gen_message_queue_coverage.xml gen_message_queue_coverage.json .coverage
-rm -rf fresh_new/ full_simple_new/ latest_pro/ simple_read/ simple_write/
+rm -rf fresh_new/ full_simple_new/ latest_pro/ simple_read/ simple_write/ batch_out/ sub_batch/ parallel_write/ quiet_pro/ stream_write/ timing_pro/
 python3 -m coverage run -m --source=../gen_message_queue unittest discover -s ./ -p '*_test.py' -vvv
 python3 -m coverage html -d htmlcov
 python3 -m coverage xml -o gen_message_queue_coverage.xml 
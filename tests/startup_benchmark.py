@@ -0,0 +1,161 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    startup_benchmark.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Measures cold start of gen_message_queue: import time of package and
+    time-to-first-file of fast-start (quiet) CLI run in fresh interpreter.
+Execute
+    python3 startup_benchmark.py -r 10 -o startup_benchmark.json
+'''
+
+import sys
+from typing import Any, Dict, List
+from os import environ, listdir, stat
+from os.path import dirname, realpath, join
+from statistics import median
+from subprocess import run, DEVNULL
+from tempfile import TemporaryDirectory
+from time import time_ns, perf_counter
+from json import dump
+from argparse import Namespace
+
+try:
+    from ats_utilities.option import ATSOptionParser
+    from ats_utilities.console_io.success import success_message
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+ROOT_DIR: str = realpath(join(dirname(realpath(__file__)), '..'))
+RUN_TOOL: str = join(
+    ROOT_DIR, 'gen_message_queue', 'run', 'gen_message_queue_run.py'
+)
+IMPORT_SNIPPET: str = ';'.join([
+    'from time import perf_counter', 'start = perf_counter()',
+    'import gen_message_queue', 'print(perf_counter() - start)'
+])
+
+
+def summary(samples: List[float]) -> Dict[str, float]:
+    '''
+        Summarizes samples in seconds.
+
+        :param samples: Measured samples
+        :type samples: <List[float]>
+        :return: Minimum, median and maximum
+        :rtype: <Dict[str, float]>
+        :exceptions: None
+    '''
+    return {
+        'min': min(samples), 'median': median(samples), 'max': max(samples)
+    }
+
+
+def bench_import(runs: int) -> Dict[str, float]:
+    '''
+        Measures import of package in fresh interpreter.
+
+        :param runs: Number of runs
+        :type runs: <int>
+        :return: Import time summary
+        :rtype: <Dict[str, float]>
+        :exceptions: None
+    '''
+    samples: List[float] = []
+    for _ in range(runs):
+        result = run(
+            [sys.executable, '-c', IMPORT_SNIPPET], capture_output=True,
+            text=True, check=True, cwd=ROOT_DIR
+        )
+        samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return summary(samples)
+
+
+def bench_first_file(runs: int, pro_type: str) -> Dict[str, Any]:
+    '''
+        Measures time-to-first-file and total time of quiet CLI run.
+
+        :param runs: Number of runs
+        :type runs: <int>
+        :param pro_type: Project type
+        :type pro_type: <str>
+        :return: Time-to-first-file and total time summary
+        :rtype: <Dict[str, Any]>
+        :exceptions: None
+    '''
+    first_file: List[float] = []
+    total: List[float] = []
+    env: Dict[str, str] = dict(environ)
+    env['PYTHONPATH'] = ROOT_DIR
+    env['GEN_MESSAGE_QUEUE_QUIET'] = '1'
+    for index in range(runs):
+        with TemporaryDirectory() as work_dir:
+            pro_name: str = f'startup_{index}'
+            launched: int = time_ns()
+            start: float = perf_counter()
+            run(
+                [sys.executable, RUN_TOOL, '-n', pro_name, '-t', pro_type],
+                cwd=work_dir, env=env, stdout=DEVNULL, check=True
+            )
+            total.append(perf_counter() - start)
+            pro_dir: str = join(work_dir, pro_name)
+            first: int = min(
+                stat(join(pro_dir, name)).st_mtime_ns
+                for name in listdir(pro_dir)
+            )
+            first_file.append((first - launched) / 1e9)
+    return {'first_file': summary(first_file), 'total': summary(total)}
+
+
+if __name__ == '__main__':
+    cli: ATSOptionParser = ATSOptionParser(
+        'startup_benchmark 2026', '1.0.0', 'GPLv3', False
+    )
+    cli.add_operation(
+        '-r', '--runs', dest='runs', type=int, default=10,
+        help='number of runs (default 10)'
+    )
+    cli.add_operation(
+        '-t', '--type', dest='type', default='posix',
+        help='project type (default posix)'
+    )
+    cli.add_operation(
+        '-o', '--output', dest='output', default='startup_benchmark.json',
+        help='results file (default startup_benchmark.json)'
+    )
+    args: Namespace = cli.parse_args(sys.argv)
+    results: Dict[str, Any] = {
+        'python': sys.version.split()[0],
+        'runs': getattr(args, 'runs'),
+        'type': getattr(args, 'type'),
+        'import': bench_import(getattr(args, 'runs')),
+        'quiet_cli': bench_first_file(
+            getattr(args, 'runs'), getattr(args, 'type')
+        )
+    }
+    with open(getattr(args, 'output'), 'w', encoding='utf-8') as report:
+        dump(results, report, indent=4)
+    success_message([f'startup_benchmark: results {getattr(args, "output")}'])
@@ -0,0 +1,145 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    template_cache_test.py
+Copyright
+    Copyright (C) 2018 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    gen_message_queue is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    gen_message_queue is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class TemplateCacheTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of TemplateCache.
+Execute
+    python3 -m unittest -v template_cache_test
+'''
+
+import sys
+from typing import List, Dict
+from os.path import dirname, realpath, join
+from string import Template
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+try:
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from gen_message_queue.pro.template_cache import (
+        CompiledTemplate, TemplateCache
+    )
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/gen_message_queue'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/gen_message_queue/blob/dev/LICENSE'
+__version__: str = '1.1.6'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class TemplateCacheTestCase(TestCase):
+    '''
+        Defines class TemplateCacheTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of TemplateCache.
+        TemplateCache unit tests.
+
+        It defines:
+
+            :attributes:
+                | _TEMPLATE_DIR - Path to posix templates.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_compiled_substitute - Test compiled substitute.
+                | test_compiled_missing_key - Test compiled missing key.
+                | test_cache_size_none - Test cache size None.
+                | test_cache_size_zero - Test cache size zero.
+                | test_cache_hit - Test cache hit.
+                | test_cache_eviction - Test cache eviction.
+                | test_cache_generation - Test file checked once per run.
+    '''
+
+    _TEMPLATE_DIR: str = '../gen_message_queue/conf/template/posix'
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_compiled_substitute(self) -> None:
+        '''Test compiled substitute'''
+        content: str = '$$ ${PRO} $YEAR end ${PRO}'
+        values: Dict[str, str] = {'PRO': 'queue', 'YEAR': '2026'}
+        self.assertEqual(
+            CompiledTemplate(content).substitute(values),
+            Template(content).substitute(values)
+        )
+
+    def test_compiled_missing_key(self) -> None:
+        '''Test compiled missing key'''
+        with self.assertRaises(KeyError):
+            CompiledTemplate('${PRO} ${YEAR}').substitute({'PRO': 'queue'})
+
+    def test_cache_size_none(self) -> None:
+        '''Test cache size None'''
+        with self.assertRaises(ATSTypeError):
+            TemplateCache(None)  # type: ignore
+
+    def test_cache_size_zero(self) -> None:
+        '''Test cache size zero'''
+        with self.assertRaises(ATSValueError):
+            TemplateCache(0)
+
+    def test_cache_hit(self) -> None:
+        '''Test cache hit'''
+        cache: TemplateCache = TemplateCache()
+        current_dir: str = dirname(realpath(__file__))
+        path: str = f'{current_dir}/{self._TEMPLATE_DIR}/mq_posix.template'
+        first, first_hit = cache.get(path)
+        second, second_hit = cache.get(path)
+        self.assertFalse(first_hit)
+        self.assertTrue(second_hit)
+        self.assertIs(first, second)
+
+    def test_cache_eviction(self) -> None:
+        '''Test cache eviction'''
+        cache: TemplateCache = TemplateCache(1)
+        current_dir: str = dirname(realpath(__file__))
+        template_dir: str = f'{current_dir}/{self._TEMPLATE_DIR}'
+        cache.get(f'{template_dir}/mq_posix.template')
+        cache.get(f'{template_dir}/mq_posix_send.template')
+        self.assertEqual(len(cache), 1)
+        self.assertFalse(cache.get(f'{template_dir}/mq_posix.template')[1])
+
+    def test_cache_generation(self) -> None:
+        '''Test file checked once per run'''
+        cache: TemplateCache = TemplateCache()
+        with TemporaryDirectory() as work_dir:
+            path: str = join(work_dir, 'mq.template')
+            with open(path, 'w', encoding='utf-8') as template_file:
+                template_file.write('// ${PRO} v1\n')
+            first, _ = cache.get(path)
+            with open(path, 'w', encoding='utf-8') as template_file:
+                template_file.write('// ${PRO} version 2\n')
+            self.assertEqual(cache.get(path), (first, True))
+            cache.new_generation()
+            second, second_hit = cache.get(path)
+        self.assertFalse(second_hit)
+        self.assertEqual(second.template, '// ${PRO} version 2\n')
+
+
+if __name__ == '__main__':
+    main()
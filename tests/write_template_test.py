@@ -23,8 +23,10 @@ Execute
 '''
 
 import sys
-from typing import List, Dict
+from typing import List, Dict, Tuple, Iterator
+from os import listdir, makedirs, rmdir
 from os.path import dirname, realpath
+from string import Template
 from unittest import TestCase, main
 
 try:
@@ -66,6 +68,11 @@ class WriteTemplateTestCase(TestCase):
                 | test_write_name_empty - Test write name empty.
                 | test_write_name_none - Test write name None.
                 | test_write_template - Test write templates.
+                | test_write_workers_zero - Test write with zero workers.
+                | test_write_template_parallel - Test parallel write.
+                | test_write_template_exists - Test write existing project.
+                | test_write_stream - Test streaming write.
+                | test_write_stream_pending - Test negative pending modules.
     '''
 
     def setUp(self) -> None:
@@ -135,6 +142,69 @@ class WriteTemplateTestCase(TestCase):
         template_write = WriteTemplate()
         self.assertTrue(template_write.write(content, 'simple_write'))
 
+    def test_write_workers_zero(self) -> None:
+        '''Test write with zero workers'''
+        template_write = WriteTemplate()
+        with self.assertRaises(ATSValueError):
+            template_write.write({'mq.h': ''}, 'zero_write', workers=0)
+
+    def test_write_template_parallel(self) -> None:
+        '''Test parallel write'''
+        template_read = ReadTemplate()
+        current_dir: str = dirname(realpath(__file__))
+        pro: str = '../gen_message_queue/conf/project.yaml'
+        yml2obj: Yaml2Object = Yaml2Object(f'{current_dir}/{pro}')
+        content: Dict[str, Template] = template_read.read_compiled(
+            yml2obj.read_configuration(), 'parallel_write', 'sysv'
+        )
+        template_write = WriteTemplate()
+        self.assertTrue(
+            template_write.write(content, 'parallel_write', workers=4)
+        )
+        self.assertEqual(
+            sorted(listdir('parallel_write')), sorted(content.keys())
+        )
+
+    def test_write_template_exists(self) -> None:
+        '''Test write existing project'''
+        template_write = WriteTemplate()
+        makedirs('exists_write', exist_ok=True)
+        with self.assertRaises(FileExistsError):
+            template_write.write({'mq.h': ''}, 'exists_write')
+        self.assertFalse(
+            [name for name in listdir('.') if name.startswith('.staging')]
+        )
+        rmdir('exists_write')
+
+    def test_write_stream(self) -> None:
+        '''Test streaming write'''
+        template_read = ReadTemplate()
+        current_dir: str = dirname(realpath(__file__))
+        pro: str = '../gen_message_queue/conf/project.yaml'
+        yml2obj: Yaml2Object = Yaml2Object(f'{current_dir}/{pro}')
+        produced: List[str] = []
+
+        def modules() -> Iterator[Tuple[str, Template]]:
+            for module, template in template_read.iter_read(
+                yml2obj.read_configuration(), 'stream_write', 'sysv'
+            ):
+                produced.append(module)
+                yield module, template
+
+        template_write = WriteTemplate()
+        self.assertTrue(template_write.write_stream(
+            modules(), 'stream_write', workers=2, pending=1
+        ))
+        self.assertEqual(sorted(listdir('stream_write')), sorted(produced))
+
+    def test_write_stream_pending(self) -> None:
+        '''Test negative pending modules'''
+        template_write = WriteTemplate()
+        with self.assertRaises(ATSValueError):
+            template_write.write_stream(
+                iter([('mq.h', '')]), 'pending_write', pending=-1
+            )
+
 
 if __name__ == '__main__':
     main()